@@ -182,3 +182,46 @@ def test_version():
     """Test that version is available."""
     assert hasattr(meta_oxide, "__version__")
     assert isinstance(meta_oxide.__version__, str)
+
+
+@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
+def test_warm_up():
+    """Test that warm_up() can be called repeatedly and leaves extraction unchanged."""
+    html = """
+    <html>
+    <head><title>Warm</title></head>
+    <body><div class="h-card"><span class="p-name">Alice</span></div></body>
+    </html>
+    """
+    before = meta_oxide.extract_all(html)
+
+    meta_oxide.warm_up()
+    meta_oxide.warm_up()
+
+    assert meta_oxide.extract_all(html) == before
+    assert before["meta"]["title"] == "Warm"
+
+
+@pytest.mark.skipif(not PACKAGE_AVAILABLE, reason="Package not built yet")
+def test_extract_all_cache():
+    """Test that enable_cache() returns fresh copies keyed by HTML and base URL."""
+    html = """
+    <html>
+    <head><title>Cached</title></head>
+    <body><div class="h-card"><a class="p-name u-url" href="/alice">Alice</a></div></body>
+    </html>
+    """
+    expected = meta_oxide.extract_all(html, "https://example.com")
+    expected_without_base = meta_oxide.extract_all(html)
+
+    meta_oxide.enable_cache(2)
+    try:
+        first = meta_oxide.extract_all(html, "https://example.com")
+        first["microformats"]["h-card"][0]["name"] = "Changed"
+        second = meta_oxide.extract_all(html, "https://example.com")
+        assert second == expected
+        assert meta_oxide.extract_all(html) == expected_without_base
+        assert meta_oxide.extract_all("<title>Other</title>")["meta"]["title"] == "Other"
+    finally:
+        meta_oxide.enable_cache(0)
+    assert meta_oxide.extract_all(html, "https://example.com") == expected
@@ -0,0 +1,151 @@
+"""Tests for batch extraction APIs"""
+
+import pytest
+
+import meta_oxide
+
+
+def _page(i: int) -> str:
+    return f"""
+        <html>
+        <head>
+            <title>Page {i}</title>
+            <meta name="description" content="Description {i}">
+            <meta property="og:title" content="OG {i}">
+            <meta name="DC.title" content="DC {i}">
+            <link rel="canonical" href="/page/{i}">
+        </head>
+        <body>
+            <div class="h-card"><span class="p-name">Person {i}</span></div>
+            <div class="h-adr"><span class="p-locality">City {i}</span></div>
+            <div class="h-product"><span class="p-name">Product {i}</span></div>
+        </body>
+        </html>
+    """
+
+
+PAGES = [_page(i) for i in range(50)]
+
+
+def test_extract_meta_batch_matches_single():
+    """Test batch meta extraction returns the same dicts as single calls"""
+    results = meta_oxide.extract_meta_batch(PAGES, "https://example.com")
+    assert len(results) == len(PAGES)
+    for html, result in zip(PAGES, results):
+        assert result == meta_oxide.extract_meta(html, "https://example.com")
+
+
+def test_extract_meta_batch_preserves_order():
+    """Test batch results are returned in input order"""
+    results = meta_oxide.extract_meta_batch(PAGES)
+    assert [r["title"] for r in results] == [f"Page {i}" for i in range(50)]
+
+
+def test_extract_meta_batch_resolves_urls():
+    """Test batch meta extraction resolves relative URLs"""
+    results = meta_oxide.extract_meta_batch(PAGES[:1], base_url="https://example.com")
+    assert results[0]["canonical"] == "https://example.com/page/0"
+
+
+def test_extract_opengraph_batch():
+    """Test batch Open Graph extraction"""
+    results = meta_oxide.extract_opengraph_batch(PAGES)
+    assert [r["title"] for r in results] == [f"OG {i}" for i in range(50)]
+
+
+def test_extract_dublin_core_batch():
+    """Test batch Dublin Core extraction"""
+    results = meta_oxide.extract_dublin_core_batch(PAGES)
+    assert [r["title"] for r in results] == [f"DC {i}" for i in range(50)]
+
+
+def test_extract_jsonld_batch_matches_single():
+    """Test batch JSON-LD extraction returns one object list per document"""
+    htmls = [
+        f"""<script type="application/ld+json">
+            {{"@context": "https://schema.org", "@type": "Product", "name": "Product {i}"}}
+        </script>"""
+        for i in range(20)
+    ] + ["<html></html>"]
+    results = meta_oxide.extract_jsonld_batch(htmls)
+    assert results == [meta_oxide.extract_jsonld(html) for html in htmls]
+    assert [r[0]["name"] for r in results[:-1]] == [f"Product {i}" for i in range(20)]
+    assert results[-1] == []
+
+
+def test_extract_hcard_batch():
+    """Test batch h-card extraction returns one list per document"""
+    results = meta_oxide.extract_hcard_batch(PAGES)
+    assert len(results) == len(PAGES)
+    for i, cards in enumerate(results):
+        assert len(cards) == 1
+        assert cards[0]["name"] == f"Person {i}"
+
+
+def test_extract_hadr_batch():
+    """Test batch h-adr extraction"""
+    results = meta_oxide.extract_hadr_batch(PAGES)
+    assert [adrs[0]["locality"] for adrs in results] == [f"City {i}" for i in range(50)]
+
+
+def test_extract_hproduct_batch():
+    """Test batch h-product extraction"""
+    results = meta_oxide.extract_hproduct_batch(PAGES)
+    assert [products[0]["name"] for products in results] == [f"Product {i}" for i in range(50)]
+
+
+def test_extract_all_batch_matches_single():
+    """Test batch extract_all returns the same dicts as single calls"""
+    results = meta_oxide.extract_all_batch(PAGES, "https://example.com")
+    assert len(results) == len(PAGES)
+    for html, result in zip(PAGES, results):
+        assert result == meta_oxide.extract_all(html, "https://example.com")
+    assert [r["microformats"]["h-card"][0]["name"] for r in results] == [
+        f"Person {i}" for i in range(50)
+    ]
+
+
+def test_extract_all_batch_per_document_base_urls():
+    """Test each document is resolved against its own base URL"""
+    base_urls = [f"https://site{i}.example" for i in range(3)] + [None]
+    results = meta_oxide.extract_all_batch(PAGES[:4], base_urls=base_urls)
+    for html, base_url, result in zip(PAGES[:4], base_urls, results):
+        assert result == meta_oxide.extract_all(html, base_url)
+    assert results[1]["meta"]["canonical"] == "https://site1.example/page/1"
+
+
+def test_extract_all_batch_rejects_mismatched_base_urls():
+    """Test base_urls must have one entry per document"""
+    with pytest.raises(ValueError, match="base_urls has"):
+        meta_oxide.extract_all_batch(PAGES[:3], base_urls=["https://example.com"])
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        meta_oxide.extract_all_batch(
+            PAGES[:1], "https://example.com", base_urls=["https://example.com"]
+        )
+
+
+def test_batch_matches_single_for_microformats():
+    """Test batch microformat results match single-document calls"""
+    results = meta_oxide.extract_hcard_batch(PAGES[:5])
+    assert results == [meta_oxide.extract_hcard(html) for html in PAGES[:5]]
+
+
+def test_batch_empty_list():
+    """Test batch APIs accept an empty list"""
+    assert meta_oxide.extract_meta_batch([]) == []
+    assert meta_oxide.extract_dublin_core_batch([]) == []
+    assert meta_oxide.extract_jsonld_batch([]) == []
+    assert meta_oxide.extract_hcard_batch([]) == []
+    assert meta_oxide.extract_all_batch([]) == []
+
+
+def test_batch_documents_without_data():
+    """Test documents without any metadata produce empty results"""
+    results = meta_oxide.extract_hcard_batch(["", "<html></html>"])
+    assert results == [[], []]
+
+
+def test_batch_rejects_string():
+    """Test passing a single string instead of a list is rejected"""
+    with pytest.raises(TypeError):
+        meta_oxide.extract_meta_batch("<html></html>")
@@ -0,0 +1,116 @@
+"""Tests for the parse-once Document API"""
+
+import pytest
+
+import meta_oxide
+
+HTML = """
+<html>
+<head>
+    <title>Recipe Page</title>
+    <meta name="description" content="A tasty recipe">
+    <meta property="og:title" content="OG Recipe">
+    <meta name="twitter:card" content="summary">
+    <meta name="DC.title" content="DC Recipe">
+    <link rel="canonical" href="/recipes/pancakes">
+    <link rel="manifest" href="/manifest.json">
+    <script type="application/ld+json">
+        {"@context": "https://schema.org", "@type": "Recipe", "name": "Pancakes"}
+    </script>
+</head>
+<body>
+    <div class="h-recipe">
+        <h1 class="p-name">Pancakes</h1>
+        <span class="p-ingredient">Flour</span>
+        <span class="p-ingredient">Milk</span>
+    </div>
+    <div class="h-review">
+        <span class="p-name">Great pancakes</span>
+        <span class="p-rating">5</span>
+    </div>
+    <div class="h-card">
+        <a class="p-name u-url" href="/chef">Chef</a>
+    </div>
+    <a rel="author" href="/chef">Chef</a>
+</body>
+</html>
+"""
+
+BASE_URL = "https://example.com"
+
+
+@pytest.fixture
+def doc():
+    """Document for the sample page"""
+    return meta_oxide.Document(HTML, BASE_URL)
+
+
+def test_base_url(doc: meta_oxide.Document):
+    """Test the base URL is exposed as given"""
+    assert doc.base_url == BASE_URL
+    assert meta_oxide.Document(HTML).base_url is None
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "extract_meta",
+        "extract_opengraph",
+        "extract_twitter",
+        "extract_twitter_with_fallback",
+        "extract_jsonld",
+        "extract_microdata",
+        "extract_rel_links",
+        "extract_oembed",
+        "extract_rdfa",
+        "extract_manifest",
+        "extract_hcard",
+        "extract_hentry",
+        "extract_hevent",
+        "extract_hreview",
+        "extract_hrecipe",
+        "extract_hproduct",
+        "extract_hfeed",
+        "extract_hadr",
+        "extract_hgeo",
+    ],
+)
+def test_methods_match_functions(doc: meta_oxide.Document, name: str):
+    """Test each Document method returns the same data as the module function"""
+    assert getattr(doc, name)() == getattr(meta_oxide, name)(HTML, BASE_URL)
+
+
+def test_dublin_core_matches_function(doc: meta_oxide.Document):
+    """Test Dublin Core extraction matches the module function"""
+    assert doc.extract_dublin_core() == meta_oxide.extract_dublin_core(HTML)
+
+
+def test_extract_all_matches_function(doc: meta_oxide.Document):
+    """Test extract_all on a Document matches the module function"""
+    assert doc.extract_all() == meta_oxide.extract_all(HTML, BASE_URL)
+
+
+def test_repeated_extraction(doc: meta_oxide.Document):
+    """Test the parsed tree can be extracted from more than once"""
+    recipes = doc.extract_hrecipe()
+    assert recipes[0]["name"] == "Pancakes"
+    assert recipes[0]["ingredient"] == ["Flour", "Milk"]
+    assert doc.extract_hrecipe() == recipes
+    assert doc.extract_meta()["canonical"] == "https://example.com/recipes/pancakes"
+
+
+def test_empty_document():
+    """Test an empty Document yields empty results"""
+    doc = meta_oxide.Document("")
+    assert doc.extract_hrecipe() == []
+    assert doc.extract_jsonld() == []
+    assert doc.extract_all() == meta_oxide.extract_all("")
+
+
+def test_extract_all_repeated_calls_are_independent(doc: meta_oxide.Document):
+    """Test mutating one extract_all result does not affect the next call"""
+    first = doc.extract_all()
+    first["microformats"]["h-recipe"][0]["name"] = "Changed"
+    second = doc.extract_all()
+    assert second["microformats"]["h-recipe"][0]["name"] == "Pancakes"
+    assert second == meta_oxide.extract_all(HTML, BASE_URL)
@@ -1,5 +1,7 @@
 """Tests for error handling and edge cases in Python bindings"""
 
+import pytest
+
 import meta_oxide
 
 
@@ -42,6 +44,50 @@ def test_extract_all_malformed_html():
     assert isinstance(data, dict)
 
 
+def test_extract_all_bytes_matches_str():
+    """Test extract_all_bytes gives the same result as extract_all on the decoded text"""
+    html = """
+        <title>Caf\u00e9</title>
+        <div class="h-card"><a class="p-name u-url" href="/me">Me</a></div>
+    """
+    data = meta_oxide.extract_all_bytes(html.encode("utf-8"), "https://example.com")
+    assert data == meta_oxide.extract_all(html, "https://example.com")
+    assert data["meta"]["title"] == "Caf\u00e9"
+
+
+def test_extract_all_bytes_invalid_utf8():
+    """Test invalid UTF-8 bytes are replaced instead of raising"""
+    data = meta_oxide.extract_all_bytes(b"<title>Bad \xff byte</title>")
+    assert data["meta"]["title"] == "Bad \ufffd byte"
+
+
+def test_extract_all_bytes_accepts_buffers():
+    """Test bytearray and memoryview input match bytes input"""
+    html = b'<title>Buffer</title><link rel="canonical" href="/page">'
+    expected = meta_oxide.extract_all_bytes(html, "https://example.com")
+    assert meta_oxide.extract_all_bytes(bytearray(html), "https://example.com") == expected
+    assert meta_oxide.extract_all_bytes(memoryview(html), "https://example.com") == expected
+
+
+def test_extract_all_bytes_rejects_str():
+    """Test str input is rejected rather than silently encoded"""
+    with pytest.raises(TypeError):
+        meta_oxide.extract_all_bytes("<title>Text</title>")
+
+
+def test_extract_jsonld_bytes_matches_str():
+    """Test extract_jsonld_bytes gives the same result as extract_jsonld"""
+    html = """
+        <script type="application/ld+json">
+        {"@context": "https://schema.org", "@type": "Article", "headline": "Caf\u00e9"}
+        </script>
+    """
+    objects = meta_oxide.extract_jsonld_bytes(html.encode("utf-8"))
+    assert objects == meta_oxide.extract_jsonld(html)
+    assert objects[0]["headline"] == "Caf\u00e9"
+    assert meta_oxide.extract_jsonld_bytes(memoryview(html.encode("utf-8"))) == objects
+
+
 def test_extract_meta_with_invalid_utf8():
     """Test that invalid UTF-8 doesn't crash (Python handles this)"""
     # Python strings are always valid UTF-8, but test edge case
@@ -118,3 +164,8 @@ def test_large_html_document():
     # Should handle large documents without crashing
     meta = meta_oxide.extract_meta(html)
     assert isinstance(meta, dict)
+
+    # The batch API should handle several large documents in one call
+    results = meta_oxide.extract_meta_batch([html] * 4)
+    assert len(results) == 4
+    assert all(result == meta for result in results)
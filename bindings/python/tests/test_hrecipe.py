@@ -213,3 +213,53 @@ def test_hrecipe_complete():
 
     # Check nutrition
     assert "320 calories" in recipe["nutrition"]
+
+
+def test_hrecipe_matches_document_extraction():
+    """Test that the streaming extractor agrees with the DOM-based one"""
+    html = """
+        <div class="h-recipe">
+            <span class="p-name">Soup &amp; Bread</span>
+            <span class="p-ingredient">Water</span>
+            <span class="p-ingredient">Salt <b>(to taste)</b></span>
+            <img class="u-photo" src="/soup.jpg">
+        </div>
+        <div class="h-recipe">
+            <p class="p-summary">Unclosed paragraph
+            <div class="p-name">Handled by the full parser</div>
+        </div>
+    """
+    recipes = meta_oxide.extract_hrecipe(html, "https://example.com")
+    assert recipes == meta_oxide.Document(html, "https://example.com").extract_hrecipe()
+    assert recipes[0]["name"] == "Soup & Bread"
+    assert recipes[0]["ingredient"] == ["Water", "Salt (to taste)"]
+    assert recipes[0]["photo"] == "https://example.com/soup.jpg"
+    assert recipes[1]["name"] == "Handled by the full parser"
+
+
+def test_hrecipe_repeated_values_share_strings():
+    """Test that values repeated across recipes reuse one string object"""
+    html = """
+        <div class="h-recipe">
+            <span class="p-name">Brownies</span>
+            <span class="p-ingredient">Flour</span>
+            <span class="p-category">Dessert</span>
+        </div>
+        <div class="h-recipe">
+            <span class="p-name">Cookies</span>
+            <span class="p-ingredient">Flour</span>
+            <span class="p-category">Dessert</span>
+        </div>
+    """
+    first, second = meta_oxide.extract_hrecipe(html)
+    assert first["category"] == second["category"] == ["Dessert"]
+    assert first["category"][0] is second["category"][0]
+    assert first["ingredient"][0] is second["ingredient"][0]
+
+
+def test_hrecipe_root_class_in_character_references():
+    """Test that a root class spelled with character references is still found"""
+    html = '<div class="h&#45;recipe"><span class="p-name">Encoded</span></div>'
+    recipes = meta_oxide.extract_hrecipe(html)
+    assert recipes[0]["name"] == "Encoded"
+    assert meta_oxide.extract_hrecipe("<p>No recipes here</p>") == []
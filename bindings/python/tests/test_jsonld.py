@@ -598,8 +598,8 @@ class TestJSONLDDataTypes:
         </html>
         """
         objects = meta_oxide.extract_jsonld(html)
-        # Arrays are currently returned as JSON strings - this is by design
-        assert "sameAs" in objects[0]
+        # Arrays are converted element by element into Python lists
+        assert objects[0]["sameAs"] == ["https://twitter.com/org", "https://facebook.com/org"]
 
     def test_null_values(self):
         """Test null properties"""
@@ -5,89 +5,77 @@ Tests the extraction and parsing of AggregateRating structured data following TD
 AggregateRating represents the average rating from multiple reviews/ratings.
 """
 
+import json
+
 import meta_oxide
 import pytest
 
+TEMPLATE = """
+<html>
+<head>
+    <script type="application/ld+json">{json}</script>
+</head>
+<body></body>
+</html>
+"""
 
-class TestAggregateRatingBasic:
-    """Test basic AggregateRating extraction"""
-
-    def test_aggregaterating_basic(self):
-        """Test minimal rating with ratingValue"""
-        html = """
-        <html>
-        <head>
-            <script type="application/ld+json">
-            {
-                "@context": "https://schema.org",
-                "@type": "AggregateRating",
-                "ratingValue": 4.5
-            }
-            </script>
-        </head>
-        <body></body>
-        </html>
-        """
-
-        objects = meta_oxide.extract_jsonld(html)
-
-        assert len(objects) == 1
-        assert objects[0]["@type"] == "AggregateRating"
-        assert objects[0]["ratingValue"] == 4.5
-
-    def test_aggregaterating_with_bounds(self):
-        """Test rating with bestRating and worstRating"""
-        html = """
-        <html>
-        <head>
-            <script type="application/ld+json">
-            {
-                "@context": "https://schema.org",
-                "@type": "AggregateRating",
-                "ratingValue": 4.2,
-                "bestRating": 5,
-                "worstRating": 1
-            }
-            </script>
-        </head>
-        <body></body>
-        </html>
-        """
-
-        objects = meta_oxide.extract_jsonld(html)
+CONTEXT = {"@context": "https://schema.org", "@type": "AggregateRating"}
+
+
+def _html(payload: dict) -> str:
+    """Wrap an AggregateRating payload in a page, serialized once at import"""
+    return TEMPLATE.format(json=json.dumps({**CONTEXT, **payload}))
+
+
+def _assert_fields(actual: dict, expected: dict) -> None:
+    """Assert every key in ``expected`` is present in ``actual`` with that value"""
+    for key, value in expected.items():
+        assert key in actual, key
+        assert actual[key] == value, key
+
+
+# (page, expected top-level values) for flat AggregateRating objects
+CASES = [
+    pytest.param(_html({"ratingValue": 4.5}), {"ratingValue": 4.5}, id="basic"),
+    pytest.param(
+        _html({"ratingValue": 4.2, "bestRating": 5, "worstRating": 1}),
+        {"ratingValue": 4.2, "bestRating": 5.0, "worstRating": 1.0},
+        id="with_bounds",
+    ),
+    pytest.param(
+        _html({"ratingValue": 4.8, "ratingCount": 156, "reviewCount": 89}),
+        {"ratingValue": 4.8, "ratingCount": 156, "reviewCount": 89},
+        id="with_counts",
+    ),
+    pytest.param(_html({}), {}, id="empty"),
+    pytest.param(
+        _html({"ratingValue": 4, "bestRating": 5, "ratingCount": 100}),
+        {"ratingValue": 4.0, "bestRating": 5.0, "ratingCount": 100},
+        id="integer_rating",
+    ),
+    pytest.param(
+        _html({"ratingValue": 4.5, "bestRating": None, "worstRating": None}),
+        {"ratingValue": 4.5},
+        id="null_values",
+    ),
+    pytest.param(
+        _html({"ratingValue": 4.687, "bestRating": 5.0}),
+        {"ratingValue": pytest.approx(4.687, abs=0.001)},
+        id="decimal_precision",
+    ),
+]
 
-        assert len(objects) == 1
-        assert objects[0]["@type"] == "AggregateRating"
-        assert objects[0]["ratingValue"] == 4.2
-        assert objects[0]["bestRating"] == 5.0
-        assert objects[0]["worstRating"] == 1.0
 
-    def test_aggregaterating_with_counts(self):
-        """Test rating with ratingCount and reviewCount"""
-        html = """
-        <html>
-        <head>
-            <script type="application/ld+json">
-            {
-                "@context": "https://schema.org",
-                "@type": "AggregateRating",
-                "ratingValue": 4.8,
-                "ratingCount": 156,
-                "reviewCount": 89
-            }
-            </script>
-        </head>
-        <body></body>
-        </html>
-        """
+class TestAggregateRatingBasic:
+    """Test basic AggregateRating extraction"""
 
+    @pytest.mark.parametrize(("html", "expected"), CASES)
+    def test_aggregaterating_fields(self, html: str, expected: dict):
+        """Test flat ratings keep their type and field values"""
         objects = meta_oxide.extract_jsonld(html)
 
         assert len(objects) == 1
-        assert objects[0]["@type"] == "AggregateRating"
-        assert objects[0]["ratingValue"] == 4.8
-        assert objects[0]["ratingCount"] == 156
-        assert objects[0]["reviewCount"] == 89
+        _assert_fields(objects[0], {"@type": "AggregateRating", **expected})
 
     def test_aggregaterating_with_item(self):
         """Test rating with itemReviewed product"""
@@ -114,11 +102,10 @@ class TestAggregateRatingBasic:
         objects = meta_oxide.extract_jsonld(html)
 
         assert len(objects) == 1
-        assert objects[0]["@type"] == "AggregateRating"
-        assert objects[0]["ratingValue"] == 4.7
-        assert "itemReviewed" in objects[0]
-        assert objects[0]["itemReviewed"]["@type"] == "Product"
-        assert objects[0]["itemReviewed"]["name"] == "Wireless Headphones"
+        _assert_fields(objects[0], {"@type": "AggregateRating", "ratingValue": 4.7})
+        _assert_fields(
+            objects[0]["itemReviewed"], {"@type": "Product", "name": "Wireless Headphones"}
+        )
 
     def test_aggregaterating_complete(self):
         """Test rating with all fields"""
@@ -150,14 +137,18 @@ class TestAggregateRatingBasic:
         objects = meta_oxide.extract_jsonld(html)
 
         assert len(objects) == 1
-        assert objects[0]["@type"] == "AggregateRating"
-        assert objects[0]["ratingValue"] == 4.6
-        assert objects[0]["bestRating"] == 5.0
-        assert objects[0]["worstRating"] == 1.0
-        assert objects[0]["ratingCount"] == 245
-        assert objects[0]["reviewCount"] == 187
-        assert "itemReviewed" in objects[0]
-        assert objects[0]["itemReviewed"]["@type"] == "Product"
+        _assert_fields(
+            objects[0],
+            {
+                "@type": "AggregateRating",
+                "ratingValue": 4.6,
+                "bestRating": 5.0,
+                "worstRating": 1.0,
+                "ratingCount": 245,
+                "reviewCount": 187,
+            },
+        )
+        _assert_fields(objects[0]["itemReviewed"], {"@type": "Product"})
 
 
 class TestAggregateRatingRealWorld:
@@ -194,14 +185,16 @@ class TestAggregateRatingRealWorld:
         objects = meta_oxide.extract_jsonld(html)
 
         assert len(objects) == 1
-        assert objects[0]["@type"] == "Product"
-        assert objects[0]["name"] == "Smart TV 55 inch"
-        assert "aggregateRating" in objects[0]
-        rating = objects[0]["aggregateRating"]
-        assert rating["@type"] == "AggregateRating"
-        assert rating["ratingValue"] == 4.5
-        assert rating["ratingCount"] == 892
-        assert rating["reviewCount"] == 456
+        _assert_fields(objects[0], {"@type": "Product", "name": "Smart TV 55 inch"})
+        _assert_fields(
+            objects[0]["aggregateRating"],
+            {
+                "@type": "AggregateRating",
+                "ratingValue": 4.5,
+                "ratingCount": 892,
+                "reviewCount": 456,
+            },
+        )
 
     def test_restaurant_rating(self):
         """Test restaurant rating example"""
@@ -236,115 +229,11 @@ class TestAggregateRatingRealWorld:
         objects = meta_oxide.extract_jsonld(html)
 
         assert len(objects) == 1
-        assert objects[0]["@type"] == "Restaurant"
-        assert objects[0]["name"] == "The Golden Spoon"
-        assert "aggregateRating" in objects[0]
-        rating = objects[0]["aggregateRating"]
-        assert rating["@type"] == "AggregateRating"
-        assert rating["ratingValue"] == 4.8
-        assert rating["ratingCount"] == 327
-
-
-class TestAggregateRatingEdgeCases:
-    """Test edge cases for AggregateRating"""
-
-    def test_aggregaterating_empty(self):
-        """Test empty AggregateRating"""
-        html = """
-        <html>
-        <head>
-            <script type="application/ld+json">
-            {
-                "@context": "https://schema.org",
-                "@type": "AggregateRating"
-            }
-            </script>
-        </head>
-        <body></body>
-        </html>
-        """
-
-        objects = meta_oxide.extract_jsonld(html)
-
-        assert len(objects) == 1
-        assert objects[0]["@type"] == "AggregateRating"
-
-    def test_aggregaterating_integer_rating(self):
-        """Test rating with integer values"""
-        html = """
-        <html>
-        <head>
-            <script type="application/ld+json">
-            {
-                "@context": "https://schema.org",
-                "@type": "AggregateRating",
-                "ratingValue": 4,
-                "bestRating": 5,
-                "ratingCount": 100
-            }
-            </script>
-        </head>
-        <body></body>
-        </html>
-        """
-
-        objects = meta_oxide.extract_jsonld(html)
-
-        assert len(objects) == 1
-        assert objects[0]["@type"] == "AggregateRating"
-        assert objects[0]["ratingValue"] == 4.0
-        assert objects[0]["bestRating"] == 5.0
-        assert objects[0]["ratingCount"] == 100
-
-    def test_aggregaterating_null_values(self):
-        """Test rating with null values"""
-        html = """
-        <html>
-        <head>
-            <script type="application/ld+json">
-            {
-                "@context": "https://schema.org",
-                "@type": "AggregateRating",
-                "ratingValue": 4.5,
-                "bestRating": null,
-                "worstRating": null
-            }
-            </script>
-        </head>
-        <body></body>
-        </html>
-        """
-
-        objects = meta_oxide.extract_jsonld(html)
-
-        assert len(objects) == 1
-        assert objects[0]["@type"] == "AggregateRating"
-        assert objects[0]["ratingValue"] == 4.5
-
-    def test_aggregaterating_decimal_precision(self):
-        """Test rating with high decimal precision"""
-        html = """
-        <html>
-        <head>
-            <script type="application/ld+json">
-            {
-                "@context": "https://schema.org",
-                "@type": "AggregateRating",
-                "ratingValue": 4.687,
-                "bestRating": 5.0
-            }
-            </script>
-        </head>
-        <body></body>
-        </html>
-        """
-
-        objects = meta_oxide.extract_jsonld(html)
-
-        assert len(objects) == 1
-        assert objects[0]["@type"] == "AggregateRating"
-        # Allow for floating point comparison
-        assert abs(objects[0]["ratingValue"] - 4.687) < 0.001
+        _assert_fields(objects[0], {"@type": "Restaurant", "name": "The Golden Spoon"})
+        _assert_fields(
+            objects[0]["aggregateRating"],
+            {"@type": "AggregateRating", "ratingValue": 4.8, "ratingCount": 327},
+        )
 
 
 class TestAggregateRatingIntegration:
@@ -383,10 +272,10 @@ class TestAggregateRatingIntegration:
         # Should have JSON-LD with Product and AggregateRating
         assert "jsonld" in data
         assert len(data["jsonld"]) == 1
-        assert data["jsonld"][0]["@type"] == "Product"
-        assert "aggregateRating" in data["jsonld"][0]
-        assert data["jsonld"][0]["aggregateRating"]["@type"] == "AggregateRating"
-        assert data["jsonld"][0]["aggregateRating"]["ratingValue"] == 4.5
+        _assert_fields(data["jsonld"][0], {"@type": "Product"})
+        _assert_fields(
+            data["jsonld"][0]["aggregateRating"], {"@type": "AggregateRating", "ratingValue": 4.5}
+        )
 
     def test_multiple_ratings_in_graph(self):
         """Test multiple items with ratings in @graph"""
@@ -424,13 +313,11 @@ class TestAggregateRatingIntegration:
         objects = meta_oxide.extract_jsonld(html)
 
         assert len(objects) == 2
-        assert objects[0]["@type"] == "Product"
-        assert "aggregateRating" in objects[0]
-        assert objects[0]["aggregateRating"]["ratingValue"] == 4.5
+        _assert_fields(objects[0], {"@type": "Product"})
+        _assert_fields(objects[0]["aggregateRating"], {"ratingValue": 4.5})
 
-        assert objects[1]["@type"] == "LocalBusiness"
-        assert "aggregateRating" in objects[1]
-        assert objects[1]["aggregateRating"]["ratingValue"] == 4.8
+        _assert_fields(objects[1], {"@type": "LocalBusiness"})
+        _assert_fields(objects[1]["aggregateRating"], {"ratingValue": 4.8})
 
     def test_aggregaterating_with_organization(self):
         """Test AggregateRating with Organization itemReviewed"""
@@ -458,10 +345,10 @@ class TestAggregateRatingIntegration:
         objects = meta_oxide.extract_jsonld(html)
 
         assert len(objects) == 1
-        assert objects[0]["@type"] == "AggregateRating"
-        assert objects[0]["ratingValue"] == 4.3
-        assert objects[0]["itemReviewed"]["@type"] == "Organization"
-        assert objects[0]["itemReviewed"]["name"] == "Acme Corporation"
+        _assert_fields(objects[0], {"@type": "AggregateRating", "ratingValue": 4.3})
+        _assert_fields(
+            objects[0]["itemReviewed"], {"@type": "Organization", "name": "Acme Corporation"}
+        )
 
 
 if __name__ == "__main__":
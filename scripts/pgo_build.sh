@@ -0,0 +1,55 @@
+#!/bin/bash
+
+# MetaOxide profile-guided (PGO) wheel build
+#
+# Builds an instrumented extension, trains it by running the Python test
+# suite, then rebuilds the release wheel using the collected profile.
+#
+# Usage: ./scripts/pgo_build.sh [extra maturin build args]
+#
+# Environment:
+#   PGO_DIR          Directory for raw profiles (default: target/pgo-data)
+#   PGO_RUSTFLAGS    Extra RUSTFLAGS for both builds, e.g. "-Ctarget-cpu=x86-64-v3"
+#   PGO_TRAIN        pytest paths used as the training workload
+#                    (default: bindings/python/tests)
+#
+# Requires maturin, pytest, a virtualenv to install the instrumented build into,
+# and llvm-profdata (`rustup component add llvm-tools-preview`).
+
+set -e
+
+PROJECT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+PGO_DIR="${PGO_DIR:-$PROJECT_DIR/target/pgo-data}"
+PGO_RUSTFLAGS="${PGO_RUSTFLAGS:-}"
+PGO_TRAIN="${PGO_TRAIN:-bindings/python/tests}"
+
+cd "$PROJECT_DIR"
+
+# Prefer the llvm-profdata shipped with the active toolchain so the profile
+# format matches the compiler's LLVM version
+HOST="$(rustc -vV | sed -n 's/^host: //p')"
+PROFDATA="$(rustc --print sysroot)/lib/rustlib/$HOST/bin/llvm-profdata"
+if [ ! -x "$PROFDATA" ]; then
+    PROFDATA="$(command -v llvm-profdata || true)"
+fi
+if [ -z "$PROFDATA" ]; then
+    echo "llvm-profdata not found; run: rustup component add llvm-tools-preview" >&2
+    exit 1
+fi
+
+echo "==> Building instrumented extension"
+rm -rf "$PGO_DIR"
+RUSTFLAGS="-Cprofile-generate=$PGO_DIR $PGO_RUSTFLAGS" maturin develop --release
+
+echo "==> Collecting profile from $PGO_TRAIN"
+# Word splitting is intentional: PGO_TRAIN may list several paths
+python -m pytest $PGO_TRAIN -q
+
+echo "==> Merging profile data"
+"$PROFDATA" merge -o "$PGO_DIR/merged.profdata" "$PGO_DIR"
+
+echo "==> Building optimized wheel"
+RUSTFLAGS="-Cprofile-use=$PGO_DIR/merged.profdata -Cllvm-args=-pgo-warn-missing-function $PGO_RUSTFLAGS" \
+    maturin build --release "$@"
+
+echo "==> Done: wheels are in target/wheels/"
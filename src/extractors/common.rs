@@ -25,14 +25,33 @@ pub trait Extractor: Debug {
 
 /// Utility functions for URL resolution
 pub mod url_utils {
-    use url::{ParseError, Url};
+    use std::cell::RefCell;
+    use url::{ParseError, Position, Url};
+
+    thread_local! {
+        /// The last base URL parsed on this thread, with the text it came from
+        static LAST_BASE: RefCell<Option<(String, Url)>> = const { RefCell::new(None) };
+    }
 
     /// Resolve a URL (possibly relative) against a base URL
+    ///
+    /// A page resolves every link, image and canonical URL against the same
+    /// base, so the parsed base is kept per thread and reused while the base
+    /// text stays the same.
     pub fn resolve_url(base_url: Option<&str>, url: &str) -> Result<String, ParseError> {
         if let Some(base) = base_url {
-            let base_parsed = Url::parse(base)?;
-            let resolved = base_parsed.join(url)?;
-            Ok(resolved.to_string())
+            LAST_BASE.with_borrow_mut(|last| {
+                let (text, base_parsed) = match last.take() {
+                    Some((text, parsed)) if text == base => (text, parsed),
+                    _ => (base.to_string(), Url::parse(base)?),
+                };
+                let resolved = match join_root_relative(&base_parsed, url) {
+                    Some(joined) => Ok(joined),
+                    None => base_parsed.join(url).map(String::from),
+                };
+                *last = Some((text, base_parsed));
+                resolved
+            })
         } else {
             // If no base URL, try parsing as absolute
             let parsed = Url::parse(url)?;
@@ -40,6 +59,40 @@ pub mod url_utils {
         }
     }
 
+    /// Join a root-relative reference such as `/blog/post?page=2` by concatenation
+    ///
+    /// Canonical links, icons and images are usually given this way. Returns
+    /// `None` unless `url` consists only of characters the URL parser keeps
+    /// unchanged and has no dot segments, so the result always equals
+    /// `base.join(url)`; anything else goes through the full parser.
+    fn join_root_relative(base: &Url, url: &str) -> Option<String> {
+        let bytes = url.as_bytes();
+        // "//host/..." is scheme-relative, not root-relative
+        if bytes.first() != Some(&b'/') || bytes.get(1) == Some(&b'/') {
+            return None;
+        }
+        if !matches!(base.scheme(), "http" | "https") || !base.has_host() {
+            return None;
+        }
+
+        let mut in_query = false;
+        for (i, &c) in bytes.iter().enumerate() {
+            match c {
+                _ if c.is_ascii_alphanumeric() || b"-_~!$&()*+,;=:@/".contains(&c) => {}
+                // A segment starting with '.' may be a dot segment
+                b'.' if in_query || bytes[i - 1] != b'/' => {}
+                b'?' => in_query = true,
+                _ => return None,
+            }
+        }
+
+        let prefix = &base[..Position::BeforePath];
+        let mut joined = String::with_capacity(prefix.len() + url.len());
+        joined.push_str(prefix);
+        joined.push_str(url);
+        Some(joined)
+    }
+
     /// Check if a URL is valid
     #[allow(dead_code)]
     pub fn is_valid_url(url: &str) -> bool {
@@ -50,7 +103,51 @@ pub mod url_utils {
 /// Utility functions for HTML parsing
 pub mod html_utils {
     use crate::errors::{MicroformatError, Result};
-    use scraper::{Html, Selector};
+    use std::borrow::Cow;
+    use std::collections::HashSet;
+
+    pub use scraper::{ElementRef, Html, Selector};
+
+    /// Whether the input contains any markup at all
+    ///
+    /// Without a `<` the parser can only produce text inside the implied
+    /// `<html>`, `<head>` and `<body>` elements, so extractors can return
+    /// their empty result without building a DOM.
+    pub fn has_markup(html: &str) -> bool {
+        memchr::memchr(b'<', html.as_bytes()).is_some()
+    }
+
+    /// Whether the parsed document could contain `literal` in an attribute or text
+    ///
+    /// ASCII letters, digits and `-` have no named character references, so
+    /// they reach the DOM either spelled out or through a numeric `&#...;`
+    /// reference. When neither `literal` nor `&#` occurs in the raw input,
+    /// no attribute value of the parsed document can contain it.
+    pub fn may_contain(html: &str, literal: &str) -> bool {
+        debug_assert!(literal.bytes().all(|b| b.is_ascii_alphanumeric() || b == b'-'));
+        let bytes = html.as_bytes();
+        memchr::memmem::find(bytes, literal.as_bytes()).is_some()
+            || memchr::memmem::find(bytes, b"&#").is_some()
+    }
+
+    /// Whether the parsed document could contain an element matching `selector`
+    ///
+    /// Only a single class selector such as `.h-recipe` is checked, with
+    /// [`may_contain`]; any other selector is assumed to match.
+    pub fn may_match_selector(html: &str, selector: &str) -> bool {
+        match simple_class(selector) {
+            Some(class) if !class.contains('_') => may_contain(html, class),
+            _ => true,
+        }
+    }
+
+    /// Class name of a selector that is a single class, such as `.p-name`
+    fn simple_class(selector: &str) -> Option<&str> {
+        selector.strip_prefix('.').filter(|class| {
+            !class.is_empty()
+                && class.bytes().all(|b| b.is_ascii_alphanumeric() || b == b'-' || b == b'_')
+        })
+    }
 
     /// Parse HTML and return a document
     pub fn parse_html(html: &str) -> Html {
@@ -65,20 +162,226 @@ pub mod html_utils {
     }
 
     /// Extract text content from an element, trimming whitespace
+    ///
+    /// A single text node (e.g. `<span class="p-name">Gordon Ramsay</span>`)
+    /// is copied from the tree straight into a `String` of the trimmed
+    /// length; only several text nodes are concatenated and trimmed in place.
     pub fn extract_text(element: &scraper::ElementRef) -> Option<String> {
-        let text = element.text().collect::<String>();
-        let trimmed = text.trim();
-        if trimmed.is_empty() {
+        let mut texts = element.text();
+        let first = texts.next()?;
+        let text = match texts.next() {
+            None => trim_text(first).to_string(),
+            Some(second) => {
+                let mut text = String::with_capacity(first.len() + second.len());
+                text.push_str(first);
+                text.push_str(second);
+                texts.for_each(|t| text.push_str(t));
+                trim_string(text)
+            }
+        };
+        if text.is_empty() {
             None
         } else {
-            Some(trimmed.to_string())
+            Some(text)
+        }
+    }
+
+    /// Trim surrounding whitespace from an owned string in place
+    ///
+    /// Reuses the existing buffer instead of copying the trimmed slice into
+    /// a second allocation.
+    pub fn trim_string(mut text: String) -> String {
+        let trimmed = trim_text(&text);
+        let start = trimmed.as_ptr() as usize - text.as_ptr() as usize;
+        let end = start + trimmed.len();
+        text.truncate(end);
+        text.drain(..start);
+        text
+    }
+
+    /// Trim surrounding whitespace, with the same result as `str::trim`
+    ///
+    /// Extracted text is nearly always ASCII, so leading and trailing ASCII
+    /// whitespace is stripped byte by byte without decoding characters; only
+    /// when a non-ASCII character is left at either end does `str::trim`
+    /// check it for Unicode whitespace.
+    pub fn trim_text(text: &str) -> &str {
+        // The ASCII characters `char::is_whitespace` accepts
+        const fn is_space(b: u8) -> bool {
+            matches!(b, b' ' | b'\t' | b'\n' | b'\x0B' | b'\x0C' | b'\r')
+        }
+        let bytes = text.as_bytes();
+        let start = bytes.iter().position(|&b| !is_space(b)).unwrap_or(bytes.len());
+        let end = bytes.iter().rposition(|&b| !is_space(b)).map_or(start, |last| last + 1);
+        let text = &text[start..end];
+        match (text.as_bytes().first(), text.as_bytes().last()) {
+            (Some(first), Some(last)) if !first.is_ascii() || !last.is_ascii() => text.trim(),
+            _ => text,
         }
     }
 
+    /// Lowercase an attribute value for matching against known keywords
+    ///
+    /// Meta names, properties and rel values are almost always lowercase
+    /// ASCII already and are then borrowed as is. Non-ASCII input goes
+    /// through `str::to_lowercase`, so the result always equals it.
+    pub fn lowercase(text: &str) -> Cow<'_, str> {
+        if !text.is_ascii() {
+            Cow::Owned(text.to_lowercase())
+        } else if text.bytes().any(|b| b.is_ascii_uppercase()) {
+            Cow::Owned(text.to_ascii_lowercase())
+        } else {
+            Cow::Borrowed(text)
+        }
+    }
+
+    /// Parse the trimmed text content of an element as a number
+    ///
+    /// Elements with a single text node (the usual case for values such as
+    /// `<span class="p-latitude">37.7749</span>`) are parsed in place without
+    /// collecting the text into a temporary `String`.
+    pub fn parse_text<T: Float>(element: &scraper::ElementRef) -> Option<T> {
+        let mut texts = element.text();
+        let first = texts.next()?;
+        match texts.next() {
+            None => parse_float(trim_text(first)),
+            Some(second) => {
+                let mut text = String::with_capacity(first.len() + second.len());
+                text.push_str(first);
+                text.push_str(second);
+                texts.for_each(|t| text.push_str(t));
+                parse_float(trim_text(&text))
+            }
+        }
+    }
+
+    /// Floating point types produced by [`parse_text`]
+    pub trait Float: std::str::FromStr {
+        /// Round an `f64` that holds a decimal value exactly to this type
+        fn from_f64(value: f64) -> Self;
+    }
+
+    impl Float for f32 {
+        fn from_f64(value: f64) -> Self {
+            value as f32
+        }
+    }
+
+    impl Float for f64 {
+        fn from_f64(value: f64) -> Self {
+            value
+        }
+    }
+
+    /// Parse a number, reading short plain decimals without the general float parser
+    fn parse_float<T: Float>(text: &str) -> Option<T> {
+        match parse_short_decimal(text.as_bytes()) {
+            Some(value) => Some(T::from_f64(value)),
+            None => text.parse().ok(),
+        }
+    }
+
+    /// Value of a plain decimal such as `5`, `3.75` or `87.5`
+    ///
+    /// Only digits are accepted, at most 8 before an optional `.` and 4 after
+    /// it; anything else (signs, exponents, `inf`) returns `None`. The digits
+    /// form an integer below 2^53, so one division by a power of ten yields
+    /// the correctly rounded `f64`, and with four or fewer fractional digits
+    /// that `f64` is never close enough to an `f32` rounding boundary for the
+    /// narrowing to differ from parsing as `f32` directly.
+    fn parse_short_decimal(bytes: &[u8]) -> Option<f64> {
+        const POW10: [f64; 5] = [1.0, 10.0, 100.0, 1000.0, 10000.0];
+        let (int, frac) = match memchr::memchr(b'.', bytes) {
+            Some(dot) if dot + 1 < bytes.len() => (&bytes[..dot], &bytes[dot + 1..]),
+            Some(_) => return None,
+            None => (bytes, &[][..]),
+        };
+        if int.is_empty() || int.len() > 8 || frac.len() > 4 {
+            return None;
+        }
+        let mut value: u64 = 0;
+        for &b in int.iter().chain(frac) {
+            let digit = b.wrapping_sub(b'0');
+            if digit > 9 {
+                return None;
+            }
+            value = value * 10 + u64::from(digit);
+        }
+        Some(value as f64 / POW10[frac.len()])
+    }
+
     /// Get attribute value from an element
     pub fn get_attr(element: &scraper::ElementRef, attr: &str) -> Option<String> {
         element.value().attr(attr).map(|s| s.to_string())
     }
+
+    /// Whether a whitespace-separated `class` attribute value contains `token`
+    ///
+    /// Candidate positions are found with `memmem` and only the bytes on either
+    /// side are checked, so the attribute is never split into tokens.
+    pub fn class_has_token(class_attr: &str, token: &str) -> bool {
+        let (haystack, needle) = (class_attr.as_bytes(), token.as_bytes());
+        if needle.is_empty() || haystack.len() < needle.len() {
+            return false;
+        }
+        memchr::memmem::find_iter(haystack, needle).any(|start| {
+            let end = start + needle.len();
+            (start == 0 || haystack[start - 1].is_ascii_whitespace())
+                && (end == haystack.len() || haystack[end].is_ascii_whitespace())
+        })
+    }
+
+    /// First descendant matching `selector`, plus the first match whose class
+    /// list also contains `token`
+    ///
+    /// Lets a nested microformat (`.p-reviewer.h-card`) and its plain-text
+    /// fallback (`.p-reviewer`) be located with one selector walk.
+    pub fn select_first_with_class<'a>(
+        root: &ElementRef<'a>,
+        selector: &Selector,
+        token: &str,
+    ) -> (Option<ElementRef<'a>>, Option<ElementRef<'a>>) {
+        let mut first = None;
+        for element in root.select(selector) {
+            first.get_or_insert(element);
+            if element.value().attr("class").is_some_and(|class| class_has_token(class, token)) {
+                return (first, Some(element));
+            }
+        }
+        (first, None)
+    }
+
+    /// Set of class tokens used by an element and its descendants
+    ///
+    /// Built with a single walk over the subtree, so extractors that run many
+    /// per-property selectors against one root can skip the ones whose class
+    /// never occurs instead of walking the subtree again for each.
+    pub struct ClassIndex<'a> {
+        classes: HashSet<&'a str>,
+    }
+
+    impl<'a> ClassIndex<'a> {
+        /// Index the class tokens of `root` and everything below it
+        pub fn new(root: ElementRef<'a>) -> Self {
+            let classes = root
+                .descendants()
+                .filter_map(ElementRef::wrap)
+                .flat_map(|element| element.value().classes())
+                .collect();
+            ClassIndex { classes }
+        }
+
+        /// Whether `selector` can match anything in the indexed subtree
+        ///
+        /// Only simple class selectors such as `.p-name` are looked up; any
+        /// other selector is conservatively assumed to match.
+        pub fn may_match(&self, selector: &str) -> bool {
+            match simple_class(selector) {
+                Some(class) => self.classes.contains(class),
+                None => true,
+            }
+        }
+    }
 }
 
 #[cfg(test)]
@@ -97,12 +400,179 @@ mod tests {
         assert_eq!(result.unwrap(), "https://other.com/");
     }
 
+    #[test]
+    fn test_resolve_url_reuses_base_only_when_unchanged() {
+        let first = url_utils::resolve_url(Some("https://a.example/x/"), "y");
+        let second = url_utils::resolve_url(Some("https://b.example/"), "y");
+        let invalid = url_utils::resolve_url(Some("not a url"), "y");
+        let again = url_utils::resolve_url(Some("https://a.example/x/"), "z");
+        assert_eq!(first.unwrap(), "https://a.example/x/y");
+        assert_eq!(second.unwrap(), "https://b.example/y");
+        assert!(invalid.is_err());
+        assert_eq!(again.unwrap(), "https://a.example/x/z");
+    }
+
+    #[test]
+    fn test_resolve_url_root_relative() {
+        let resolve = |base, url| url_utils::resolve_url(Some(base), url).unwrap();
+        assert_eq!(
+            resolve("https://Example.com:443/a/b?q#f", "/blog/post"),
+            "https://example.com/blog/post"
+        );
+        assert_eq!(
+            resolve("http://example.com:8080", "/x?a=1&b=./c"),
+            "http://example.com:8080/x?a=1&b=./c"
+        );
+        // Dot segments, spaces, fragments and scheme-relative URLs take the full parser
+        assert_eq!(resolve("https://example.com/a/", "/b/../c"), "https://example.com/c");
+        assert_eq!(resolve("https://example.com/", "/a b#top"), "https://example.com/a%20b#top");
+        assert_eq!(
+            resolve("https://example.com/", "//cdn.example.com/x"),
+            "https://cdn.example.com/x"
+        );
+    }
+
     #[test]
     fn test_resolve_url_no_base() {
         let result = url_utils::resolve_url(None, "https://example.com/");
         assert_eq!(result.unwrap(), "https://example.com/");
     }
 
+    #[test]
+    fn test_parse_text_single_node() {
+        let html = html_utils::parse_html("<p> -122.4194 </p>");
+        let selector = html_utils::create_selector("p").unwrap();
+        let element = html.select(&selector).next().unwrap();
+        assert_eq!(html_utils::parse_text::<f64>(&element), Some(-122.4194));
+    }
+
+    #[test]
+    fn test_parse_text_multiple_nodes() {
+        let html = html_utils::parse_html("<p> 4<b>.</b>5 </p>");
+        let selector = html_utils::create_selector("p").unwrap();
+        let element = html.select(&selector).next().unwrap();
+        assert_eq!(html_utils::parse_text::<f32>(&element), Some(4.5));
+    }
+
+    #[test]
+    fn test_parse_text_matches_str_parse() {
+        let values = [
+            "5",
+            "0",
+            "3.75",
+            "87.5",
+            "4.5",
+            "0.1",
+            "0.3",
+            "16777217",
+            "99999999.9999",
+            "007.50",
+            "-1.5",
+            "1e3",
+            "+2",
+            ".5",
+            "5.",
+            "1.23456789",
+            "123456789",
+            "37.7749295",
+        ];
+        for value in values {
+            let html = html_utils::parse_html(&format!("<span> {} </span>", value));
+            let selector = html_utils::create_selector("span").unwrap();
+            let element = html.select(&selector).next().unwrap();
+            assert_eq!(html_utils::parse_text::<f32>(&element), value.parse::<f32>().ok());
+            assert_eq!(html_utils::parse_text::<f64>(&element), value.parse::<f64>().ok());
+        }
+    }
+
+    #[test]
+    fn test_parse_text_invalid_or_empty() {
+        let html = html_utils::parse_html("<p>abc</p><span></span>");
+        let p = html.select(&html_utils::create_selector("p").unwrap()).next().unwrap();
+        let span = html.select(&html_utils::create_selector("span").unwrap()).next().unwrap();
+        assert_eq!(html_utils::parse_text::<f64>(&p), None);
+        assert_eq!(html_utils::parse_text::<f64>(&span), None);
+    }
+
+    #[test]
+    fn test_trim_string() {
+        assert_eq!(html_utils::trim_string("  a b \n".to_string()), "a b");
+        assert_eq!(html_utils::trim_string("\u{a0}caf\u{e9}\t".to_string()), "caf\u{e9}");
+        assert_eq!(html_utils::trim_string(" \n ".to_string()), "");
+        assert_eq!(html_utils::trim_string(String::new()), "");
+    }
+
+    #[test]
+    fn test_may_match_selector() {
+        let html = r#"<div class="h-card"><span class="p-name">A</span></div>"#;
+        assert!(html_utils::may_match_selector(html, ".h-card"));
+        assert!(!html_utils::may_match_selector(html, ".h-recipe"));
+        // The class could be spelled with character references
+        assert!(html_utils::may_match_selector(r#"<div class="h&#45;recipe">"#, ".h-recipe"));
+        // Only single class selectors are checked
+        assert!(html_utils::may_match_selector(html, ".p-item.h-product"));
+        assert!(html_utils::may_match_selector(html, ".snake_case"));
+        assert!(html_utils::may_contain(html, "h-"));
+        assert!(!html_utils::may_contain("<p>No recipes here</p>", "h-"));
+    }
+
+    #[test]
+    fn test_class_has_token() {
+        assert!(html_utils::class_has_token("h-card", "h-card"));
+        assert!(html_utils::class_has_token("p-reviewer h-card", "h-card"));
+        assert!(html_utils::class_has_token("h-card\tp-reviewer", "h-card"));
+        assert!(html_utils::class_has_token("not-h-card h-card", "h-card"));
+        assert!(!html_utils::class_has_token("not-h-card", "h-card"));
+        assert!(!html_utils::class_has_token("h-cards p-reviewer", "h-card"));
+        assert!(!html_utils::class_has_token("h-car", "h-card"));
+        assert!(!html_utils::class_has_token("h-card", ""));
+    }
+
+    #[test]
+    fn test_select_first_with_class() {
+        let html = html_utils::parse_html(
+            r#"<div id="root"><span class="p-reviewer">Text</span>
+            <div class="p-reviewer h-card" id="card"></div></div>"#,
+        );
+        let root = html.select(&html_utils::create_selector("#root").unwrap()).next().unwrap();
+        let selector = html_utils::create_selector(".p-reviewer").unwrap();
+
+        let (first, nested) = html_utils::select_first_with_class(&root, &selector, "h-card");
+        assert_eq!(first.unwrap().value().attr("class"), Some("p-reviewer"));
+        assert_eq!(nested.unwrap().value().id(), Some("card"));
+
+        let (first, nested) = html_utils::select_first_with_class(&root, &selector, "h-product");
+        assert!(first.is_some());
+        assert!(nested.is_none());
+    }
+
+    #[test]
+    fn test_class_index() {
+        let html = html_utils::parse_html(
+            r#"<div class="h-card"><span class="p-name  extra">A</span><b class="p-org">B</b></div>"#,
+        );
+        let root = html.select(&html_utils::create_selector(".h-card").unwrap()).next().unwrap();
+        let index = html_utils::ClassIndex::new(root);
+
+        assert!(index.may_match(".h-card"));
+        assert!(index.may_match(".p-name"));
+        assert!(index.may_match(".p-org"));
+        assert!(!index.may_match(".p-tel"));
+        assert!(!index.may_match(".p-nam"));
+        // Selectors other than a single class are never ruled out
+        assert!(index.may_match(".p-tel, .p-phone"));
+        assert!(index.may_match(".p-tel.h-card"));
+        assert!(index.may_match("span"));
+    }
+
+    #[test]
+    fn test_has_markup() {
+        assert!(html_utils::has_markup("<p>text</p>"));
+        assert!(html_utils::has_markup("text <br"));
+        assert!(!html_utils::has_markup(""));
+        assert!(!html_utils::has_markup("plain text &amp; entities"));
+    }
+
     #[test]
     fn test_is_valid_url() {
         assert!(url_utils::is_valid_url("https://example.com"));
@@ -127,6 +597,32 @@ mod tests {
         assert_eq!(html_utils::extract_text(&element), None);
     }
 
+    #[test]
+    fn test_trim_text() {
+        for text in
+            ["", "  ", " a b ", "\t\x0B\x0Cx\r\n", "\u{a0}\u{3000}é\u{2028}", " é ", "\u{200b}x"]
+        {
+            assert_eq!(html_utils::trim_text(text), text.trim());
+            assert_eq!(html_utils::trim_string(text.to_string()), text.trim());
+        }
+    }
+
+    #[test]
+    fn test_lowercase() {
+        for text in ["description", "Theme-Color", "OG:TITLE", "\u{212a}eywords", "ÉTÉ", ""] {
+            assert_eq!(html_utils::lowercase(text), text.to_lowercase());
+        }
+        assert!(matches!(html_utils::lowercase("viewport"), std::borrow::Cow::Borrowed(_)));
+    }
+
+    #[test]
+    fn test_extract_text_multiple_nodes() {
+        let html = html_utils::parse_html("<p> Chocolate <b>Chip</b> Cookies </p>");
+        let selector = html_utils::create_selector("p").unwrap();
+        let element = html.select(&selector).next().unwrap();
+        assert_eq!(html_utils::extract_text(&element), Some("Chocolate Chip Cookies".to_string()));
+    }
+
     #[test]
     fn test_get_attr_exists() {
         let html = html_utils::parse_html(r#"<a href="https://example.com">Link</a>"#);
@@ -4,7 +4,9 @@
 
 use crate::errors::Result;
 use crate::extractors::common::html_utils;
+use crate::extractors::scanner::{self, TagAttributes};
 use crate::types::dublin_core::DublinCore;
+use scraper::Html;
 
 #[cfg(test)]
 mod tests;
@@ -17,67 +19,127 @@ mod tests;
 /// # Returns
 /// * `Result<DublinCore>` - Extracted Dublin Core metadata or error
 pub fn extract(html: &str) -> Result<DublinCore> {
-    let document = html_utils::parse_html(html);
+    if let Some(page) = scanner::scan(html) {
+        return Ok(extract_from_tags(&page.tags));
+    }
+
+    extract_from_document(&html_utils::parse_html(html))
+}
+
+/// Extract Dublin Core metadata from an already parsed document
+///
+/// Reads the `DC.*` and `DCTERMS.*` `<meta name>` tags, in any case.
+pub fn extract_from_document(document: &Html) -> Result<DublinCore> {
+    Ok(extract_from_tags(&scanner::document_tags(document)))
+}
+
+/// Dublin Core elements recognised in `<meta name>` attributes
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum DcField {
+    Title,
+    Creator,
+    Subject,
+    Description,
+    Publisher,
+    Contributor,
+    Date,
+    Type,
+    Format,
+    Identifier,
+    Source,
+    Language,
+    Relation,
+    Coverage,
+    Rights,
+}
+
+impl DcField {
+    /// Longest recognised name, `dcterms.contributor`, rounded up
+    const MAX_NAME_LEN: usize = 24;
+
+    /// Map a `DC.*` or `DCTERMS.*` meta name to its element, ignoring case
+    ///
+    /// The name is lowercased into a stack buffer, so no allocation happens
+    /// for the (common) case of non-Dublin Core meta tags. All recognised
+    /// names are ASCII, so non-ASCII names can never match.
+    fn from_meta_name(name: &str) -> Option<Self> {
+        let bytes = name.as_bytes();
+        if bytes.len() > Self::MAX_NAME_LEN || !bytes.is_ascii() {
+            return None;
+        }
+
+        let mut buf = [0u8; Self::MAX_NAME_LEN];
+        let lower = &mut buf[..bytes.len()];
+        lower.copy_from_slice(bytes);
+        lower.make_ascii_lowercase();
+
+        let element = lower.strip_prefix(b"dc.").or_else(|| lower.strip_prefix(b"dcterms."))?;
+        Some(match element {
+            b"title" => DcField::Title,
+            b"creator" => DcField::Creator,
+            b"subject" => DcField::Subject,
+            b"description" => DcField::Description,
+            b"publisher" => DcField::Publisher,
+            b"contributor" => DcField::Contributor,
+            b"date" => DcField::Date,
+            b"type" => DcField::Type,
+            b"format" => DcField::Format,
+            b"identifier" => DcField::Identifier,
+            b"source" => DcField::Source,
+            b"language" => DcField::Language,
+            b"relation" => DcField::Relation,
+            b"coverage" => DcField::Coverage,
+            b"rights" => DcField::Rights,
+            _ => return None,
+        })
+    }
+}
+
+/// Split a list-valued element on commas and semicolons
+fn split_list(content: &str) -> Vec<String> {
+    content
+        .split(&[',', ';'][..])
+        .map(str::trim)
+        .filter(|s| !s.is_empty())
+        .map(String::from)
+        .collect()
+}
+
+/// Build [`DublinCore`] from the `<meta>` tags of a page
+pub fn extract_from_tags<T: TagAttributes>(tags: &[T]) -> DublinCore {
     let mut dc = DublinCore::default();
 
-    // Extract Dublin Core meta tags (both DC. and dc. prefixes)
-    if let Ok(selector) = html_utils::create_selector("meta[name][content]") {
-        for element in document.select(&selector) {
-            if let (Some(name), Some(content)) =
-                (html_utils::get_attr(&element, "name"), html_utils::get_attr(&element, "content"))
-            {
-                let content = content.trim().to_string();
-                if content.is_empty() {
-                    continue;
-                }
-
-                // Handle both DC. and dc. prefixes (case-insensitive)
-                let name_lower = name.to_lowercase();
-                let dc_name = if let Some(stripped) = name_lower.strip_prefix("dc.") {
-                    stripped
-                } else if let Some(stripped) = name_lower.strip_prefix("dcterms.") {
-                    stripped
-                } else {
-                    continue;
-                };
-
-                match dc_name {
-                    "title" => dc.title = Some(content),
-                    "creator" => dc.creator = Some(content),
-                    "subject" => {
-                        // Split by comma or semicolon
-                        let subjects: Vec<String> = content
-                            .split(&[',', ';'][..])
-                            .map(|s| s.trim().to_string())
-                            .filter(|s| !s.is_empty())
-                            .collect();
-                        dc.subject = Some(subjects);
-                    }
-                    "description" => dc.description = Some(content),
-                    "publisher" => dc.publisher = Some(content),
-                    "contributor" => {
-                        // Split by comma or semicolon
-                        let contributors: Vec<String> = content
-                            .split(&[',', ';'][..])
-                            .map(|s| s.trim().to_string())
-                            .filter(|s| !s.is_empty())
-                            .collect();
-                        dc.contributor = Some(contributors);
-                    }
-                    "date" => dc.date = Some(content),
-                    "type" => dc.type_ = Some(content),
-                    "format" => dc.format = Some(content),
-                    "identifier" => dc.identifier = Some(content),
-                    "source" => dc.source = Some(content),
-                    "language" => dc.language = Some(content),
-                    "relation" => dc.relation = Some(content),
-                    "coverage" => dc.coverage = Some(content),
-                    "rights" => dc.rights = Some(content),
-                    _ => {}
-                }
+    // Extract Dublin Core meta tags (DC. and DCTERMS. prefixes, any case)
+    for element in tags.iter().filter(|t| t.tag_name() == "meta") {
+        if let (Some(name), Some(content)) = (element.attr("name"), element.attr("content")) {
+            let Some(field) = DcField::from_meta_name(name) else {
+                continue;
+            };
+
+            let content = content.trim();
+            if content.is_empty() {
+                continue;
+            }
+
+            match field {
+                DcField::Title => dc.title = Some(content.to_string()),
+                DcField::Creator => dc.creator = Some(content.to_string()),
+                DcField::Subject => dc.subject = Some(split_list(content)),
+                DcField::Description => dc.description = Some(content.to_string()),
+                DcField::Publisher => dc.publisher = Some(content.to_string()),
+                DcField::Contributor => dc.contributor = Some(split_list(content)),
+                DcField::Date => dc.date = Some(content.to_string()),
+                DcField::Type => dc.type_ = Some(content.to_string()),
+                DcField::Format => dc.format = Some(content.to_string()),
+                DcField::Identifier => dc.identifier = Some(content.to_string()),
+                DcField::Source => dc.source = Some(content.to_string()),
+                DcField::Language => dc.language = Some(content.to_string()),
+                DcField::Relation => dc.relation = Some(content.to_string()),
+                DcField::Coverage => dc.coverage = Some(content.to_string()),
+                DcField::Rights => dc.rights = Some(content.to_string()),
             }
         }
     }
 
-    Ok(dc)
+    dc
 }
@@ -147,3 +147,33 @@ fn test_dublin_core_contributor_list() {
         Some(vec!["Alice".to_string(), "Bob".to_string(), "Charlie".to_string()])
     );
 }
+
+#[test]
+fn test_dublin_core_scanner_matches_dom() {
+    let html = r#"
+        <!-- <meta name="DC.title" content="Commented out"> -->
+        <meta name="DC.Title" content="Real Title">
+        <meta name=dcterms.subject content="a; b, c">
+        <meta name="DC.creator" content="Smith &amp; Jones">
+        <noscript><meta name="DC.publisher" content="Hidden"></noscript>
+    "#;
+    let scanned = extract(html).unwrap();
+    let parsed = extract_from_document(&html_utils::parse_html(html)).unwrap();
+
+    assert_eq!(scanned, parsed);
+    assert_eq!(scanned.title, Some("Real Title".to_string()));
+    assert_eq!(scanned.creator, Some("Smith & Jones".to_string()));
+    assert_eq!(scanned.publisher, None);
+}
+
+#[test]
+fn test_dc_field_lookup() {
+    assert_eq!(DcField::from_meta_name("DC.title"), Some(DcField::Title));
+    assert_eq!(DcField::from_meta_name("dcterms.CONTRIBUTOR"), Some(DcField::Contributor));
+    assert_eq!(DcField::from_meta_name("DCTERMS.rights"), Some(DcField::Rights));
+    assert_eq!(DcField::from_meta_name("dc.unknown"), None);
+    assert_eq!(DcField::from_meta_name("title"), None);
+    assert_eq!(DcField::from_meta_name("og.title"), None);
+    assert_eq!(DcField::from_meta_name("dc.títle"), None);
+    assert_eq!(DcField::from_meta_name("dcterms.contributor.with.a.long.suffix"), None);
+}
@@ -5,8 +5,10 @@
 
 use crate::errors::Result;
 use crate::extractors::common::html_utils;
+use crate::extractors::scanner;
+use crate::static_selector;
 use crate::types::jsonld::JsonLdObject;
-use scraper::Selector;
+use scraper::Html;
 
 #[cfg(test)]
 mod tests;
@@ -17,48 +19,82 @@ mod tests;
 ///
 /// # Arguments
 /// * `html` - The HTML content
-/// * `_base_url` - Optional base URL (not used for JSON-LD)
+/// * `base_url` - Optional base URL (not used for JSON-LD)
 ///
 /// # Returns
 /// * `Result<Vec<JsonLdObject>>` - All JSON-LD objects found
-pub fn extract(html: &str, _base_url: Option<&str>) -> Result<Vec<JsonLdObject>> {
-    let document = html_utils::parse_html(html);
-    let mut objects = Vec::new();
+pub fn extract(html: &str, base_url: Option<&str>) -> Result<Vec<JsonLdObject>> {
+    if !html_utils::has_markup(html) {
+        return Ok(Default::default());
+    }
+    if let Some(scripts) = scanner::scan(html).and_then(|page| page.json_ld) {
+        return Ok(parse_scripts(&scripts));
+    }
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
 
-    // Find all <script type="application/ld+json"> tags
-    let selector = match Selector::parse("script[type='application/ld+json']") {
-        Ok(s) => s,
-        Err(_) => return Ok(objects),
-    };
+/// Extract all JSON-LD objects from an already parsed document
+///
+/// Parses every `<script type="application/ld+json">` body; `@graph` containers
+/// are replaced by their items.
+pub fn extract_from_document(
+    document: &Html,
+    _base_url: Option<&str>,
+) -> Result<Vec<JsonLdObject>> {
+    // Find all <script type="application/ld+json"> tags and get their text content
+    let selector = static_selector!("script[type='application/ld+json']");
+    let scripts: Vec<String> = document.select(selector).map(|s| s.text().collect()).collect();
 
-    for script in document.select(&selector) {
-        // Get the text content of the script tag
-        let json_text: String = script.text().collect();
-        let json_text = json_text.trim();
+    Ok(parse_scripts(&scripts))
+}
 
-        if json_text.is_empty() {
-            continue;
-        }
+/// Combined size of the script bodies above which they are parsed in parallel
+///
+/// Below this, handing the scripts to the thread pool costs more than parsing them.
+#[cfg(feature = "rayon")]
+const PARALLEL_PARSE_BYTES: usize = 64 * 1024;
 
-        // Parse JSON
-        match serde_json::from_str::<JsonLdObject>(json_text) {
-            Ok(obj) => {
-                // If object has @graph, extract all items from graph
-                if let Some(ref graph) = obj.graph {
-                    objects.extend(graph.clone());
-                } else {
-                    objects.push(obj);
-                }
-            }
-            Err(e) => {
-                // Log parse error but continue with other scripts
-                eprintln!("JSON-LD parse error: {}", e);
-                continue;
+/// Parse JSON-LD script bodies, keeping their objects in document order
+///
+/// Each script is an independent JSON document, so pages carrying several
+/// large ones parse them on the rayon thread pool when it is available.
+fn parse_scripts<S: AsRef<str> + Sync>(scripts: &[S]) -> Vec<JsonLdObject> {
+    #[cfg(feature = "rayon")]
+    if scripts.len() > 1
+        && scripts.iter().map(|s| s.as_ref().len()).sum::<usize>() >= PARALLEL_PARSE_BYTES
+    {
+        use rayon::prelude::*;
+
+        let parsed: Vec<_> = scripts.par_iter().map(|s| parse_script(s.as_ref())).collect();
+        return parsed.into_iter().flatten().collect();
+    }
+
+    scripts.iter().flat_map(|s| parse_script(s.as_ref())).collect()
+}
+
+/// Parse the body of one JSON-LD script into its objects
+fn parse_script(json_text: &str) -> Vec<JsonLdObject> {
+    let json_text = json_text.trim();
+
+    if json_text.is_empty() {
+        return Vec::new();
+    }
+
+    // Parse JSON
+    match serde_json::from_str::<JsonLdObject>(json_text) {
+        Ok(mut obj) => {
+            // If object has @graph, extract all items from graph
+            match obj.graph.take() {
+                Some(graph) => graph,
+                None => vec![obj],
             }
         }
+        Err(e) => {
+            // Log parse error but continue with other scripts
+            eprintln!("JSON-LD parse error: {}", e);
+            Vec::new()
+        }
     }
-
-    Ok(objects)
 }
 
 /// Extract JSON-LD objects of a specific type
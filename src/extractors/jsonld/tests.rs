@@ -1,6 +1,6 @@
 //! Tests for JSON-LD extraction
 
-use crate::extractors::jsonld::{extract, extract_by_type};
+use crate::extractors::jsonld::{extract, extract_by_type, extract_from_document};
 
 #[cfg(test)]
 mod jsonld_tests {
@@ -752,4 +752,43 @@ mod jsonld_tests {
         let objects = extract(html, None).unwrap();
         assert_eq!(objects.len(), 1);
     }
+
+    #[test]
+    fn test_scanner_matches_document_extraction() {
+        let pages = [
+            r#"<head><script type="application/ld+json">{"@type": "A", "name": "x"}</script></head>
+               <body><script type='APPLICATION/LD+JSON'>{"@graph": [{"@id": "b"}, {"@id": "c"}]}</script>
+               <script>{"@type": "Ignored"}</script><script type="application/ld+json"> </script>"#,
+            r#"<table><tr><td><script type="application/ld+json">{"@type": "InTable"}</script>
+               </td></tr></table><script type="application/ld+json">{"@type": "After"}</script>"#,
+            r#"<script type="application/ld+json">{"@type": "Unclosed"}"#,
+            r#"<noscript><script type="application/ld+json">{"@type": "Raw"}</script></noscript>"#,
+        ];
+        for html in pages {
+            let document = crate::extractors::common::html_utils::parse_html(html);
+            assert_eq!(
+                extract(html, None).unwrap(),
+                extract_from_document(&document, None).unwrap(),
+                "{html}"
+            );
+        }
+    }
+
+    #[test]
+    fn test_large_scripts_keep_document_order() {
+        // Large enough to be parsed in parallel when rayon is enabled
+        let filler = "x".repeat(40 * 1024);
+        let html: String = ["First", "Second", "Third"]
+            .iter()
+            .map(|type_| {
+                format!(
+                    r#"<script type="application/ld+json">{{"@type": "{type_}", "text": "{filler}"}}</script>"#
+                )
+            })
+            .collect();
+
+        let objects = extract(&html, None).unwrap();
+        let types: Vec<_> = objects.iter().map(|obj| obj.type_.clone().unwrap()).collect();
+        assert_eq!(types, vec!["First", "Second", "Third"]);
+    }
 }
@@ -5,7 +5,9 @@
 
 use crate::errors::{MicroformatError, Result};
 use crate::extractors::common::{html_utils, url_utils};
+use crate::static_selector;
 use crate::types::manifest::{ManifestDiscovery, WebAppManifest};
+use scraper::Html;
 
 #[cfg(test)]
 mod tests;
@@ -30,12 +32,20 @@ mod tests;
 /// assert_eq!(discovery.href, Some("https://example.com/manifest.json".to_string()));
 /// ```
 pub fn extract_link(html: &str, base_url: Option<&str>) -> Result<ManifestDiscovery> {
-    let doc = html_utils::parse_html(html);
+    if !html_utils::has_markup(html) {
+        return Ok(Default::default());
+    }
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
 
+/// Extract the manifest link from an already parsed document
+///
+/// Returns the first `<link rel="manifest">` href, resolved against `base_url`.
+pub fn extract_from_document(doc: &Html, base_url: Option<&str>) -> Result<ManifestDiscovery> {
     // Find <link rel="manifest" href="...">
-    let selector = html_utils::create_selector("link[rel=manifest][href]")?;
+    let selector = static_selector!("link[rel=manifest][href]");
 
-    if let Some(link) = doc.select(&selector).next() {
+    if let Some(link) = doc.select(selector).next() {
         if let Some(href) = html_utils::get_attr(&link, "href") {
             // Resolve URL if base_url is provided
             let resolved = if let Some(base) = base_url {
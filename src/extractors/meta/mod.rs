@@ -4,7 +4,9 @@
 
 use crate::errors::Result;
 use crate::extractors::common::{html_utils, url_utils};
+use crate::extractors::scanner::{self, TagAttributes};
 use crate::types::meta::{AlternateLink, FeedLink, MetaTags, RobotsDirective};
+use scraper::Html;
 
 #[cfg(test)]
 mod tests;
@@ -18,191 +20,201 @@ mod tests;
 /// # Returns
 /// * `Result<MetaTags>` - Extracted meta tags or error
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<MetaTags> {
-    let document = html_utils::parse_html(html);
-    let mut meta = MetaTags::default();
-
-    // Extract title
-    if let Ok(selector) = html_utils::create_selector("title") {
-        meta.title = document.select(&selector).next().and_then(|e| html_utils::extract_text(&e));
+    if let Some(page) = scanner::scan(html) {
+        return Ok(extract_from_tags(page.title_text(), &page.tags, base_url));
     }
 
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
+
+/// Extract all standard meta tags from an already parsed document
+///
+/// Covers the `<title>`, `<meta>` tags such as description, robots and
+/// viewport, and `<link>` tags such as canonical, icons and feeds.
+pub fn extract_from_document(document: &Html, base_url: Option<&str>) -> Result<MetaTags> {
+    let head = scanner::DocumentHead::new(document);
+    Ok(extract_from_tags(head.title, &head.tags, base_url))
+}
+
+/// Build [`MetaTags`] from the page title and its `<html>`, `<meta>` and `<link>` tags
+pub fn extract_from_tags<T: TagAttributes>(
+    title: Option<String>,
+    tags: &[T],
+    base_url: Option<&str>,
+) -> MetaTags {
+    let mut meta = MetaTags { title, ..Default::default() };
+
+    let metas = || tags.iter().filter(|t| t.tag_name() == "meta");
+
     // Extract charset
-    if let Ok(selector) = html_utils::create_selector("meta[charset]") {
-        meta.charset =
-            document.select(&selector).next().and_then(|e| html_utils::get_attr(&e, "charset"));
-    }
+    meta.charset = metas().find_map(|t| t.attr("charset")).map(str::to_string);
 
     // Extract charset from Content-Type
     if meta.charset.is_none() {
-        if let Ok(selector) = html_utils::create_selector(r#"meta[http-equiv="Content-Type"]"#) {
-            meta.charset = document
-                .select(&selector)
-                .next()
-                .and_then(|e| html_utils::get_attr(&e, "content"))
-                .and_then(|content| {
-                    // Extract charset from "text/html; charset=UTF-8"
-                    content.split("charset=").nth(1).map(|s| s.trim().to_string())
-                });
-        }
+        meta.charset = metas()
+            .find(|t| t.attr("http-equiv").is_some_and(|v| v.eq_ignore_ascii_case("content-type")))
+            .and_then(|t| t.attr("content"))
+            .and_then(|content| {
+                // Extract charset from "text/html; charset=UTF-8"
+                content.split("charset=").nth(1).map(|s| s.trim().to_string())
+            });
     }
 
     // Extract language from html tag
-    if let Ok(selector) = html_utils::create_selector("html[lang]") {
-        meta.language =
-            document.select(&selector).next().and_then(|e| html_utils::get_attr(&e, "lang"));
-    }
+    meta.language = tags
+        .iter()
+        .filter(|t| t.tag_name() == "html")
+        .find_map(|t| t.attr("lang"))
+        .map(str::to_string);
 
     // Extract meta name tags
-    if let Ok(selector) = html_utils::create_selector("meta[name][content]") {
-        for element in document.select(&selector) {
-            if let (Some(name), Some(content)) =
-                (html_utils::get_attr(&element, "name"), html_utils::get_attr(&element, "content"))
-            {
-                let content = content.trim().to_string();
-                if content.is_empty() {
+    for element in metas() {
+        if let (Some(name), Some(content)) = (element.attr("name"), element.attr("content")) {
+            let content = html_utils::trim_text(content);
+            if content.is_empty() {
+                continue;
+            }
+
+            let field = match &*html_utils::lowercase(name) {
+                "description" => &mut meta.description,
+                "keywords" => {
+                    meta.keywords = Some(
+                        content
+                            .split(',')
+                            .map(str::trim)
+                            .filter(|s| !s.is_empty())
+                            .map(str::to_string)
+                            .collect(),
+                    );
                     continue;
                 }
-
-                match name.to_lowercase().as_str() {
-                    "description" => meta.description = Some(content),
-                    "keywords" => {
-                        meta.keywords = Some(
-                            content
-                                .split(',')
-                                .map(|s| s.trim().to_string())
-                                .filter(|s| !s.is_empty())
-                                .collect(),
-                        );
-                    }
-                    "author" => meta.author = Some(content),
-                    "generator" => meta.generator = Some(content),
-                    "viewport" => meta.viewport = Some(content),
-                    "theme-color" => meta.theme_color = Some(content),
-                    "application-name" => meta.application_name = Some(content),
-                    "referrer" => meta.referrer = Some(content),
-                    "robots" => meta.robots = Some(RobotsDirective::parse(&content)),
-                    "googlebot" => meta.googlebot = Some(RobotsDirective::parse(&content)),
-                    // Site verification tags (Phase 6)
-                    "google-site-verification" => meta.google_site_verification = Some(content),
-                    "google-signin-client_id" => meta.google_signin_client_id = Some(content),
-                    "msvalidate.01" => meta.msvalidate_01 = Some(content),
-                    "yandex-verification" => meta.yandex_verification = Some(content),
-                    "p:domain_verify" => meta.p_domain_verify = Some(content),
-                    "facebook-domain-verification" => {
-                        meta.facebook_domain_verification = Some(content)
-                    }
-                    // Analytics tags (Phase 6)
-                    "google-analytics" => meta.google_analytics = Some(content),
-                    // PWA meta tags (Phase 8)
-                    "mobile-web-app-capable" => meta.mobile_web_app_capable = Some(content),
-                    // Apple mobile meta tags (Phase 8)
-                    "apple-mobile-web-app-capable" => {
-                        meta.apple_mobile_web_app_capable = Some(content)
-                    }
-                    "apple-mobile-web-app-status-bar-style" => {
-                        meta.apple_mobile_web_app_status_bar_style = Some(content)
-                    }
-                    "apple-mobile-web-app-title" => meta.apple_mobile_web_app_title = Some(content),
-                    // Mobile App Links (Phase 8)
-                    "apple-itunes-app" => meta.apple_itunes_app = Some(content),
-                    "google-play-app" => meta.google_play_app = Some(content),
-                    "format-detection" => meta.format_detection = Some(content),
-                    // Microsoft/Windows meta tags (Phase 8)
-                    "msapplication-tilecolor" => meta.msapplication_tile_color = Some(content),
-                    "msapplication-tileimage" => meta.msapplication_tile_image = Some(content),
-                    "msapplication-config" => meta.msapplication_config = Some(content),
-                    _ => {}
+                "author" => &mut meta.author,
+                "generator" => &mut meta.generator,
+                "viewport" => &mut meta.viewport,
+                "theme-color" => &mut meta.theme_color,
+                "application-name" => &mut meta.application_name,
+                "referrer" => &mut meta.referrer,
+                "robots" => {
+                    meta.robots = Some(RobotsDirective::parse(content));
+                    continue;
                 }
-            }
+                "googlebot" => {
+                    meta.googlebot = Some(RobotsDirective::parse(content));
+                    continue;
+                }
+                // Site verification tags (Phase 6)
+                "google-site-verification" => &mut meta.google_site_verification,
+                "google-signin-client_id" => &mut meta.google_signin_client_id,
+                "msvalidate.01" => &mut meta.msvalidate_01,
+                "yandex-verification" => &mut meta.yandex_verification,
+                "p:domain_verify" => &mut meta.p_domain_verify,
+                "facebook-domain-verification" => &mut meta.facebook_domain_verification,
+                // Analytics tags (Phase 6)
+                "google-analytics" => &mut meta.google_analytics,
+                // PWA meta tags (Phase 8)
+                "mobile-web-app-capable" => &mut meta.mobile_web_app_capable,
+                // Apple mobile meta tags (Phase 8)
+                "apple-mobile-web-app-capable" => &mut meta.apple_mobile_web_app_capable,
+                "apple-mobile-web-app-status-bar-style" => {
+                    &mut meta.apple_mobile_web_app_status_bar_style
+                }
+                "apple-mobile-web-app-title" => &mut meta.apple_mobile_web_app_title,
+                // Mobile App Links (Phase 8)
+                "apple-itunes-app" => &mut meta.apple_itunes_app,
+                "google-play-app" => &mut meta.google_play_app,
+                "format-detection" => &mut meta.format_detection,
+                // Microsoft/Windows meta tags (Phase 8)
+                "msapplication-tilecolor" => &mut meta.msapplication_tile_color,
+                "msapplication-tileimage" => &mut meta.msapplication_tile_image,
+                "msapplication-config" => &mut meta.msapplication_config,
+                _ => continue,
+            };
+            // Only values of known names are copied out of the tag
+            *field = Some(content.to_string());
         }
     }
 
     // Extract link tags
-    if let Ok(selector) = html_utils::create_selector("link[rel][href]") {
-        for element in document.select(&selector) {
-            if let (Some(rel), Some(href)) =
-                (html_utils::get_attr(&element, "rel"), html_utils::get_attr(&element, "href"))
-            {
-                let resolved_href = url_utils::resolve_url(base_url, &href).unwrap_or(href.clone());
-
-                match rel.to_lowercase().as_str() {
-                    "canonical" => {
-                        if meta.canonical.is_none() {
-                            meta.canonical = Some(resolved_href);
-                        }
+    for element in tags.iter().filter(|t| t.tag_name() == "link") {
+        if let (Some(rel), Some(href)) = (element.attr("rel"), element.attr("href")) {
+            // Stylesheets, preloads and other unknown rels are never resolved
+            let resolve =
+                || url_utils::resolve_url(base_url, href).unwrap_or_else(|_| href.to_string());
+
+            match &*html_utils::lowercase(rel) {
+                "canonical" => {
+                    if meta.canonical.is_none() {
+                        meta.canonical = Some(resolve());
                     }
-                    "shortlink" => {
-                        meta.shortlink = Some(resolved_href);
+                }
+                "shortlink" => {
+                    meta.shortlink = Some(resolve());
+                }
+                "icon" => {
+                    if meta.icon.is_none() {
+                        meta.icon = Some(resolve());
                     }
-                    "icon" => {
-                        if meta.icon.is_none() {
-                            meta.icon = Some(resolved_href);
-                        }
+                }
+                "apple-touch-icon" => {
+                    if meta.apple_touch_icon.is_none() {
+                        meta.apple_touch_icon = Some(resolve());
                     }
-                    "apple-touch-icon" => {
-                        if meta.apple_touch_icon.is_none() {
-                            meta.apple_touch_icon = Some(resolved_href);
+                }
+                "manifest" => {
+                    meta.manifest = Some(resolve());
+                }
+                "prev" => {
+                    meta.prev = Some(resolve());
+                }
+                "next" => {
+                    meta.next = Some(resolve());
+                }
+                "alternate" => {
+                    let resolved_href = resolve();
+                    // Check if it's a feed or translation
+                    let link_type = element.attr("type");
+
+                    if let Some(t) = link_type {
+                        if t.contains("rss") || t.contains("atom") {
+                            // It's a feed
+                            meta.feeds.push(FeedLink {
+                                href: resolved_href,
+                                title: element.attr("title").map(str::to_string),
+                                r#type: t.to_string(),
+                            });
+                            continue;
                         }
                     }
-                    "manifest" => {
-                        meta.manifest = Some(resolved_href);
-                    }
-                    "prev" => {
-                        meta.prev = Some(resolved_href);
-                    }
-                    "next" => {
-                        meta.next = Some(resolved_href);
-                    }
-                    "alternate" => {
-                        // Check if it's a feed or translation
-                        let link_type = html_utils::get_attr(&element, "type");
-
-                        if let Some(ref t) = link_type {
-                            if t.contains("rss") || t.contains("atom") {
-                                // It's a feed
-                                meta.feeds.push(FeedLink {
-                                    href: resolved_href,
-                                    title: html_utils::get_attr(&element, "title"),
-                                    r#type: t.clone(),
-                                });
-                                continue;
-                            }
-                        }
 
-                        // It's an alternate link (translation/mobile/etc.)
-                        meta.alternate.push(AlternateLink {
-                            href: resolved_href,
-                            hreflang: html_utils::get_attr(&element, "hreflang"),
-                            media: html_utils::get_attr(&element, "media"),
-                            r#type: link_type,
-                        });
-                    }
-                    _ => {}
+                    // It's an alternate link (translation/mobile/etc.)
+                    meta.alternate.push(AlternateLink {
+                        href: resolved_href,
+                        hreflang: element.attr("hreflang").map(str::to_string),
+                        media: element.attr("media").map(str::to_string),
+                        r#type: link_type.map(str::to_string),
+                    });
                 }
+                _ => {}
             }
         }
     }
 
     // Extract meta property tags (for Facebook, etc.)
-    if let Ok(selector) = html_utils::create_selector("meta[property][content]") {
-        for element in document.select(&selector) {
-            if let (Some(property), Some(content)) = (
-                html_utils::get_attr(&element, "property"),
-                html_utils::get_attr(&element, "content"),
-            ) {
-                let content = content.trim().to_string();
-                if content.is_empty() {
-                    continue;
-                }
+    for element in metas() {
+        if let (Some(property), Some(content)) = (element.attr("property"), element.attr("content"))
+        {
+            let content = html_utils::trim_text(content);
+            if content.is_empty() {
+                continue;
+            }
 
-                match property.to_lowercase().as_str() {
-                    "fb:app_id" => meta.fb_app_id = Some(content),
-                    "fb:pages" => meta.fb_pages = Some(content),
-                    _ => {}
-                }
+            match &*html_utils::lowercase(property) {
+                "fb:app_id" => meta.fb_app_id = Some(content.to_string()),
+                "fb:pages" => meta.fb_pages = Some(content.to_string()),
+                _ => {}
             }
         }
     }
 
-    Ok(meta)
+    meta
 }
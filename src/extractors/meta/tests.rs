@@ -815,4 +815,50 @@ mod meta_extraction_tests {
         let meta = extract(html, Some("https://example.com/subdir/")).unwrap();
         assert_eq!(meta.icon, Some("https://example.com/subdir/favicon.ico".to_string()));
     }
+
+    // ========== SCANNER / DOM PARITY ==========
+
+    fn extract_with_dom(html: &str, base_url: Option<&str>) -> MetaTags {
+        let document = crate::extractors::common::html_utils::parse_html(html);
+        super::super::extract_from_document(&document, base_url).unwrap()
+    }
+
+    #[test]
+    fn test_scanner_matches_dom() {
+        let html = r#"<!DOCTYPE html>
+            <HTML LANG="en-GB">
+            <head>
+                <meta http-equiv="content-type" content="text/html; charset=ISO-8859-1">
+                <title> Caf&#233;s &amp; Bars </title>
+                <!-- <meta name="description" content="hidden"> -->
+                <META NAME="Description" CONTENT="  Best &quot;bars&quot;  ">
+                <meta name=keywords content='a, b,, c'>
+                <meta name="robots" content="noindex, nofollow">
+                <meta property="fb:app_id" content="123">
+                <link rel=canonical href=/page>
+                <link rel="alternate" type="application/rss+xml" title="Feed" href="/feed">
+                <link rel="alternate" hreflang="de" href="/de/">
+                <script>document.write('<meta name="author" content="x">')</script>
+            </head>
+            <body><meta name="author" content="Jane"></body>
+            </HTML>"#;
+
+        let scanned = extract(html, Some("https://example.com/")).unwrap();
+        assert_eq!(scanned, extract_with_dom(html, Some("https://example.com/")));
+        assert_eq!(scanned.author, Some("Jane".to_string()));
+        assert_eq!(scanned.language, Some("en-GB".to_string()));
+        assert_eq!(scanned.charset, Some("ISO-8859-1".to_string()));
+    }
+
+    #[test]
+    fn test_scanner_fallback_matches_dom() {
+        // Tables make the scanner defer to the full parser
+        let html = r#"
+            <title>Title</title>
+            <table><tr><td><meta name="description" content="In a table"></td></tr></table>
+        "#;
+        let meta = extract(html, None).unwrap();
+        assert_eq!(meta, extract_with_dom(html, None));
+        assert_eq!(meta.description, Some("In a table".to_string()));
+    }
 }
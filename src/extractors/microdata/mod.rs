@@ -5,8 +5,9 @@
 
 use crate::errors::Result;
 use crate::extractors::common::{html_utils, url_utils};
+use crate::static_selector;
 use crate::types::microdata::MicrodataItem;
-use scraper::{ElementRef, Selector};
+use scraper::{ElementRef, Html};
 
 #[cfg(test)]
 mod tests;
@@ -22,13 +23,26 @@ mod tests;
 /// # Returns
 /// * `Result<Vec<MicrodataItem>>` - All microdata items found
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<Vec<MicrodataItem>> {
-    let document = html_utils::parse_html(html);
+    if !html_utils::has_markup(html) {
+        return Ok(Default::default());
+    }
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
+
+/// Extract all microdata items from an already parsed document
+///
+/// Returns one item per top-level `itemscope` element; nested scopes become
+/// property values of their parent.
+pub fn extract_from_document(
+    document: &Html,
+    base_url: Option<&str>,
+) -> Result<Vec<MicrodataItem>> {
     let mut items = Vec::new();
 
     // Find all top-level itemscope elements (not nested)
-    let itemscope_selector = Selector::parse("[itemscope]").unwrap();
+    let itemscope_selector = static_selector!("[itemscope]");
 
-    for element in document.select(&itemscope_selector) {
+    for element in document.select(itemscope_selector) {
         // Skip if this is a nested itemscope (will be handled as property)
         if !is_top_level_itemscope(&element) {
             continue;
@@ -206,6 +220,7 @@ fn is_url_property(tag_name: &str, element: &ElementRef) -> bool {
 #[cfg(test)]
 mod unit_tests {
     use super::*;
+    use scraper::Selector;
 
     #[test]
     fn test_is_url_property() {
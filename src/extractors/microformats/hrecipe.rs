@@ -1,5 +1,9 @@
+use crate::extractors::common::{html_utils, url_utils};
+use crate::extractors::scanner::{self, Event, TagAttributes};
 use crate::microformat_extractor;
 use crate::types::HRecipe;
+use crate::Result;
+use std::borrow::Cow;
 
 microformat_extractor! {
     HRecipe, ".h-recipe" {
@@ -17,6 +21,214 @@ microformat_extractor! {
     }
 }
 
+/// How a property value is read from its element in [`extract_streaming`]
+#[derive(Clone, Copy)]
+enum Property {
+    /// Text content of the first matching element
+    Text(fn(&mut HRecipe) -> &mut Option<String>),
+    /// Text content of every matching element
+    MultiText(fn(&mut HRecipe) -> &mut Vec<String>),
+    /// `href` or `src` of the first matching element
+    Url(fn(&mut HRecipe) -> &mut Option<String>),
+    /// `datetime` attribute of the first matching element, else its text
+    Date(fn(&mut HRecipe) -> &mut Option<String>),
+}
+
+/// The properties of the extractor above, keyed by class name
+const PROPERTIES: [(&str, Property); 11] = [
+    ("p-name", Property::Text(|r| &mut r.name)),
+    ("p-summary", Property::Text(|r| &mut r.summary)),
+    ("p-ingredient", Property::MultiText(|r| &mut r.ingredient)),
+    ("e-instructions", Property::Text(|r| &mut r.instructions)),
+    ("p-duration", Property::Text(|r| &mut r.duration)),
+    ("p-yield", Property::Text(|r| &mut r.yield_)),
+    ("p-nutrition", Property::Text(|r| &mut r.nutrition)),
+    ("u-photo", Property::Url(|r| &mut r.photo)),
+    ("p-author", Property::Text(|r| &mut r.author)),
+    ("dt-published", Property::Date(|r| &mut r.published)),
+    ("p-category", Property::MultiText(|r| &mut r.category)),
+];
+
+/// Extract h-recipe items in a single streaming pass over the raw HTML
+///
+/// Recipes are assembled from [`scanner::walk`] events as their elements
+/// close, so no DOM is built and only the text of the properties currently
+/// being read is buffered. Documents the walker cannot follow exactly are
+/// passed to [`extract`]; either way the result is the same.
+pub fn extract_streaming(html: &str, base_url: Option<&str>) -> Result<Vec<HRecipe>> {
+    if !html_utils::may_match_selector(html, ROOT_SELECTOR) {
+        return Ok(Vec::new());
+    }
+    match stream_recipes(html, base_url) {
+        Some(recipes) => Ok(recipes),
+        None => extract(html, base_url),
+    }
+}
+
+/// An h-recipe root whose element is still open
+struct OpenRecipe {
+    item: HRecipe,
+    /// Position of the root element in the list of roots, in document order
+    slot: usize,
+    depth: usize,
+    /// Single-valued properties already taken by an earlier element
+    claimed: [bool; PROPERTIES.len()],
+    /// Multi-valued property values in the document order of their elements
+    multi: Vec<(usize, Option<String>)>,
+}
+
+/// Text being collected for a property element that is still open
+struct Capture<'a> {
+    recipe: usize,
+    property: usize,
+    /// Index into `OpenRecipe::multi` for multi-valued properties
+    multi: Option<usize>,
+    depth: usize,
+    /// Borrows the input while the element has a single text run, so the
+    /// value is only copied once, after trimming
+    text: Cow<'a, str>,
+}
+
+fn stream_recipes(html: &str, base_url: Option<&str>) -> Option<Vec<HRecipe>> {
+    let mut slots: Vec<Option<HRecipe>> = Vec::new();
+    let mut open: Vec<OpenRecipe> = Vec::new();
+    let mut captures: Vec<Capture<'_>> = Vec::new();
+    let mut depth = 0;
+
+    scanner::walk(html, |event| match event {
+        Event::Start(tag) => {
+            depth += 1;
+            let class = tag.attr("class").unwrap_or("");
+            if class.is_empty() {
+                return;
+            }
+            // Resolve the class tokens to properties once, not once per enclosing recipe
+            let properties = if open.is_empty() { 0 } else { property_mask(class) };
+
+            // A root is not a property of itself, so match enclosing roots first
+            for (index, recipe) in open.iter_mut().enumerate() {
+                for property in (0..PROPERTIES.len()).filter(|p| properties & 1 << p != 0) {
+                    let capture = |multi| Capture {
+                        recipe: index,
+                        property,
+                        multi,
+                        depth,
+                        text: Cow::Borrowed(""),
+                    };
+                    match PROPERTIES[property].1 {
+                        Property::MultiText(_) => {
+                            recipe.multi.push((property, None));
+                            captures.push(capture(Some(recipe.multi.len() - 1)));
+                        }
+                        _ if recipe.claimed[property] => {}
+                        Property::Text(_) => {
+                            recipe.claimed[property] = true;
+                            captures.push(capture(None));
+                        }
+                        Property::Date(field) => {
+                            recipe.claimed[property] = true;
+                            match tag.attr("datetime") {
+                                Some(datetime) => *field(&mut recipe.item) = Some(datetime.into()),
+                                None => captures.push(capture(None)),
+                            }
+                        }
+                        Property::Url(field) => {
+                            recipe.claimed[property] = true;
+                            if let Some(url) = tag.attr("href").or_else(|| tag.attr("src")) {
+                                *field(&mut recipe.item) = Some(resolve(base_url, url));
+                            }
+                        }
+                    }
+                }
+            }
+
+            if class.split_whitespace().any(|token| token == "h-recipe") {
+                open.push(OpenRecipe {
+                    item: HRecipe::default(),
+                    slot: slots.len(),
+                    depth,
+                    claimed: [false; PROPERTIES.len()],
+                    multi: Vec::new(),
+                });
+                slots.push(None);
+            }
+        }
+        Event::Text(text) => {
+            for capture in &mut captures {
+                if capture.text.is_empty() {
+                    capture.text = text.clone();
+                } else {
+                    capture.text.to_mut().push_str(&text);
+                }
+            }
+        }
+        Event::End => {
+            while captures.last().is_some_and(|capture| capture.depth == depth) {
+                let Some(capture) = captures.pop() else { break };
+                let text = match capture.text {
+                    Cow::Borrowed(text) => html_utils::trim_text(text).to_string(),
+                    Cow::Owned(text) => html_utils::trim_string(text),
+                };
+                let value = if text.is_empty() { None } else { Some(text) };
+                let recipe = &mut open[capture.recipe];
+                match (capture.multi, PROPERTIES[capture.property].1) {
+                    (Some(index), _) => recipe.multi[index].1 = value,
+                    (None, Property::Text(field) | Property::Date(field)) => {
+                        *field(&mut recipe.item) = value
+                    }
+                    (None, _) => {}
+                }
+            }
+
+            if open.last().is_some_and(|recipe| recipe.depth == depth) {
+                if let Some(mut recipe) = open.pop() {
+                    // Every value is known now, so size each list once instead
+                    // of letting it grow while the values are moved in
+                    let mut counts = [0; PROPERTIES.len()];
+                    for (property, value) in &recipe.multi {
+                        counts[*property] += usize::from(value.is_some());
+                    }
+                    for (property, count) in counts.into_iter().enumerate() {
+                        if let (Property::MultiText(field), 1..) = (PROPERTIES[property].1, count) {
+                            field(&mut recipe.item).reserve_exact(count);
+                        }
+                    }
+                    for (property, value) in recipe.multi.drain(..) {
+                        if let (Property::MultiText(field), Some(value)) =
+                            (PROPERTIES[property].1, value)
+                        {
+                            field(&mut recipe.item).push(value);
+                        }
+                    }
+                    slots[recipe.slot] = Some(recipe.item);
+                }
+            }
+            depth -= 1;
+        }
+    })?;
+
+    Some(slots.into_iter().flatten().collect())
+}
+
+/// Bit set of the [`PROPERTIES`] named by the tokens of a class attribute
+fn property_mask(class: &str) -> u32 {
+    const _: () = assert!(PROPERTIES.len() <= u32::BITS as usize);
+    class.split_whitespace().fold(0, |mask, token| {
+        match PROPERTIES.iter().position(|(name, _)| *name == token) {
+            Some(property) => mask | 1 << property,
+            None => mask,
+        }
+    })
+}
+
+/// Resolve a property URL the same way as the `url` property of the extractor macro
+fn resolve(base_url: Option<&str>, url: &str) -> String {
+    match base_url {
+        Some(base) => url_utils::resolve_url(Some(base), url).unwrap_or_else(|_| url.to_string()),
+        None => url.to_string(),
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -141,4 +353,62 @@ mod tests {
         let recipes = extract(html, None).unwrap();
         assert_eq!(recipes.len(), 0);
     }
+
+    fn to_json(recipes: &[HRecipe]) -> serde_json::Value {
+        serde_json::to_value(recipes).unwrap()
+    }
+
+    #[test]
+    fn test_streaming_matches_dom_extraction() {
+        let html = r#"
+            <html><head><title>Recipes</title></head><body>
+            <div class="h-recipe">
+                <h1 class="p-name"> Pancakes &amp; Syrup </h1>
+                <ul>
+                    <li class="p-ingredient">Flour</li>
+                    <li class="p-ingredient"> </li>
+                    <li class="p-ingredient">Milk <b>2%</b></li>
+                </ul>
+                <img class="u-photo" src="/pancakes.jpg">
+                <time class="dt-published" datetime="2024-01-15">January 15</time>
+                <span class="p-name">Not the name</span>
+                <div class="e-instructions">
+                    Mix and fry.
+                </div>
+                <div class="h-recipe p-category">
+                    <span class="p-name">Syrup</span>
+                    <span class="p-category">Sauce</span>
+                </div>
+            </div>
+            <div class="h-recipe"><span class="dt-published">Yesterday</span></div>
+            </body></html>
+        "#;
+
+        let streamed = stream_recipes(html, Some("https://example.com")).unwrap();
+        let parsed = extract(html, Some("https://example.com")).unwrap();
+        assert_eq!(to_json(&streamed), to_json(&parsed));
+        assert_eq!(streamed.len(), 3);
+        assert_eq!(streamed[0].ingredient, vec!["Flour", "Milk 2%"]);
+        assert_eq!(streamed[0].category.len(), 2);
+        assert_eq!(streamed[1].category, vec!["Sauce"]);
+    }
+
+    #[test]
+    fn test_streaming_falls_back_to_dom() {
+        // The unclosed <p> is closed by the <div>, which the walker leaves to the parser
+        let html = r#"<div class="h-recipe">
+            <p class="p-summary">Easy<div class="p-name">Soup</div>
+        </div>"#;
+
+        assert!(stream_recipes(html, None).is_none());
+        let recipes = extract_streaming(html, None).unwrap();
+        assert_eq!(to_json(&recipes), to_json(&extract(html, None).unwrap()));
+        assert_eq!(recipes[0].summary, Some("Easy".to_string()));
+    }
+
+    #[test]
+    fn test_streaming_no_recipes() {
+        let html = "<html><body><p>No recipes here</p></body></html>";
+        assert!(extract_streaming(html, None).unwrap().is_empty());
+    }
 }
@@ -128,6 +128,36 @@ mod tests {
         assert_eq!(reviews[1].summary, Some("Review 2".to_string()));
     }
 
+    #[test]
+    fn test_hreview_with_nested_items() {
+        // The reviewer sits in a table cell, which would not survive being
+        // serialized and parsed again on its own
+        let html = r#"
+            <div class="h-review">
+                <table><tr>
+                    <td class="p-reviewer h-card">
+                        <span class="p-name">Jane Doe</span>
+                        <a class="u-url" href="/jane">Profile</a>
+                    </td>
+                </tr></table>
+                <div class="p-item h-product">
+                    <span class="p-name">Laptop</span>
+                    <span class="p-brand">Acme</span>
+                </div>
+            </div>
+        "#;
+
+        let reviews = extract(html, Some("https://example.com")).unwrap();
+        let card = reviews[0].reviewer_card.as_ref().unwrap();
+        assert_eq!(card.name, Some("Jane Doe".to_string()));
+        assert_eq!(card.url, Some("https://example.com/jane".to_string()));
+        assert_eq!(reviews[0].reviewer, None);
+        let product = reviews[0].item_product.as_ref().unwrap();
+        assert_eq!(product.name, Some("Laptop".to_string()));
+        assert_eq!(product.brand, Some("Acme".to_string()));
+        assert_eq!(reviews[0].item, None);
+    }
+
     #[test]
     fn test_hreview_empty() {
         let html = "<html><body><p>No reviews here</p></body></html>";
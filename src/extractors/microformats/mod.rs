@@ -17,3 +17,133 @@ pub mod hreview;
 pub use hcard::extract as extract_hcard;
 pub use hentry::extract as extract_hentry;
 pub use hevent::extract as extract_hevent;
+
+use crate::extractors::common::html_utils::{ElementRef, Html};
+
+/// Root elements of every supported microformat type, in document order
+#[derive(Debug, Default)]
+pub struct MicroformatRoots<'a> {
+    pub hcard: Vec<ElementRef<'a>>,
+    pub hentry: Vec<ElementRef<'a>>,
+    pub hevent: Vec<ElementRef<'a>>,
+    pub hreview: Vec<ElementRef<'a>>,
+    pub hrecipe: Vec<ElementRef<'a>>,
+    pub hproduct: Vec<ElementRef<'a>>,
+    pub hfeed: Vec<ElementRef<'a>>,
+    pub hadr: Vec<ElementRef<'a>>,
+    pub hgeo: Vec<ElementRef<'a>>,
+}
+
+/// Locate the roots of every supported microformat type in a single traversal
+///
+/// Equivalent to running each extractor's root selector separately, but the
+/// tree is walked once and every class token is classified by a single match
+/// instead of testing nine selector alternatives per element. Feed the result
+/// to the per-type `extract_from_roots` functions.
+pub fn find_roots(document: &Html) -> MicroformatRoots<'_> {
+    let mut roots = MicroformatRoots::default();
+    for element in document.root_element().descendants().filter_map(ElementRef::wrap) {
+        for class in element.value().classes() {
+            let list = match class {
+                "h-card" => &mut roots.hcard,
+                "h-entry" => &mut roots.hentry,
+                "h-event" => &mut roots.hevent,
+                "h-review" => &mut roots.hreview,
+                "h-recipe" => &mut roots.hrecipe,
+                "h-product" => &mut roots.hproduct,
+                "h-feed" => &mut roots.hfeed,
+                "h-adr" => &mut roots.hadr,
+                "h-geo" => &mut roots.hgeo,
+                _ => continue,
+            };
+            // A repeated class token must not record the element twice
+            if list.last().map(|last| last.id()) != Some(element.id()) {
+                list.push(element);
+            }
+        }
+    }
+    roots
+}
+
+/// Class names referenced by any microformat root or property selector
+///
+/// Used to build a warm-up document that exercises every selector.
+pub fn selector_classes() -> Vec<&'static str> {
+    let selectors = [
+        (hcard::ROOT_SELECTOR, hcard::PROPERTY_SELECTORS),
+        (hentry::ROOT_SELECTOR, hentry::PROPERTY_SELECTORS),
+        (hevent::ROOT_SELECTOR, hevent::PROPERTY_SELECTORS),
+        (hreview::ROOT_SELECTOR, hreview::PROPERTY_SELECTORS),
+        (hrecipe::ROOT_SELECTOR, hrecipe::PROPERTY_SELECTORS),
+        (hproduct::ROOT_SELECTOR, hproduct::PROPERTY_SELECTORS),
+        (hfeed::ROOT_SELECTOR, hfeed::PROPERTY_SELECTORS),
+        (hadr::ROOT_SELECTOR, hadr::PROPERTY_SELECTORS),
+        (hgeo::ROOT_SELECTOR, hgeo::PROPERTY_SELECTORS),
+    ];
+
+    let mut classes: Vec<&'static str> = selectors
+        .iter()
+        .flat_map(|(root, properties)| std::iter::once(*root).chain(properties.iter().copied()))
+        .flat_map(|selector| selector.split(|c: char| c == ',' || c == '.' || c.is_whitespace()))
+        .filter(|class| !class.is_empty())
+        .collect();
+    classes.sort_unstable();
+    classes.dedup();
+    classes
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::extractors::common::html_utils;
+
+    fn to_json<T: serde::Serialize>(items: Vec<T>) -> serde_json::Value {
+        serde_json::to_value(items).unwrap()
+    }
+
+    #[test]
+    fn test_selector_classes() {
+        let classes = selector_classes();
+        for class in ["h-card", "h-recipe", "p-name", "p-ingredient", "e-description", "p-reviewer"]
+        {
+            assert!(classes.contains(&class), "{class}");
+        }
+        assert!(classes.iter().all(|c| !c.is_empty() && !c.contains(['.', ',', ' '])));
+    }
+
+    #[test]
+    fn test_find_roots_matches_per_type_selectors() {
+        let html = r#"
+            <div class="h-card h-card"><span class="p-name">Jane</span></div>
+            <article class="h-entry">
+                <span class="p-author h-card"><span class="p-name">Nested</span></span>
+            </article>
+            <div class="h-product h-review"><span class="p-name">Widget</span></div>
+            <div class="h-adr"><div class="h-geo"><span class="p-latitude">1.5</span></div></div>
+            <div class="not-h-card">Ignored</div>
+        "#;
+        let document = html_utils::parse_html(html);
+        let roots = find_roots(&document);
+
+        assert_eq!(roots.hcard.len(), 2);
+        assert_eq!(roots.hentry.len(), 1);
+        assert_eq!(roots.hproduct.len(), 1);
+        assert_eq!(roots.hreview.len(), 1);
+        assert_eq!(roots.hadr.len(), 1);
+        assert_eq!(roots.hgeo.len(), 1);
+        assert!(roots.hevent.is_empty() && roots.hrecipe.is_empty() && roots.hfeed.is_empty());
+
+        assert_eq!(
+            to_json(hcard::extract_from_roots(&roots.hcard, None)),
+            to_json(hcard::extract_from_document(&document, None).unwrap())
+        );
+        assert_eq!(
+            to_json(hproduct::extract_from_roots(&roots.hproduct, None)),
+            to_json(hproduct::extract_from_document(&document, None).unwrap())
+        );
+        assert_eq!(
+            to_json(hgeo::extract_from_roots(&roots.hgeo, None)),
+            to_json(hgeo::extract_from_document(&document, None).unwrap())
+        );
+    }
+}
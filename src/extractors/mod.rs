@@ -8,8 +8,18 @@
 //! - Phase 5: oEmbed (content embedding)
 //! - Phase 7: Microformats (5-10% adoption)
 //! - Phase 9: Dublin Core (archives and digital libraries)
+//!
+//! Every extractor module exposes `extract`, which parses the HTML it is given,
+//! and `extract_from_document`, which reads an already parsed [`scraper::Html`].
+//! Callers that run several extractors over one page (`extract_all`, the Python
+//! `Document` class) parse it once and pass the same tree to each of them.
+//!
+//! The meta, Open Graph, Twitter Card, Dublin Core and JSON-LD extractors first
+//! try the lightweight tag scanner in [`scanner`] and only build a full DOM for
+//! documents it declines.
 
 pub mod common;
+pub mod scanner;
 
 // Phase 1: Standard Meta Tags (100% adoption) - IMPLEMENTED
 pub mod meta;
@@ -44,3 +54,66 @@ pub mod rel_links;
 // Re-export microformats extractors for backward compatibility
 #[allow(unused_imports)]
 pub use microformats::{extract_hcard, extract_hentry, extract_hevent};
+
+/// Compile every cached selector ahead of the first real extraction
+///
+/// Selectors are compiled lazily the first time each code path runs. Calling
+/// this once at startup, e.g. before forking worker processes, moves that
+/// cost out of the first requests and lets forked workers share the result.
+pub fn warm_up() {
+    let classes = microformats::selector_classes().join(" ");
+    let html = format!(
+        r#"<html><head>
+        <title>Warm-up</title>
+        <meta name="description" content="Warm-up">
+        <meta property="og:title" content="Warm-up">
+        <link rel="alternate" type="application/json+oembed" href="/oembed">
+        <link rel="manifest" href="/manifest.json">
+        <script type="application/ld+json">{{"@type": "Thing"}}</script>
+        </head><body prefix="ex: https://example.com/" vocab="https://schema.org/" typeof="Thing">
+        <div itemscope itemtype="https://schema.org/Thing"><span itemprop="name">Warm-up</span></div>
+        <div class="{classes}"><a class="{classes}" rel="me" href="/me" property="name">Warm-up</a></div>
+        </body></html>"#
+    );
+
+    let document = common::html_utils::parse_html(&html);
+    let _ = meta::extract_from_document(&document, None);
+    let _ = social::twitter::extract_with_fallback_from_document(&document, None);
+    let _ = jsonld::extract_from_document(&document, None);
+    let _ = microdata::extract_from_document(&document, None);
+    let _ = oembed::extract_from_document(&document, None);
+    let _ = dublin_core::extract_from_document(&document);
+    let _ = rdfa::extract_from_document(&document, None);
+    let _ = manifest::extract_from_document(&document, None);
+    let _ = rel_links::extract_from_document(&document, None);
+
+    let roots = microformats::find_roots(&document);
+    microformats::hcard::extract_from_roots(&roots.hcard, None);
+    microformats::hentry::extract_from_roots(&roots.hentry, None);
+    microformats::hevent::extract_from_roots(&roots.hevent, None);
+    microformats::hreview::extract_from_roots(&roots.hreview, None);
+    microformats::hrecipe::extract_from_roots(&roots.hrecipe, None);
+    microformats::hproduct::extract_from_roots(&roots.hproduct, None);
+    microformats::hfeed::extract_from_roots(&roots.hfeed, None);
+    microformats::hadr::extract_from_roots(&roots.hadr, None);
+    microformats::hgeo::extract_from_roots(&roots.hgeo, None);
+
+    let _ = crate::parser::parse_html(&html, None);
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_warm_up_is_idempotent() {
+        warm_up();
+        warm_up();
+        let cards = microformats::hcard::extract(
+            r#"<div class="h-card"><span class="p-name">Jane</span></div>"#,
+            None,
+        )
+        .unwrap();
+        assert_eq!(cards[0].name, Some("Jane".to_string()));
+    }
+}
@@ -5,7 +5,9 @@
 
 use crate::errors::Result;
 use crate::extractors::common::{html_utils, url_utils};
+use crate::static_selector;
 use crate::types::oembed::{OEmbedDiscovery, OEmbedEndpoint, OEmbedFormat};
+use scraper::Html;
 
 #[cfg(test)]
 mod tests;
@@ -19,43 +21,51 @@ mod tests;
 /// # Returns
 /// * `Result<OEmbedDiscovery>` - Discovered oEmbed endpoints or error
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<OEmbedDiscovery> {
-    let document = html_utils::parse_html(html);
+    if !html_utils::has_markup(html) {
+        return Ok(Default::default());
+    }
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
+
+/// Discover oEmbed endpoints in an already parsed document
+///
+/// Collects the JSON and XML endpoints advertised by `<link rel="alternate">` tags.
+pub fn extract_from_document(document: &Html, base_url: Option<&str>) -> Result<OEmbedDiscovery> {
     let mut discovery = OEmbedDiscovery::default();
 
     // Look for link tags with rel="alternate" and type containing "oembed"
-    if let Ok(selector) = html_utils::create_selector("link[rel~=\"alternate\"][type][href]") {
-        for element in document.select(&selector) {
-            if let (Some(link_type), Some(href)) =
-                (html_utils::get_attr(&element, "type"), html_utils::get_attr(&element, "href"))
-            {
-                // Skip empty href attributes
-                if href.trim().is_empty() {
-                    continue;
-                }
+    let selector = static_selector!("link[rel~=\"alternate\"][type][href]");
+    for element in document.select(selector) {
+        if let (Some(link_type), Some(href)) =
+            (html_utils::get_attr(&element, "type"), html_utils::get_attr(&element, "href"))
+        {
+            // Skip empty href attributes
+            if href.trim().is_empty() {
+                continue;
+            }
 
-                let resolved_href = url_utils::resolve_url(base_url, &href).unwrap_or(href.clone());
-                let title = html_utils::get_attr(&element, "title");
+            let resolved_href = url_utils::resolve_url(base_url, &href).unwrap_or(href.clone());
+            let title = html_utils::get_attr(&element, "title");
 
-                // Check for oEmbed types
-                let link_type_lower = link_type.to_lowercase();
-                if link_type_lower.contains("oembed") {
-                    let endpoint = OEmbedEndpoint {
-                        href: resolved_href,
-                        format: if link_type_lower.contains("json") {
-                            OEmbedFormat::Json
-                        } else if link_type_lower.contains("xml") {
-                            OEmbedFormat::Xml
-                        } else {
-                            // Default to JSON if ambiguous
-                            OEmbedFormat::Json
-                        },
-                        title,
-                    };
+            // Check for oEmbed types
+            let link_type_lower = link_type.to_lowercase();
+            if link_type_lower.contains("oembed") {
+                let endpoint = OEmbedEndpoint {
+                    href: resolved_href,
+                    format: if link_type_lower.contains("json") {
+                        OEmbedFormat::Json
+                    } else if link_type_lower.contains("xml") {
+                        OEmbedFormat::Xml
+                    } else {
+                        // Default to JSON if ambiguous
+                        OEmbedFormat::Json
+                    },
+                    title,
+                };
 
-                    match endpoint.format {
-                        OEmbedFormat::Json => discovery.json_endpoints.push(endpoint),
-                        OEmbedFormat::Xml => discovery.xml_endpoints.push(endpoint),
-                    }
+                match endpoint.format {
+                    OEmbedFormat::Json => discovery.json_endpoints.push(endpoint),
+                    OEmbedFormat::Xml => discovery.xml_endpoints.push(endpoint),
                 }
             }
         }
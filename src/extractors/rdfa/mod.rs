@@ -5,6 +5,7 @@
 
 use crate::errors::Result;
 use crate::extractors::common::{html_utils, url_utils};
+use crate::static_selector;
 use crate::types::rdfa::{RdfaItem, RdfaValue};
 use scraper::{ElementRef, Html};
 use std::collections::HashMap;
@@ -100,22 +101,32 @@ impl PrefixContext {
 /// assert_eq!(items.len(), 1);
 /// ```
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<Vec<RdfaItem>> {
-    let doc = html_utils::parse_html(html);
+    if !html_utils::has_markup(html) {
+        return Ok(Default::default());
+    }
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
+
+/// Extract RDFa structured data from an already parsed document
+///
+/// Returns one item per `typeof` or `vocab` root, applying the `prefix`
+/// declarations found anywhere in the document.
+pub fn extract_from_document(doc: &Html, base_url: Option<&str>) -> Result<Vec<RdfaItem>> {
     let mut items = Vec::new();
 
     // Create prefix context with default prefixes
     let mut prefix_ctx = PrefixContext::new();
 
     // Collect all prefix definitions from the document
-    let prefix_selector = html_utils::create_selector("[prefix]")?;
-    for element in doc.select(&prefix_selector) {
+    let prefix_selector = static_selector!("[prefix]");
+    for element in doc.select(prefix_selector) {
         if let Some(prefix_attr) = html_utils::get_attr(&element, "prefix") {
             prefix_ctx.parse_prefix_attr(&prefix_attr);
         }
     }
 
     // Find all RDFa root elements (elements with typeof or vocab)
-    let roots = find_rdfa_roots(&doc)?;
+    let roots = find_rdfa_roots(doc)?;
 
     for root in roots {
         let item = extract_item_with_context(&root, base_url, &prefix_ctx)?;
@@ -132,8 +143,8 @@ fn find_rdfa_roots(doc: &Html) -> Result<Vec<ElementRef<'_>>> {
     let mut roots = Vec::new();
 
     // Find elements with typeof attribute (type declaration)
-    let typeof_selector = html_utils::create_selector("[typeof]")?;
-    for element in doc.select(&typeof_selector) {
+    let typeof_selector = static_selector!("[typeof]");
+    for element in doc.select(typeof_selector) {
         // Only add if not nested within another typeof (we'll handle nesting later)
         if !is_nested_typeof(&element) {
             roots.push(element);
@@ -141,8 +152,8 @@ fn find_rdfa_roots(doc: &Html) -> Result<Vec<ElementRef<'_>>> {
     }
 
     // Find elements with vocab attribute that don't have typeof
-    let vocab_selector = html_utils::create_selector("[vocab]:not([typeof])")?;
-    for element in doc.select(&vocab_selector) {
+    let vocab_selector = static_selector!("[vocab]:not([typeof])");
+    for element in doc.select(vocab_selector) {
         // Only add if not already in roots
         if !roots.iter().any(|r| r.id() == element.id()) {
             roots.push(element);
@@ -18,6 +18,8 @@
 
 use crate::errors::Result;
 use crate::extractors::common::{html_utils, url_utils};
+use crate::static_selector;
+use scraper::Html;
 use std::collections::HashMap;
 
 /// Extract rel-* link relationships from HTML
@@ -31,13 +33,26 @@ use std::collections::HashMap;
 /// # Returns
 /// * `Result<HashMap<String, Vec<String>>>` - Map of rel type to URLs
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<HashMap<String, Vec<String>>> {
-    let document = html_utils::parse_html(html);
+    if !html_utils::has_markup(html) {
+        return Ok(Default::default());
+    }
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
+
+/// Extract rel-* link relationships from an already parsed document
+///
+/// Groups the `href` of every element with a `rel` attribute under each of its
+/// rel tokens.
+pub fn extract_from_document(
+    document: &Html,
+    base_url: Option<&str>,
+) -> Result<HashMap<String, Vec<String>>> {
     let mut rel_links: HashMap<String, Vec<String>> = HashMap::new();
 
     // Find all elements with rel and href attributes (link and a tags)
-    let selector = html_utils::create_selector("[rel][href]")?;
+    let selector = static_selector!("[rel][href]");
 
-    for element in document.select(&selector) {
+    for element in document.select(selector) {
         if let (Some(rel), Some(href)) =
             (html_utils::get_attr(&element, "rel"), html_utils::get_attr(&element, "href"))
         {
@@ -0,0 +1,1453 @@
+//! Lightweight tag scanner for document-level metadata
+//!
+//! Standard meta tags and Dublin Core only need the attributes of `<html>`,
+//! `<meta>` and `<link>` tags plus the text of the first `<title>`, and JSON-LD
+//! only the bodies of its `<script>` elements. Building a full DOM for that is
+//! wasteful, so [`scan`] walks the raw bytes with `memchr`, tokenizing tags and
+//! skipping everything in between.
+//!
+//! The scanner follows the HTML tokenizer rules that matter for these tags:
+//! comments, raw text elements (`<script>`, `<style>`, `<noscript>`, ...),
+//! quoted and unquoted attribute values, duplicate attributes and character
+//! references. When the input contains anything where the tree builder could
+//! drop or reorder elements (foreign content, `<template>`, `<select>`,
+//! framesets, tables) or a character reference the scanner cannot decode
+//! exactly, [`scan`] returns `None` and callers fall back to the full parser,
+//! so results are always identical to DOM-based extraction.
+//!
+//! [`walk`] extends the same tokenizer to the document body, reporting start
+//! tags, end tags and text as a stream of events in DOM order. It declines
+//! (again returning `None`) whenever the tree builder's error recovery would
+//! make the DOM differ from the markup as written: implied or misnested end
+//! tags, stray `</p>` and `</br>`, tables and the other constructs above.
+
+use memchr::{memchr, memmem};
+use std::borrow::Cow;
+
+/// Attribute access shared by scanned tags and parsed DOM elements
+pub trait TagAttributes {
+    /// Lowercased tag name
+    fn tag_name(&self) -> &str;
+
+    /// Value of the named attribute, if present
+    fn attr(&self, name: &str) -> Option<&str>;
+}
+
+impl<T: TagAttributes + ?Sized> TagAttributes for &T {
+    fn tag_name(&self) -> &str {
+        (**self).tag_name()
+    }
+
+    fn attr(&self, name: &str) -> Option<&str> {
+        (**self).attr(name)
+    }
+}
+
+impl TagAttributes for scraper::node::Element {
+    fn tag_name(&self) -> &str {
+        self.name()
+    }
+
+    fn attr(&self, name: &str) -> Option<&str> {
+        scraper::node::Element::attr(self, name)
+    }
+}
+
+/// Collect the `<html>`, `<meta>` and `<link>` elements of a parsed document
+///
+/// This is the DOM counterpart of [`ScannedPage::tags`], used when [`scan`]
+/// declines a document.
+pub fn document_tags(document: &scraper::Html) -> Vec<&scraper::node::Element> {
+    document.select(crate::static_selector!("html, meta, link")).map(|e| e.value()).collect()
+}
+
+/// Room reserved for `<html>`, `<meta>` and `<link>` tags before collecting them
+///
+/// A page head with a charset, viewport, description, a few Open Graph and
+/// Twitter tags and its links fills this without growing the list several
+/// times over.
+const TYPICAL_HEAD_TAGS: usize = 16;
+
+/// Title and head-metadata tags of a parsed document, collected in one walk
+///
+/// `extract_all` hands the same tags to the meta, Open Graph, Twitter and
+/// Dublin Core extractors instead of letting each select them again.
+pub struct DocumentHead<'a> {
+    /// Trimmed text of the first `<title>` element
+    pub title: Option<String>,
+    /// `<html>`, `<meta>` and `<link>` elements in document order
+    pub tags: Vec<&'a scraper::node::Element>,
+}
+
+impl<'a> DocumentHead<'a> {
+    pub fn new(document: &'a scraper::Html) -> Self {
+        let mut head = DocumentHead { title: None, tags: Vec::with_capacity(TYPICAL_HEAD_TAGS) };
+        let mut seen_title = false;
+        for element in document.select(crate::static_selector!("html, meta, link, title")) {
+            if element.value().name() != "title" {
+                head.tags.push(element.value());
+            } else if !seen_title {
+                seen_title = true;
+                head.title = crate::extractors::common::html_utils::extract_text(&element);
+            }
+        }
+        head
+    }
+}
+
+/// A start tag captured by the scanner
+#[derive(Debug, Clone, PartialEq)]
+pub struct ScannedTag<'a> {
+    name: Cow<'a, str>,
+    attrs: Vec<(Cow<'a, str>, Cow<'a, str>)>,
+}
+
+impl TagAttributes for ScannedTag<'_> {
+    fn tag_name(&self) -> &str {
+        &self.name
+    }
+
+    fn attr(&self, name: &str) -> Option<&str> {
+        self.attrs.iter().find(|(n, _)| n == name).map(|(_, v)| v.as_ref())
+    }
+}
+
+/// Metadata tags found by [`scan`]
+#[derive(Debug, Default)]
+pub struct ScannedPage<'a> {
+    /// Raw text of the first `<title>` element, character references decoded
+    pub title: Option<Cow<'a, str>>,
+    /// `<html>`, `<meta>` and `<link>` start tags in document order
+    pub tags: Vec<ScannedTag<'a>>,
+    /// Raw bodies of `<script type="application/ld+json">` elements in document
+    /// order, or `None` when one of them needs the full parser
+    pub json_ld: Option<Vec<&'a str>>,
+}
+
+impl ScannedPage<'_> {
+    /// Trimmed title text, matching `html_utils::extract_text` on the DOM
+    pub fn title_text(&self) -> Option<String> {
+        let title = self.title.as_deref()?.trim();
+        if title.is_empty() {
+            None
+        } else {
+            Some(title.to_string())
+        }
+    }
+}
+
+/// Why scanning stopped before the end of the input
+enum Stop {
+    /// The input ended inside a tag or comment; everything before is valid
+    Eof,
+    /// The document needs the full parser to be handled correctly
+    Unsupported,
+}
+
+/// Scan `html` for `<html>`, `<meta>`, `<link>`, `<title>` and JSON-LD `<script>` tags
+///
+/// Returns `None` when the document contains constructs the scanner does not
+/// model; the caller must then fall back to `html_utils::parse_html`.
+pub fn scan(html: &str) -> Option<ScannedPage<'_>> {
+    let bytes = html.as_bytes();
+
+    // NUL bytes are replaced by the tokenizer; leave those documents to it
+    if memchr(0, bytes).is_some() {
+        return None;
+    }
+
+    let mut page = ScannedPage {
+        title: None,
+        tags: Vec::with_capacity(TYPICAL_HEAD_TAGS),
+        json_ld: Some(Vec::new()),
+    };
+    let mut seen_table = false;
+    let mut pos = 0;
+
+    while let Some(offset) = memchr(b'<', &bytes[pos..]) {
+        let start = pos + offset;
+        let result = match bytes.get(start + 1) {
+            Some(b'!') => skip_markup_declaration(bytes, start + 2),
+            Some(b'?') => skip_bogus_comment(bytes, start + 2),
+            Some(b'/') => skip_end_tag(html, start + 2),
+            Some(c) if c.is_ascii_alphabetic() => {
+                scan_start_tag(html, start + 1, &mut page, &mut seen_table)
+            }
+            _ => Ok(start + 1),
+        };
+
+        match result {
+            Ok(next) => pos = next,
+            Err(Stop::Eof) => break,
+            Err(Stop::Unsupported) => return None,
+        }
+    }
+
+    Some(page)
+}
+
+/// A node event produced by [`walk`]
+#[derive(Debug, Clone, PartialEq)]
+pub enum Event<'a> {
+    /// An element was opened; every `Start` is later matched by an `End`
+    Start(ScannedTag<'a>),
+    /// The innermost open element was closed
+    End,
+    /// Character data inside the innermost open element
+    Text(Cow<'a, str>),
+}
+
+/// Elements that never have content or an end tag
+const VOID_ELEMENTS: &[&str] = &[
+    "area", "base", "basefont", "bgsound", "br", "embed", "hr", "img", "input", "keygen", "link",
+    "meta", "param", "source", "track", "wbr",
+];
+
+/// Elements whose content is raw text rather than markup
+const RAW_TEXT_ELEMENTS: &[&str] =
+    &["script", "style", "noscript", "iframe", "xmp", "noembed", "noframes", "textarea", "title"];
+
+/// Elements that stay in `<head>` when they appear before any body content
+const HEAD_ELEMENTS: &[&str] = &[
+    "base", "basefont", "bgsound", "link", "meta", "noframes", "noscript", "script", "style",
+    "template", "title",
+];
+
+/// Start tags that implicitly close an open `<p>`
+const CLOSES_P: &[&str] = &[
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "center",
+    "details",
+    "dialog",
+    "dir",
+    "div",
+    "dl",
+    "fieldset",
+    "figcaption",
+    "figure",
+    "footer",
+    "header",
+    "hgroup",
+    "main",
+    "menu",
+    "nav",
+    "ol",
+    "p",
+    "search",
+    "section",
+    "summary",
+    "ul",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "pre",
+    "listing",
+    "form",
+    "li",
+    "dd",
+    "dt",
+    "hr",
+    "xmp",
+];
+
+const HEADINGS: &[&str] = &["h1", "h2", "h3", "h4", "h5", "h6"];
+
+/// Start tags the tree builder ignores, renames or moves out of source order
+const UNSUPPORTED_ELEMENTS: &[&str] = &[
+    "svg",
+    "math",
+    "template",
+    "select",
+    "frameset",
+    "frame",
+    "plaintext",
+    "table",
+    "caption",
+    "col",
+    "colgroup",
+    "tbody",
+    "td",
+    "tfoot",
+    "th",
+    "thead",
+    "tr",
+    "image",
+    "isindex",
+    "menuitem",
+    "option",
+    "optgroup",
+    "rb",
+    "rp",
+    "rt",
+    "rtc",
+];
+
+/// Walk `html` as a stream of element and text events in DOM order
+///
+/// Elements that precede the body content (`<meta>`, `<title>`, ...) are
+/// reported at the top level; an explicit `<body>` is reported like any other
+/// element. Returns `None` when the document needs the full parser, in which
+/// case any events already delivered to `sink` must be discarded.
+pub fn walk<'a>(html: &'a str, mut sink: impl FnMut(Event<'a>)) -> Option<()> {
+    let bytes = html.as_bytes();
+    if memchr(0, bytes).is_some() {
+        return None;
+    }
+
+    let mut walker = Walker { html, open: Vec::new(), in_body: false };
+    let mut pos = 0;
+    let mut text_start = 0;
+
+    while let Some(offset) = memchr(b'<', &bytes[pos..]) {
+        let start = pos + offset;
+        let is_markup = match bytes.get(start + 1) {
+            Some(b'!') | Some(b'?') | Some(b'/') => true,
+            Some(c) => c.is_ascii_alphabetic(),
+            None => false,
+        };
+        if !is_markup {
+            // A '<' that does not start a tag is ordinary text
+            pos = start + 1;
+            continue;
+        }
+
+        walker.text(&html[text_start..start], &mut sink)?;
+        let result = match bytes[start + 1] {
+            b'!' => skip_markup_declaration(bytes, start + 2),
+            b'?' => skip_bogus_comment(bytes, start + 2),
+            b'/' => walker.end_tag(start + 2, &mut sink),
+            _ => walker.start_tag(start + 1, &mut sink),
+        };
+        // Unlike `scan`, a document cut off inside a tag is left to the parser
+        pos = result.ok()?;
+        text_start = pos;
+    }
+
+    walker.text(&html[text_start..], &mut sink)?;
+    for _ in walker.open.drain(..) {
+        sink(Event::End);
+    }
+    Some(())
+}
+
+/// Open element stack and insertion state for [`walk`]
+struct Walker<'a> {
+    html: &'a str,
+    /// Names of the open elements, outermost first
+    open: Vec<Cow<'a, str>>,
+    /// Whether the body exists yet, either explicitly or implied by content
+    in_body: bool,
+}
+
+impl<'a> Walker<'a> {
+    /// Report character data between two tags
+    fn text(&mut self, text: &'a str, sink: &mut impl FnMut(Event<'a>)) -> Option<()> {
+        if text.is_empty() {
+            return Some(());
+        }
+        if !self.in_body {
+            // Whitespace before the body is kept in <head> or dropped
+            if text.bytes().all(is_whitespace) {
+                return Some(());
+            }
+            self.in_body = true;
+        }
+        sink(Event::Text(decode_text(text)?));
+        Some(())
+    }
+
+    /// Handle a start tag whose name begins at `pos`, returning the index after it
+    fn start_tag(&mut self, pos: usize, sink: &mut impl FnMut(Event<'a>)) -> Result<usize, Stop> {
+        let html = self.html;
+        let bytes = html.as_bytes();
+        let name_end = tag_name_end(bytes, pos);
+        let mut attrs = Vec::new();
+        let mut end = parse_attributes(html, name_end, Some(&mut attrs))?;
+        let tag = ScannedTag { name: lowercase_name(&html[pos..name_end]), attrs };
+        let name: &str = &tag.name;
+
+        match name {
+            // Attributes of repeated <html>/<body> tags are merged into the
+            // existing element, and <head> is never reported
+            "html" | "head" if tag.attr("class").is_some() => return Err(Stop::Unsupported),
+            "html" | "head" => return Ok(end),
+            "body" if self.in_body => {
+                if tag.attr("class").is_some() {
+                    return Err(Stop::Unsupported);
+                }
+                return Ok(end);
+            }
+            "body" => {
+                self.in_body = true;
+                self.open.push(tag.name.clone());
+                sink(Event::Start(tag));
+                return Ok(end);
+            }
+            _ => {}
+        }
+
+        if UNSUPPORTED_ELEMENTS.contains(&name) || self.closes_implicitly(name) {
+            return Err(Stop::Unsupported);
+        }
+        if !HEAD_ELEMENTS.contains(&name) {
+            self.in_body = true;
+        }
+
+        if VOID_ELEMENTS.contains(&name) {
+            sink(Event::Start(tag));
+            sink(Event::End);
+            return Ok(end);
+        }
+
+        if RAW_TEXT_ELEMENTS.contains(&name) {
+            if name == "textarea" {
+                end = skip_leading_newline(bytes, end);
+            }
+            let close = find_end_tag(bytes, end, name.as_bytes());
+            let content = &html[end..close.unwrap_or(bytes.len())];
+            if name == "script" && memmem::find(content.as_bytes(), b"<!--").is_some() {
+                return Err(Stop::Unsupported);
+            }
+            let text = if name == "title" || name == "textarea" {
+                decode_text(content).ok_or(Stop::Unsupported)?
+            } else {
+                normalize_newlines(content)
+            };
+
+            sink(Event::Start(tag));
+            if !text.is_empty() {
+                sink(Event::Text(text));
+            }
+            sink(Event::End);
+            // The end tag itself is skipped as a stray end tag
+            return Ok(close.unwrap_or(bytes.len()));
+        }
+
+        if name == "pre" || name == "listing" {
+            end = skip_leading_newline(bytes, end);
+        }
+        self.open.push(tag.name.clone());
+        sink(Event::Start(tag));
+        Ok(end)
+    }
+
+    /// Handle an end tag whose name begins at `pos` (just after `</`)
+    fn end_tag(&mut self, pos: usize, sink: &mut impl FnMut(Event<'a>)) -> Result<usize, Stop> {
+        let bytes = self.html.as_bytes();
+        match bytes.get(pos) {
+            None => return Err(Stop::Eof),
+            Some(b'>') => return Ok(pos + 1),
+            Some(c) if c.is_ascii_alphabetic() => {}
+            Some(_) => return skip_bogus_comment(bytes, pos),
+        }
+
+        let name_end = tag_name_end(bytes, pos);
+        let end = parse_attributes(self.html, name_end, None)?;
+        let name = lowercase_name(&self.html[pos..name_end]);
+        let name: &str = &name;
+
+        match name {
+            // Content after </body> or </html> still goes into the body
+            "body" | "html" => {
+                self.in_body = true;
+                return Ok(end);
+            }
+            "head" => return Ok(end),
+            _ => {}
+        }
+
+        if self.open.last().is_some_and(|top| top == name) {
+            self.open.pop();
+            sink(Event::End);
+            return Ok(end);
+        }
+
+        // Closing anything but the innermost element pops elements implicitly,
+        // and stray </p> and </br> insert new elements
+        if name == "p"
+            || name == "br"
+            || self.is_open(&[name])
+            || (HEADINGS.contains(&name) && self.is_open(HEADINGS))
+        {
+            return Err(Stop::Unsupported);
+        }
+
+        // Any other stray end tag is ignored by the tree builder
+        Ok(end)
+    }
+
+    /// Whether opening `name` would make the tree builder close open elements
+    fn closes_implicitly(&self, name: &str) -> bool {
+        (CLOSES_P.contains(&name) && self.is_open(&["p"]))
+            || (name == "li" && self.is_open(&["li"]))
+            || ((name == "dd" || name == "dt") && self.is_open(&["dd", "dt"]))
+            || (HEADINGS.contains(&name)
+                && self.open.last().is_some_and(|top| HEADINGS.contains(&top.as_ref())))
+            || (matches!(name, "a" | "button" | "form" | "nobr") && self.is_open(&[name]))
+    }
+
+    fn is_open(&self, names: &[&str]) -> bool {
+        self.open.iter().any(|open| names.contains(&open.as_ref()))
+    }
+}
+
+/// Skip the single newline the tree builder drops after `<pre>`, `<listing>` and `<textarea>`
+fn skip_leading_newline(bytes: &[u8], pos: usize) -> usize {
+    match &bytes[pos..] {
+        [b'\r', b'\n', ..] => pos + 2,
+        [b'\r', ..] | [b'\n', ..] => pos + 1,
+        _ => pos,
+    }
+}
+
+/// Normalize CRLF and lone CR to LF in raw text, without decoding references
+fn normalize_newlines(text: &str) -> Cow<'_, str> {
+    if memchr(b'\r', text.as_bytes()).is_none() {
+        Cow::Borrowed(text)
+    } else {
+        Cow::Owned(text.replace("\r\n", "\n").replace('\r', "\n"))
+    }
+}
+
+/// How [`scan`] handles a start tag, decided once from its name
+#[derive(Debug, Clone, Copy, PartialEq)]
+enum ScanTag {
+    /// `<html>`, `<meta>` or `<link>`: captured with its attributes
+    Kept(&'static str),
+    Title,
+    Script,
+    /// Raw text element other than `<title>` and `<script>`
+    RawText(&'static str),
+    /// Element the tree builder may drop or move, see [`scan`]
+    Unsupported,
+    Table,
+    Other,
+}
+
+impl ScanTag {
+    /// Longest name with a kind other than `Other` ("plaintext")
+    const MAX_NAME_LEN: usize = 9;
+
+    /// Classify a raw tag name, ignoring ASCII case
+    ///
+    /// Most tags on a page are none of these, so the name is lowercased into a
+    /// small buffer and matched once instead of being compared against every
+    /// candidate in turn.
+    fn classify(name: &[u8]) -> Self {
+        let mut buf = [0; Self::MAX_NAME_LEN];
+        let Some(lower) = buf.get_mut(..name.len()) else {
+            return ScanTag::Other;
+        };
+        lower.copy_from_slice(name);
+        lower.make_ascii_lowercase();
+
+        match &*lower {
+            b"html" => ScanTag::Kept("html"),
+            b"meta" => ScanTag::Kept("meta"),
+            b"link" => ScanTag::Kept("link"),
+            b"title" => ScanTag::Title,
+            b"script" => ScanTag::Script,
+            b"style" => ScanTag::RawText("style"),
+            b"textarea" => ScanTag::RawText("textarea"),
+            b"noscript" => ScanTag::RawText("noscript"),
+            b"iframe" => ScanTag::RawText("iframe"),
+            b"xmp" => ScanTag::RawText("xmp"),
+            b"noembed" => ScanTag::RawText("noembed"),
+            b"noframes" => ScanTag::RawText("noframes"),
+            b"svg" | b"math" | b"template" | b"select" | b"frameset" | b"plaintext" => {
+                ScanTag::Unsupported
+            }
+            b"table" => ScanTag::Table,
+            _ => ScanTag::Other,
+        }
+    }
+}
+
+/// Handle a start tag whose name begins at `pos`, returning the index after it
+fn scan_start_tag<'a>(
+    html: &'a str,
+    pos: usize,
+    page: &mut ScannedPage<'a>,
+    seen_table: &mut bool,
+) -> Result<usize, Stop> {
+    let bytes = html.as_bytes();
+    let name_end = tag_name_end(bytes, pos);
+    let kind = ScanTag::classify(&bytes[pos..name_end]);
+
+    if let ScanTag::Kept(kept) = kind {
+        // Elements inside tables may be foster-parented out of source order
+        if kept != "html" && *seen_table {
+            return Err(Stop::Unsupported);
+        }
+        let mut attrs = Vec::new();
+        let end = parse_attributes(html, name_end, Some(&mut attrs))?;
+        page.tags.push(ScannedTag { name: Cow::Borrowed(kept), attrs });
+        return Ok(end);
+    }
+
+    let end = parse_attributes(html, name_end, None)?;
+
+    match kind {
+        ScanTag::Title => {
+            if *seen_table {
+                return Err(Stop::Unsupported);
+            }
+            let close = find_end_tag(bytes, end, b"title");
+            if page.title.is_none() {
+                let text = &html[end..close.unwrap_or(bytes.len())];
+                page.title = Some(decode_text(text).ok_or(Stop::Unsupported)?);
+            }
+            close.ok_or(Stop::Eof)
+        }
+        ScanTag::Script => {
+            let close = find_end_tag(bytes, end, b"script");
+            let content = &html[end..close.unwrap_or(bytes.len())];
+            // Escaped script data ("<!--" ... "<script") has its own end-tag rules
+            if memmem::find(content.as_bytes(), b"<!--").is_some() {
+                return Err(Stop::Unsupported);
+            }
+            if let Some(scripts) = &mut page.json_ld {
+                match is_json_ld(html, name_end, end) {
+                    Ok(false) => {}
+                    // Scripts nested in foster-parented content can move out of source order
+                    Ok(true) if !*seen_table => scripts.push(content),
+                    Ok(true) | Err(_) => page.json_ld = None,
+                }
+            }
+            close.ok_or(Stop::Eof)
+        }
+        ScanTag::RawText(raw) => find_end_tag(bytes, end, raw.as_bytes()).ok_or(Stop::Eof),
+        ScanTag::Unsupported => Err(Stop::Unsupported),
+        ScanTag::Table => {
+            *seen_table = true;
+            Ok(end)
+        }
+        ScanTag::Kept(_) | ScanTag::Other => Ok(end),
+    }
+}
+
+/// Whether a `<script>` tag, with attributes from `pos` to `end`, holds JSON-LD
+///
+/// The `type` value is compared ignoring ASCII case, as the CSS attribute
+/// selector does for it in HTML documents.
+fn is_json_ld(html: &str, pos: usize, end: usize) -> Result<bool, Stop> {
+    // Most scripts are not JSON-LD, so only collect the attributes of tags that
+    // mention it or contain a character reference that might spell it
+    let tag = &html.as_bytes()[pos..end];
+    if memchr(b'&', tag).is_none() && !tag.windows(7).any(|w| w.eq_ignore_ascii_case(b"ld+json")) {
+        return Ok(false);
+    }
+
+    let mut attrs = Vec::new();
+    parse_attributes(html, pos, Some(&mut attrs))?;
+    let tag = ScannedTag { name: Cow::Borrowed("script"), attrs };
+    Ok(tag.attr("type").is_some_and(|t| t.eq_ignore_ascii_case("application/ld+json")))
+}
+
+/// Skip an end tag whose name begins at `pos` (just after `</`)
+fn skip_end_tag(html: &str, pos: usize) -> Result<usize, Stop> {
+    let bytes = html.as_bytes();
+    match bytes.get(pos) {
+        None => Err(Stop::Eof),
+        Some(b'>') => Ok(pos + 1),
+        Some(c) if c.is_ascii_alphabetic() => {
+            parse_attributes(html, tag_name_end(bytes, pos), None)
+        }
+        Some(_) => skip_bogus_comment(bytes, pos),
+    }
+}
+
+/// Skip a comment, doctype or other `<!...>` construct starting after `<!`
+fn skip_markup_declaration(bytes: &[u8], pos: usize) -> Result<usize, Stop> {
+    if !bytes[pos..].starts_with(b"--") {
+        return skip_bogus_comment(bytes, pos);
+    }
+
+    let body = pos + 2;
+    // "<!-->" and "<!--->" are complete (if malformed) comments
+    if bytes[body..].starts_with(b">") {
+        return Ok(body + 1);
+    }
+    if bytes[body..].starts_with(b"->") {
+        return Ok(body + 2);
+    }
+
+    let mut search = body;
+    while let Some(offset) = memmem::find(&bytes[search..], b"--") {
+        let dashes = search + offset;
+        match &bytes[dashes + 2..] {
+            [b'>', ..] => return Ok(dashes + 3),
+            [b'!', b'>', ..] => return Ok(dashes + 4),
+            _ => search = dashes + 1,
+        }
+    }
+    Err(Stop::Eof)
+}
+
+/// Skip a bogus comment, which ends at the first `>`
+fn skip_bogus_comment(bytes: &[u8], pos: usize) -> Result<usize, Stop> {
+    memchr(b'>', &bytes[pos..]).map(|offset| pos + offset + 1).ok_or(Stop::Eof)
+}
+
+/// Find the `</name` that closes a raw text element whose content starts at `pos`
+fn find_end_tag(bytes: &[u8], pos: usize, name: &[u8]) -> Option<usize> {
+    let mut search = pos;
+    while let Some(offset) = memmem::find(&bytes[search..], b"</") {
+        let start = search + offset;
+        let name_start = start + 2;
+        let name_end = name_start + name.len();
+        if bytes.len() >= name_end && bytes[name_start..name_end].eq_ignore_ascii_case(name) {
+            match bytes.get(name_end) {
+                Some(&c) if !ends_tag_name(c) => {}
+                _ => return Some(start),
+            }
+        }
+        search = name_start;
+    }
+    None
+}
+
+/// Parse the attributes of a tag whose name ends at `pos`
+///
+/// Follows the tokenizer's attribute states, so `>` inside quoted values does
+/// not end the tag. When `attrs` is given, names are lowercased, values are
+/// decoded and duplicate attributes are dropped (first one wins). Returns the
+/// index just past the closing `>`.
+fn parse_attributes<'a>(
+    html: &'a str,
+    mut pos: usize,
+    mut attrs: Option<&mut Vec<(Cow<'a, str>, Cow<'a, str>)>>,
+) -> Result<usize, Stop> {
+    let bytes = html.as_bytes();
+
+    loop {
+        // Before attribute name
+        pos = skip_whitespace(bytes, pos);
+        match bytes.get(pos) {
+            None => return Err(Stop::Eof),
+            Some(b'>') => return Ok(pos + 1),
+            Some(b'/') => {
+                pos += 1;
+                continue;
+            }
+            Some(_) => {}
+        }
+
+        // Attribute name (a leading '=' is part of the name)
+        let name_start = pos;
+        pos += 1;
+        while pos < bytes.len() && !ends_tag_name(bytes[pos]) && bytes[pos] != b'=' {
+            pos += 1;
+        }
+        let name = &html[name_start..pos];
+
+        // After attribute name
+        pos = skip_whitespace(bytes, pos);
+        let mut value = "";
+        match bytes.get(pos) {
+            None => return Err(Stop::Eof),
+            Some(b'=') => {
+                pos = skip_whitespace(bytes, pos + 1);
+                match bytes.get(pos) {
+                    None => return Err(Stop::Eof),
+                    Some(&quote) if quote == b'"' || quote == b'\'' => {
+                        let offset = memchr(quote, &bytes[pos + 1..]).ok_or(Stop::Eof)?;
+                        value = &html[pos + 1..pos + 1 + offset];
+                        pos += offset + 2;
+                    }
+                    // Missing value: the '>' is handled by the next iteration
+                    Some(b'>') => {}
+                    Some(_) => {
+                        let value_start = pos;
+                        while pos < bytes.len() && bytes[pos] != b'>' && !is_whitespace(bytes[pos])
+                        {
+                            pos += 1;
+                        }
+                        if pos == bytes.len() {
+                            return Err(Stop::Eof);
+                        }
+                        value = &html[value_start..pos];
+                    }
+                }
+            }
+            Some(_) => {}
+        }
+
+        if let Some(attrs) = attrs.as_deref_mut() {
+            let name = lowercase_name(name);
+            if !attrs.iter().any(|(n, _)| *n == name) {
+                let value = decode_text(value).ok_or(Stop::Unsupported)?;
+                attrs.push((name, value));
+            }
+        }
+    }
+}
+
+/// Index of the first byte after a tag name starting at `pos`
+fn tag_name_end(bytes: &[u8], pos: usize) -> usize {
+    bytes[pos..].iter().position(|&c| ends_tag_name(c)).map_or(bytes.len(), |offset| pos + offset)
+}
+
+fn lowercase_name(name: &str) -> Cow<'_, str> {
+    if name.bytes().any(|c| c.is_ascii_uppercase()) {
+        Cow::Owned(name.to_ascii_lowercase())
+    } else {
+        Cow::Borrowed(name)
+    }
+}
+
+fn ends_tag_name(c: u8) -> bool {
+    is_whitespace(c) || c == b'/' || c == b'>'
+}
+
+fn is_whitespace(c: u8) -> bool {
+    matches!(c, b' ' | b'\t' | b'\n' | b'\r' | b'\x0C')
+}
+
+fn skip_whitespace(bytes: &[u8], mut pos: usize) -> usize {
+    while pos < bytes.len() && is_whitespace(bytes[pos]) {
+        pos += 1;
+    }
+    pos
+}
+
+/// Decode character references and normalize newlines in text or attribute values
+///
+/// Returns `None` for references whose exact decoding depends on the full
+/// named character reference table or on legacy tokenizer quirks.
+fn decode_text(text: &str) -> Option<Cow<'_, str>> {
+    let bytes = text.as_bytes();
+    if memchr::memchr2(b'&', b'\r', bytes).is_none() {
+        return Some(Cow::Borrowed(text));
+    }
+
+    let mut out = String::with_capacity(text.len());
+    let mut pos = 0;
+    while let Some(offset) = memchr::memchr2(b'&', b'\r', &bytes[pos..]) {
+        let at = pos + offset;
+        out.push_str(&text[pos..at]);
+
+        if bytes[at] == b'\r' {
+            // CRLF and lone CR both become LF, as in the input stream preprocessor
+            out.push('\n');
+            pos = if bytes.get(at + 1) == Some(&b'\n') { at + 2 } else { at + 1 };
+            continue;
+        }
+
+        match bytes.get(at + 1) {
+            Some(b'#') => {
+                let (c, len) = decode_numeric_reference(&bytes[at + 2..])?;
+                out.push(c);
+                pos = at + 2 + len;
+            }
+            Some(c) if c.is_ascii_alphanumeric() => {
+                let name_len =
+                    bytes[at + 1..].iter().take_while(|c| c.is_ascii_alphanumeric()).count();
+                let name_end = at + 1 + name_len;
+                if bytes.get(name_end) != Some(&b';') {
+                    return None;
+                }
+                out.push_str(named_reference(&text[at + 1..name_end])?);
+                pos = name_end + 1;
+            }
+            _ => {
+                out.push('&');
+                pos = at + 1;
+            }
+        }
+    }
+    out.push_str(&text[pos..]);
+
+    Some(Cow::Owned(out))
+}
+
+/// Decode `&#...;` given the bytes after `&#`, returning the char and bytes consumed
+fn decode_numeric_reference(bytes: &[u8]) -> Option<(char, usize)> {
+    let (radix, digits_start) = match bytes.first() {
+        Some(b'x') | Some(b'X') => (16, 1),
+        _ => (10, 0),
+    };
+
+    let mut value: u32 = 0;
+    let mut pos = digits_start;
+    while let Some(digit) = bytes.get(pos).and_then(|&c| (c as char).to_digit(radix)) {
+        value = value.checked_mul(radix)?.checked_add(digit)?;
+        pos += 1;
+    }
+
+    if pos == digits_start || bytes.get(pos) != Some(&b';') {
+        return None;
+    }
+
+    // 0, C1 controls (remapped through windows-1252), surrogates and
+    // out-of-range values all get special treatment from the tokenizer
+    if value == 0 || (0x80..=0x9F).contains(&value) {
+        return None;
+    }
+    char::from_u32(value).map(|c| (c, pos + 1))
+}
+
+/// Named character references the scanner decodes, sorted by name
+///
+/// These are the HTML 4 entities (the Latin-1, symbol and typography sets)
+/// plus `apos`, with their HTML5 expansions. Pages that use any other named
+/// reference are left to the full parser.
+const NAMED_REFERENCES: &[(&str, &str)] = &[
+    ("AElig", "\u{c6}"),
+    ("Aacute", "\u{c1}"),
+    ("Acirc", "\u{c2}"),
+    ("Agrave", "\u{c0}"),
+    ("Alpha", "\u{391}"),
+    ("Aring", "\u{c5}"),
+    ("Atilde", "\u{c3}"),
+    ("Auml", "\u{c4}"),
+    ("Beta", "\u{392}"),
+    ("Ccedil", "\u{c7}"),
+    ("Chi", "\u{3a7}"),
+    ("Dagger", "\u{2021}"),
+    ("Delta", "\u{394}"),
+    ("ETH", "\u{d0}"),
+    ("Eacute", "\u{c9}"),
+    ("Ecirc", "\u{ca}"),
+    ("Egrave", "\u{c8}"),
+    ("Epsilon", "\u{395}"),
+    ("Eta", "\u{397}"),
+    ("Euml", "\u{cb}"),
+    ("Gamma", "\u{393}"),
+    ("Iacute", "\u{cd}"),
+    ("Icirc", "\u{ce}"),
+    ("Igrave", "\u{cc}"),
+    ("Iota", "\u{399}"),
+    ("Iuml", "\u{cf}"),
+    ("Kappa", "\u{39a}"),
+    ("Lambda", "\u{39b}"),
+    ("Mu", "\u{39c}"),
+    ("Ntilde", "\u{d1}"),
+    ("Nu", "\u{39d}"),
+    ("OElig", "\u{152}"),
+    ("Oacute", "\u{d3}"),
+    ("Ocirc", "\u{d4}"),
+    ("Ograve", "\u{d2}"),
+    ("Omega", "\u{3a9}"),
+    ("Omicron", "\u{39f}"),
+    ("Oslash", "\u{d8}"),
+    ("Otilde", "\u{d5}"),
+    ("Ouml", "\u{d6}"),
+    ("Phi", "\u{3a6}"),
+    ("Pi", "\u{3a0}"),
+    ("Prime", "\u{2033}"),
+    ("Psi", "\u{3a8}"),
+    ("Rho", "\u{3a1}"),
+    ("Scaron", "\u{160}"),
+    ("Sigma", "\u{3a3}"),
+    ("THORN", "\u{de}"),
+    ("Tau", "\u{3a4}"),
+    ("Theta", "\u{398}"),
+    ("Uacute", "\u{da}"),
+    ("Ucirc", "\u{db}"),
+    ("Ugrave", "\u{d9}"),
+    ("Upsilon", "\u{3a5}"),
+    ("Uuml", "\u{dc}"),
+    ("Xi", "\u{39e}"),
+    ("Yacute", "\u{dd}"),
+    ("Yuml", "\u{178}"),
+    ("Zeta", "\u{396}"),
+    ("aacute", "\u{e1}"),
+    ("acirc", "\u{e2}"),
+    ("acute", "\u{b4}"),
+    ("aelig", "\u{e6}"),
+    ("agrave", "\u{e0}"),
+    ("alefsym", "\u{2135}"),
+    ("alpha", "\u{3b1}"),
+    ("amp", "&"),
+    ("and", "\u{2227}"),
+    ("ang", "\u{2220}"),
+    ("apos", "'"),
+    ("aring", "\u{e5}"),
+    ("asymp", "\u{2248}"),
+    ("atilde", "\u{e3}"),
+    ("auml", "\u{e4}"),
+    ("bdquo", "\u{201e}"),
+    ("beta", "\u{3b2}"),
+    ("brvbar", "\u{a6}"),
+    ("bull", "\u{2022}"),
+    ("cap", "\u{2229}"),
+    ("ccedil", "\u{e7}"),
+    ("cedil", "\u{b8}"),
+    ("cent", "\u{a2}"),
+    ("chi", "\u{3c7}"),
+    ("circ", "\u{2c6}"),
+    ("clubs", "\u{2663}"),
+    ("cong", "\u{2245}"),
+    ("copy", "\u{a9}"),
+    ("crarr", "\u{21b5}"),
+    ("cup", "\u{222a}"),
+    ("curren", "\u{a4}"),
+    ("dArr", "\u{21d3}"),
+    ("dagger", "\u{2020}"),
+    ("darr", "\u{2193}"),
+    ("deg", "\u{b0}"),
+    ("delta", "\u{3b4}"),
+    ("diams", "\u{2666}"),
+    ("divide", "\u{f7}"),
+    ("eacute", "\u{e9}"),
+    ("ecirc", "\u{ea}"),
+    ("egrave", "\u{e8}"),
+    ("empty", "\u{2205}"),
+    ("emsp", "\u{2003}"),
+    ("ensp", "\u{2002}"),
+    ("epsilon", "\u{3b5}"),
+    ("equiv", "\u{2261}"),
+    ("eta", "\u{3b7}"),
+    ("eth", "\u{f0}"),
+    ("euml", "\u{eb}"),
+    ("euro", "\u{20ac}"),
+    ("exist", "\u{2203}"),
+    ("fnof", "\u{192}"),
+    ("forall", "\u{2200}"),
+    ("frac12", "\u{bd}"),
+    ("frac14", "\u{bc}"),
+    ("frac34", "\u{be}"),
+    ("frasl", "\u{2044}"),
+    ("gamma", "\u{3b3}"),
+    ("ge", "\u{2265}"),
+    ("gt", ">"),
+    ("hArr", "\u{21d4}"),
+    ("harr", "\u{2194}"),
+    ("hearts", "\u{2665}"),
+    ("hellip", "\u{2026}"),
+    ("iacute", "\u{ed}"),
+    ("icirc", "\u{ee}"),
+    ("iexcl", "\u{a1}"),
+    ("igrave", "\u{ec}"),
+    ("image", "\u{2111}"),
+    ("infin", "\u{221e}"),
+    ("int", "\u{222b}"),
+    ("iota", "\u{3b9}"),
+    ("iquest", "\u{bf}"),
+    ("isin", "\u{2208}"),
+    ("iuml", "\u{ef}"),
+    ("kappa", "\u{3ba}"),
+    ("lArr", "\u{21d0}"),
+    ("lambda", "\u{3bb}"),
+    ("lang", "\u{27e8}"),
+    ("laquo", "\u{ab}"),
+    ("larr", "\u{2190}"),
+    ("lceil", "\u{2308}"),
+    ("ldquo", "\u{201c}"),
+    ("le", "\u{2264}"),
+    ("lfloor", "\u{230a}"),
+    ("lowast", "\u{2217}"),
+    ("loz", "\u{25ca}"),
+    ("lrm", "\u{200e}"),
+    ("lsaquo", "\u{2039}"),
+    ("lsquo", "\u{2018}"),
+    ("lt", "<"),
+    ("macr", "\u{af}"),
+    ("mdash", "\u{2014}"),
+    ("micro", "\u{b5}"),
+    ("middot", "\u{b7}"),
+    ("minus", "\u{2212}"),
+    ("mu", "\u{3bc}"),
+    ("nabla", "\u{2207}"),
+    ("nbsp", "\u{a0}"),
+    ("ndash", "\u{2013}"),
+    ("ne", "\u{2260}"),
+    ("ni", "\u{220b}"),
+    ("not", "\u{ac}"),
+    ("notin", "\u{2209}"),
+    ("nsub", "\u{2284}"),
+    ("ntilde", "\u{f1}"),
+    ("nu", "\u{3bd}"),
+    ("oacute", "\u{f3}"),
+    ("ocirc", "\u{f4}"),
+    ("oelig", "\u{153}"),
+    ("ograve", "\u{f2}"),
+    ("oline", "\u{203e}"),
+    ("omega", "\u{3c9}"),
+    ("omicron", "\u{3bf}"),
+    ("oplus", "\u{2295}"),
+    ("or", "\u{2228}"),
+    ("ordf", "\u{aa}"),
+    ("ordm", "\u{ba}"),
+    ("oslash", "\u{f8}"),
+    ("otilde", "\u{f5}"),
+    ("otimes", "\u{2297}"),
+    ("ouml", "\u{f6}"),
+    ("para", "\u{b6}"),
+    ("part", "\u{2202}"),
+    ("permil", "\u{2030}"),
+    ("perp", "\u{22a5}"),
+    ("phi", "\u{3c6}"),
+    ("pi", "\u{3c0}"),
+    ("piv", "\u{3d6}"),
+    ("plusmn", "\u{b1}"),
+    ("pound", "\u{a3}"),
+    ("prime", "\u{2032}"),
+    ("prod", "\u{220f}"),
+    ("prop", "\u{221d}"),
+    ("psi", "\u{3c8}"),
+    ("quot", "\""),
+    ("rArr", "\u{21d2}"),
+    ("radic", "\u{221a}"),
+    ("rang", "\u{27e9}"),
+    ("raquo", "\u{bb}"),
+    ("rarr", "\u{2192}"),
+    ("rceil", "\u{2309}"),
+    ("rdquo", "\u{201d}"),
+    ("real", "\u{211c}"),
+    ("reg", "\u{ae}"),
+    ("rfloor", "\u{230b}"),
+    ("rho", "\u{3c1}"),
+    ("rlm", "\u{200f}"),
+    ("rsaquo", "\u{203a}"),
+    ("rsquo", "\u{2019}"),
+    ("sbquo", "\u{201a}"),
+    ("scaron", "\u{161}"),
+    ("sdot", "\u{22c5}"),
+    ("sect", "\u{a7}"),
+    ("shy", "\u{ad}"),
+    ("sigma", "\u{3c3}"),
+    ("sigmaf", "\u{3c2}"),
+    ("sim", "\u{223c}"),
+    ("spades", "\u{2660}"),
+    ("sub", "\u{2282}"),
+    ("sube", "\u{2286}"),
+    ("sum", "\u{2211}"),
+    ("sup", "\u{2283}"),
+    ("sup1", "\u{b9}"),
+    ("sup2", "\u{b2}"),
+    ("sup3", "\u{b3}"),
+    ("supe", "\u{2287}"),
+    ("szlig", "\u{df}"),
+    ("tau", "\u{3c4}"),
+    ("there4", "\u{2234}"),
+    ("theta", "\u{3b8}"),
+    ("thetasym", "\u{3d1}"),
+    ("thinsp", "\u{2009}"),
+    ("thorn", "\u{fe}"),
+    ("tilde", "\u{2dc}"),
+    ("times", "\u{d7}"),
+    ("trade", "\u{2122}"),
+    ("uArr", "\u{21d1}"),
+    ("uacute", "\u{fa}"),
+    ("uarr", "\u{2191}"),
+    ("ucirc", "\u{fb}"),
+    ("ugrave", "\u{f9}"),
+    ("uml", "\u{a8}"),
+    ("upsih", "\u{3d2}"),
+    ("upsilon", "\u{3c5}"),
+    ("uuml", "\u{fc}"),
+    ("weierp", "\u{2118}"),
+    ("xi", "\u{3be}"),
+    ("yacute", "\u{fd}"),
+    ("yen", "\u{a5}"),
+    ("yuml", "\u{ff}"),
+    ("zeta", "\u{3b6}"),
+    ("zwj", "\u{200d}"),
+    ("zwnj", "\u{200c}"),
+];
+
+/// Expansion of a `;`-terminated named character reference
+fn named_reference(name: &str) -> Option<&'static str> {
+    NAMED_REFERENCES
+        .binary_search_by(|(candidate, _)| candidate.cmp(&name))
+        .ok()
+        .map(|index| NAMED_REFERENCES[index].1)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn attr<'p>(page: &'p ScannedPage<'_>, index: usize, name: &str) -> Option<&'p str> {
+        page.tags[index].attr(name)
+    }
+
+    #[test]
+    fn test_scan_basic_head() {
+        let page = scan(
+            r#"<!DOCTYPE html><html lang="en"><head>
+                <title>Hello</title>
+                <meta charset="utf-8">
+                <meta name="description" content="A page">
+                <link rel="canonical" href="/page">
+            </head><body><p>Text</p></body></html>"#,
+        )
+        .unwrap();
+
+        assert_eq!(page.title_text(), Some("Hello".to_string()));
+        let names: Vec<_> = page.tags.iter().map(|t| t.tag_name()).collect();
+        assert_eq!(names, vec!["html", "meta", "meta", "link"]);
+        assert_eq!(attr(&page, 0, "lang"), Some("en"));
+        assert_eq!(attr(&page, 2, "content"), Some("A page"));
+        assert_eq!(attr(&page, 3, "href"), Some("/page"));
+    }
+
+    #[test]
+    fn test_document_head_matches_scan() {
+        let html = r#"<html lang="en"><head>
+                <title> Hello </title><title>Second</title>
+                <meta name="description" content="A page">
+                <link rel="canonical" href="/page">
+            </head><body><p>Text</p></body></html>"#;
+        let document = scraper::Html::parse_document(html);
+        let head = DocumentHead::new(&document);
+        let page = scan(html).unwrap();
+
+        assert_eq!(head.title, page.title_text());
+        let names: Vec<_> = head.tags.iter().map(|t| t.tag_name()).collect();
+        assert_eq!(names, vec!["html", "meta", "link"]);
+        assert_eq!(head.tags[1].attr("content"), page.tags[1].attr("content"));
+    }
+
+    #[test]
+    fn test_scan_attribute_syntax() {
+        let page = scan(
+            "<META Name=keywords CONTENT='a, b' content=\"dup\"><meta name=x content=\"1>2\"/>",
+        )
+        .unwrap();
+
+        assert_eq!(page.tags.len(), 2);
+        assert_eq!(attr(&page, 0, "name"), Some("keywords"));
+        assert_eq!(attr(&page, 0, "content"), Some("a, b"));
+        assert_eq!(attr(&page, 1, "content"), Some("1>2"));
+    }
+
+    #[test]
+    fn test_scan_valueless_and_unquoted_attributes() {
+        let page = scan("<meta itemprop name = a content=b/><link rel=icon href=/x.png>").unwrap();
+
+        assert_eq!(attr(&page, 0, "itemprop"), Some(""));
+        assert_eq!(attr(&page, 0, "name"), Some("a"));
+        assert_eq!(attr(&page, 0, "content"), Some("b/"));
+        assert_eq!(attr(&page, 1, "href"), Some("/x.png"));
+    }
+
+    #[test]
+    fn test_scan_skips_comments_and_raw_text() {
+        let page = scan(
+            r#"<!-- <meta name="a" content="1"> -->
+               <script>var s = '<meta name="b" content="2">';</script>
+               <style>/* <meta name="c"> */</style>
+               <noscript><meta name="d" content="4"></noscript>
+               <textarea><meta name="e"></textarea>
+               <meta name="f" content="6">"#,
+        )
+        .unwrap();
+
+        assert_eq!(page.tags.len(), 1);
+        assert_eq!(attr(&page, 0, "name"), Some("f"));
+    }
+
+    #[test]
+    fn test_scan_json_ld_scripts() {
+        let page = scan(
+            r#"<script type="application/ld+json">{"a": 1}</script>
+               <script src="app.js"></script><script type="text/ld+json">{}</script>
+               <script TYPE='Application/LD+JSON'> [] </script>
+               <script type="application&#x2F;ld+json">{"b": 2}</script>
+               <meta name=a><script type="application/ld+json">{"c": 3}"#,
+        )
+        .unwrap();
+
+        assert_eq!(page.json_ld, Some(vec![r#"{"a": 1}"#, " [] ", r#"{"b": 2}"#, r#"{"c": 3}"#]));
+        assert_eq!(page.tags.len(), 1);
+    }
+
+    #[test]
+    fn test_scan_json_ld_after_table_needs_parser() {
+        let page = scan(
+            r#"<meta name=a><table></table><script>var x;</script>
+               <script type="application/ld+json">{}</script>"#,
+        )
+        .unwrap();
+
+        // Only the JSON-LD is left to the parser; the head tags are still usable
+        assert_eq!(page.json_ld, None);
+        assert_eq!(page.tags.len(), 1);
+    }
+
+    #[test]
+    fn test_scan_tag_classification() {
+        assert_eq!(ScanTag::classify(b"META"), ScanTag::Kept("meta"));
+        assert_eq!(ScanTag::classify(b"Title"), ScanTag::Title);
+        assert_eq!(ScanTag::classify(b"noScript"), ScanTag::RawText("noscript"));
+        assert_eq!(ScanTag::classify(b"PlainText"), ScanTag::Unsupported);
+        assert_eq!(ScanTag::classify(b"plaintexts"), ScanTag::Other);
+        assert_eq!(ScanTag::classify(b"metadata"), ScanTag::Other);
+        assert_eq!(ScanTag::classify(b"div"), ScanTag::Other);
+    }
+
+    #[test]
+    fn test_scan_ignores_similar_tag_names() {
+        let page = scan(r#"<metadata name="a"><linkage href="x"><meta name="b">"#).unwrap();
+        assert_eq!(page.tags.len(), 1);
+        assert_eq!(attr(&page, 0, "name"), Some("b"));
+    }
+
+    #[test]
+    fn test_scan_first_title_only() {
+        let page = scan("<title>  First &amp; best </title><title>Second</title>").unwrap();
+        assert_eq!(page.title_text(), Some("First & best".to_string()));
+    }
+
+    #[test]
+    fn test_scan_title_keeps_markup_as_text() {
+        let page = scan("<title>a <b>bold</b> move</title><meta name=x>").unwrap();
+        assert_eq!(page.title_text(), Some("a <b>bold</b> move".to_string()));
+        assert_eq!(page.tags.len(), 1);
+    }
+
+    #[test]
+    fn test_scan_decodes_references() {
+        let page = scan(r#"<meta content="&quot;Q&quot; &#169; &#x2014; a & b">"#).unwrap();
+        assert_eq!(attr(&page, 0, "content"), Some("\"Q\" \u{a9} \u{2014} a & b"));
+    }
+
+    #[test]
+    fn test_named_references() {
+        assert!(NAMED_REFERENCES.windows(2).all(|pair| pair[0].0 < pair[1].0));
+        assert_eq!(named_reference("amp"), Some("&"));
+        assert_eq!(named_reference("eacute"), Some("\u{e9}"));
+        assert_eq!(named_reference("Eacute"), Some("\u{c9}"));
+        assert_eq!(named_reference("euro"), Some("\u{20ac}"));
+        assert_eq!(named_reference("rang"), Some("\u{27e9}"));
+        assert_eq!(named_reference("ampx"), None);
+
+        let page = scan("<title>Caf&eacute; &euro;5 &Agrave;</title>").unwrap();
+        assert_eq!(page.title_text(), Some("Caf\u{e9} \u{20ac}5 \u{c0}".to_string()));
+    }
+
+    #[test]
+    fn test_scan_normalizes_newlines() {
+        let page = scan("<meta content=\"a\r\nb\rc\">").unwrap();
+        assert_eq!(attr(&page, 0, "content"), Some("a\nb\nc"));
+    }
+
+    #[test]
+    fn test_scan_unterminated_tag_is_dropped() {
+        let page = scan(r#"<meta name="a" content="1"><meta name="b" content="2"#).unwrap();
+        assert_eq!(page.tags.len(), 1);
+    }
+
+    #[test]
+    fn test_scan_declines_unsupported_documents() {
+        assert!(scan("<svg><title>x</title></svg>").is_none());
+        assert!(scan("<template><meta name=a></template>").is_none());
+        assert!(scan("<select><meta name=a></select>").is_none());
+        assert!(scan("<table><tr><td><meta name=a></td></tr></table>").is_none());
+        assert!(scan("<meta content=\"&copy\">").is_none());
+        assert!(scan("<meta content=\"&unknownentity;\">").is_none());
+        assert!(scan("<meta content=\"&#128;\">").is_none());
+        assert!(scan("<script><!--<script></script>--></script>").is_none());
+        assert!(scan("a\0b").is_none());
+    }
+
+    #[test]
+    fn test_scan_table_after_metadata() {
+        let page = scan("<meta name=a><table><tr><td>x</td></tr></table>").unwrap();
+        assert_eq!(page.tags.len(), 1);
+    }
+
+    #[test]
+    fn test_scan_malformed_markup() {
+        let page = scan("a < b <!> <?xml?> </ x> </> <!--->x<!-- a --!><meta name=ok>").unwrap();
+        assert_eq!(page.tags.len(), 1);
+        assert_eq!(attr(&page, 0, "name"), Some("ok"));
+    }
+
+    fn walk_events(html: &str) -> Option<Vec<String>> {
+        let mut events = Vec::new();
+        walk(html, |event| {
+            events.push(match event {
+                Event::Start(tag) => match tag.attr("class") {
+                    Some(class) => format!("<{}.{}>", tag.tag_name(), class),
+                    None => format!("<{}>", tag.tag_name()),
+                },
+                Event::End => "</>".to_string(),
+                Event::Text(text) => text.into_owned(),
+            })
+        })?;
+        Some(events)
+    }
+
+    #[test]
+    fn test_walk_events() {
+        let events = walk_events(
+            "<!DOCTYPE html><html><head><title>T</title></head>\n<body>\
+             <div class=\"h-recipe\"><span class=p-name>Pie &amp; Cream</span><br>\
+             <img src=x><!-- note --></div></body></html>",
+        )
+        .unwrap();
+        assert_eq!(
+            events,
+            vec![
+                "<title>",
+                "T",
+                "</>",
+                "<body>",
+                "<div.h-recipe>",
+                "<span.p-name>",
+                "Pie & Cream",
+                "</>",
+                "<br>",
+                "</>",
+                "<img>",
+                "</>",
+                "</>",
+                "</>",
+            ]
+        );
+    }
+
+    #[test]
+    fn test_walk_raw_text_and_newlines() {
+        let events =
+            walk_events("<p>a < b</p><script>x = '<b>';</script><pre>\r\nline\r\n</pre>").unwrap();
+        assert_eq!(
+            events,
+            vec!["<p>", "a < b", "</>", "<script>", "x = '<b>';", "</>", "<pre>", "line\n", "</>",]
+        );
+    }
+
+    #[test]
+    fn test_walk_closes_open_elements_at_eof() {
+        let events = walk_events("<div><span>text").unwrap();
+        assert_eq!(events, vec!["<div>", "<span>", "text", "</>", "</>"]);
+    }
+
+    #[test]
+    fn test_walk_ignores_stray_end_tags() {
+        let events = walk_events("<div>a</span></div></body>b").unwrap();
+        assert_eq!(events, vec!["<div>", "a", "</>", "b"]);
+    }
+
+    #[test]
+    fn test_walk_declines_tree_builder_recovery() {
+        assert!(walk_events("<p>a<div>b</div></p>").is_none());
+        assert!(walk_events("<ul><li>a<li>b</ul>").is_none());
+        assert!(walk_events("<b><i>x</b></i>").is_none());
+        assert!(walk_events("<div>a</p>").is_none());
+        assert!(walk_events("a</br>").is_none());
+        assert!(walk_events("<h1>a<h2>b</h2></h1>").is_none());
+        assert!(walk_events("<h1>a</h2>").is_none());
+        assert!(walk_events("<a href=x><a href=y>z</a></a>").is_none());
+        assert!(walk_events("<table><tr><td>x</td></tr></table>").is_none());
+        assert!(walk_events("<div>x</div><body class=h-recipe>").is_none());
+        assert!(walk_events("<div class=\"a&b\">").is_none());
+        assert!(walk_events("<div>cut off<span").is_none());
+    }
+
+    #[test]
+    fn test_scan_end_tag_with_quoted_gt() {
+        let page = scan(r#"<div></div title=">"><meta name=a>"#).unwrap();
+        assert_eq!(page.tags.len(), 1);
+    }
+}
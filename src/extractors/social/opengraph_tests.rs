@@ -594,4 +594,32 @@ mod tests {
         assert!(og.url.is_some());
         assert!(og.url.unwrap().contains("foo=bar"));
     }
+
+    // ========== SCANNER / DOM PARITY ==========
+
+    #[test]
+    fn test_scanner_matches_dom() {
+        let html = r#"<!DOCTYPE html>
+            <head>
+                <META PROPERTY="og:title" CONTENT=" Caf&#233;s &amp; Bars ">
+                <!-- <meta property="og:type" content="hidden"> -->
+                <meta property=og:type content=article>
+                <meta property="og:image" content="/a.jpg">
+                <meta property="og:image:width" content="100">
+                <meta property="article:tag" content="food">
+                <script>document.write('<meta property="og:url" content="x">')</script>
+            </head>
+            <body><meta property="og:url" content="/page"></body>"#;
+
+        let document = crate::extractors::common::html_utils::parse_html(html);
+        let dom = crate::extractors::social::opengraph::extract_from_document(
+            &document,
+            Some("https://example.com/"),
+        )
+        .unwrap();
+        let og = extract(html, Some("https://example.com/")).unwrap();
+        assert_eq!(og, dom);
+        assert_eq!(og.title, Some("Cafés & Bars".to_string()));
+        assert_eq!(og.url, Some("https://example.com/page".to_string()));
+    }
 }
@@ -5,7 +5,9 @@
 
 use crate::errors::Result;
 use crate::extractors::common::{html_utils, url_utils};
-use crate::types::social::{TwitterApp, TwitterCard, TwitterPlayer};
+use crate::extractors::scanner::{self, TagAttributes};
+use crate::types::social::{OpenGraph, TwitterApp, TwitterCard, TwitterPlayer};
+use scraper::Html;
 
 /// Extract Twitter Card metadata from HTML
 ///
@@ -16,7 +18,22 @@ use crate::types::social::{TwitterApp, TwitterCard, TwitterPlayer};
 /// # Returns
 /// * `Result<TwitterCard>` - Extracted Twitter Card data
 pub fn extract(html: &str, base_url: Option<&str>) -> Result<TwitterCard> {
-    let document = html_utils::parse_html(html);
+    if let Some(page) = scanner::scan(html) {
+        return Ok(extract_from_tags(&page.tags, base_url));
+    }
+
+    extract_from_document(&html_utils::parse_html(html), base_url)
+}
+
+/// Extract Twitter Card metadata from an already parsed document
+///
+/// Reads the `twitter:*` `<meta name>` tags, including player and app properties.
+pub fn extract_from_document(document: &Html, base_url: Option<&str>) -> Result<TwitterCard> {
+    Ok(extract_from_tags(&scanner::document_tags(document), base_url))
+}
+
+/// Build a [`TwitterCard`] from a page's tags; only `<meta name>` tags are read
+pub fn extract_from_tags<T: TagAttributes>(tags: &[T], base_url: Option<&str>) -> TwitterCard {
     let mut card = TwitterCard::default();
 
     // Track player/app metadata
@@ -29,96 +46,90 @@ pub fn extract(html: &str, base_url: Option<&str>) -> Result<TwitterCard> {
     let mut has_app_data = false;
 
     // Extract meta tags with name="twitter:*"
-    if let Ok(selector) = html_utils::create_selector("meta[name]") {
-        for element in document.select(&selector) {
-            if let (Some(name), Some(content)) =
-                (html_utils::get_attr(&element, "name"), html_utils::get_attr(&element, "content"))
-            {
-                let content = content.trim().to_string();
-                if content.is_empty() {
-                    continue;
-                }
+    for element in tags.iter().filter(|t| t.tag_name() == "meta") {
+        if let (Some(name), Some(content)) = (element.attr("name"), element.attr("content")) {
+            // Standard meta names (description, viewport, ...) are not copied
+            let Some(prop) = name.strip_prefix("twitter:") else {
+                continue;
+            };
+            let content = content.trim().to_string();
+            if content.is_empty() {
+                continue;
+            }
 
-                // Parse name attribute
-                if let Some(prop) = name.strip_prefix("twitter:") {
-                    match prop {
-                        "card" => card.card = Some(content),
-                        "title" => card.title = Some(content),
-                        "description" => card.description = Some(content),
-                        "image" => {
-                            card.image =
-                                Some(url_utils::resolve_url(base_url, &content).unwrap_or(content))
-                        }
-                        "site" => card.site = Some(content),
-                        "creator" => card.creator = Some(content),
+            match prop {
+                "card" => card.card = Some(content),
+                "title" => card.title = Some(content),
+                "description" => card.description = Some(content),
+                "image" => {
+                    card.image = Some(url_utils::resolve_url(base_url, &content).unwrap_or(content))
+                }
+                "site" => card.site = Some(content),
+                "creator" => card.creator = Some(content),
 
-                        // Handle nested properties
-                        _ if prop.starts_with("image:") => {
-                            if &prop[6..] == "alt" {
-                                card.image_alt = Some(content);
-                            }
-                        }
-                        _ if prop.starts_with("site:") => {
-                            if &prop[5..] == "id" {
-                                card.site_id = Some(content);
+                // Handle nested properties
+                _ if prop.starts_with("image:") => {
+                    if &prop[6..] == "alt" {
+                        card.image_alt = Some(content);
+                    }
+                }
+                _ if prop.starts_with("site:") => {
+                    if &prop[5..] == "id" {
+                        card.site_id = Some(content);
+                    }
+                }
+                _ if prop.starts_with("creator:") => {
+                    if &prop[8..] == "id" {
+                        card.creator_id = Some(content);
+                    }
+                }
+                _ if prop.starts_with("player") => {
+                    if prop == "player" {
+                        player_url =
+                            Some(url_utils::resolve_url(base_url, &content).unwrap_or(content));
+                    } else if let Some(subprop) = prop.strip_prefix("player:") {
+                        match subprop {
+                            "width" => player_width = content.parse().ok(),
+                            "height" => player_height = content.parse().ok(),
+                            "stream" => {
+                                player_stream = Some(
+                                    url_utils::resolve_url(base_url, &content).unwrap_or(content),
+                                )
                             }
+                            _ => {}
                         }
-                        _ if prop.starts_with("creator:") => {
-                            if &prop[8..] == "id" {
-                                card.creator_id = Some(content);
-                            }
+                    }
+                }
+                _ if prop.starts_with("app:") => {
+                    has_app_data = true;
+                    let subprop = &prop[4..];
+
+                    if let Some(platform_prop) = subprop.strip_prefix("name:") {
+                        match platform_prop {
+                            "iphone" => app_data.name_iphone = Some(content),
+                            "ipad" => app_data.name_ipad = Some(content),
+                            "googleplay" => app_data.name_googleplay = Some(content),
+                            _ => {}
                         }
-                        _ if prop.starts_with("player") => {
-                            if prop == "player" {
-                                player_url = Some(
-                                    url_utils::resolve_url(base_url, &content).unwrap_or(content),
-                                );
-                            } else if let Some(subprop) = prop.strip_prefix("player:") {
-                                match subprop {
-                                    "width" => player_width = content.parse().ok(),
-                                    "height" => player_height = content.parse().ok(),
-                                    "stream" => {
-                                        player_stream = Some(
-                                            url_utils::resolve_url(base_url, &content)
-                                                .unwrap_or(content),
-                                        )
-                                    }
-                                    _ => {}
-                                }
-                            }
+                    } else if let Some(platform_prop) = subprop.strip_prefix("id:") {
+                        match platform_prop {
+                            "iphone" => app_data.id_iphone = Some(content),
+                            "ipad" => app_data.id_ipad = Some(content),
+                            "googleplay" => app_data.id_googleplay = Some(content),
+                            _ => {}
                         }
-                        _ if prop.starts_with("app:") => {
-                            has_app_data = true;
-                            let subprop = &prop[4..];
-
-                            if let Some(platform_prop) = subprop.strip_prefix("name:") {
-                                match platform_prop {
-                                    "iphone" => app_data.name_iphone = Some(content),
-                                    "ipad" => app_data.name_ipad = Some(content),
-                                    "googleplay" => app_data.name_googleplay = Some(content),
-                                    _ => {}
-                                }
-                            } else if let Some(platform_prop) = subprop.strip_prefix("id:") {
-                                match platform_prop {
-                                    "iphone" => app_data.id_iphone = Some(content),
-                                    "ipad" => app_data.id_ipad = Some(content),
-                                    "googleplay" => app_data.id_googleplay = Some(content),
-                                    _ => {}
-                                }
-                            } else if let Some(platform_prop) = subprop.strip_prefix("url:") {
-                                match platform_prop {
-                                    "iphone" => app_data.url_iphone = Some(content),
-                                    "ipad" => app_data.url_ipad = Some(content),
-                                    "googleplay" => app_data.url_googleplay = Some(content),
-                                    _ => {}
-                                }
-                            } else if subprop == "country" {
-                                app_data.country = Some(content);
-                            }
+                    } else if let Some(platform_prop) = subprop.strip_prefix("url:") {
+                        match platform_prop {
+                            "iphone" => app_data.url_iphone = Some(content),
+                            "ipad" => app_data.url_ipad = Some(content),
+                            "googleplay" => app_data.url_googleplay = Some(content),
+                            _ => {}
                         }
-                        _ => {}
+                    } else if subprop == "country" {
+                        app_data.country = Some(content);
                     }
                 }
+                _ => {}
             }
         }
     }
@@ -138,7 +149,7 @@ pub fn extract(html: &str, base_url: Option<&str>) -> Result<TwitterCard> {
         card.app = Some(app_data);
     }
 
-    Ok(card)
+    card
 }
 
 /// Extract Twitter Card with fallback to Open Graph
@@ -153,24 +164,54 @@ pub fn extract(html: &str, base_url: Option<&str>) -> Result<TwitterCard> {
 /// # Returns
 /// * `Result<TwitterCard>` - Extracted Twitter Card data with OG fallback
 pub fn extract_with_fallback(html: &str, base_url: Option<&str>) -> Result<TwitterCard> {
-    let mut card = extract(html, base_url)?;
+    if let Some(page) = scanner::scan(html) {
+        return Ok(extract_with_fallback_from_tags(&page.tags, base_url));
+    }
 
-    // If critical Twitter fields are missing, try Open Graph
-    if card.title.is_none() || card.description.is_none() || card.image.is_none() {
-        let og = super::opengraph::extract(html, base_url)?;
+    extract_with_fallback_from_document(&html_utils::parse_html(html), base_url)
+}
 
-        if card.title.is_none() {
-            card.title = og.title;
-        }
-        if card.description.is_none() {
-            card.description = og.description;
-        }
-        if card.image.is_none() {
-            card.image = og.image;
-        }
+/// Extract Twitter Card with Open Graph fallback from an already parsed document
+pub fn extract_with_fallback_from_document(
+    document: &Html,
+    base_url: Option<&str>,
+) -> Result<TwitterCard> {
+    Ok(extract_with_fallback_from_tags(&scanner::document_tags(document), base_url))
+}
+
+/// Build a Twitter Card with Open Graph fallback from a page's tags
+pub fn extract_with_fallback_from_tags<T: TagAttributes>(
+    tags: &[T],
+    base_url: Option<&str>,
+) -> TwitterCard {
+    let mut card = extract_from_tags(tags, base_url);
+
+    // If critical Twitter fields are missing, try Open Graph
+    if needs_fallback(&card) {
+        fill_from_opengraph(&mut card, &super::opengraph::extract_from_tags(tags, base_url));
     }
 
-    Ok(card)
+    card
+}
+
+/// Whether any field the Open Graph fallback can supply is missing
+fn needs_fallback(card: &TwitterCard) -> bool {
+    card.title.is_none() || card.description.is_none() || card.image.is_none()
+}
+
+/// Fill missing title, description and image from already extracted Open Graph data
+///
+/// Lets `extract_all` reuse its Open Graph result instead of extracting it twice.
+pub fn fill_from_opengraph(card: &mut TwitterCard, og: &OpenGraph) {
+    if card.title.is_none() {
+        card.title = og.title.clone();
+    }
+    if card.description.is_none() {
+        card.description = og.description.clone();
+    }
+    if card.image.is_none() {
+        card.image = og.image.clone();
+    }
 }
 
 #[cfg(test)]
@@ -206,6 +247,38 @@ mod tests {
         assert_eq!(card.image, Some("https://example.com/og-image.jpg".to_string()));
     }
 
+    #[test]
+    fn test_fallback_from_shared_document() {
+        let html = r#"
+            <meta name="twitter:card" content="summary">
+            <meta property="og:title" content="OG Title">
+        "#;
+        let document = html_utils::parse_html(html);
+        let card = extract_with_fallback_from_document(&document, None).unwrap();
+
+        assert_eq!(card, extract_with_fallback(html, None).unwrap());
+        assert_eq!(card.card, Some("summary".to_string()));
+        assert_eq!(card.title, Some("OG Title".to_string()));
+    }
+
+    #[test]
+    fn test_fill_from_extracted_opengraph() {
+        let html = r#"
+            <meta name="twitter:card" content="summary">
+            <meta name="twitter:title" content="Twitter Title">
+            <meta property="og:title" content="OG Title">
+            <meta property="og:description" content="OG Description">
+        "#;
+        let tags = scanner::scan(html).unwrap().tags;
+        let mut card = extract_from_tags(&tags, None);
+        let og = crate::extractors::social::opengraph::extract_from_tags(&tags, None);
+        fill_from_opengraph(&mut card, &og);
+
+        assert_eq!(card, extract_with_fallback(html, None).unwrap());
+        assert_eq!(card.title, Some("Twitter Title".to_string()));
+        assert_eq!(card.description, Some("OG Description".to_string()));
+    }
+
     #[test]
     fn test_twitter_takes_precedence() {
         let html = r#"
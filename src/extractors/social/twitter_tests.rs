@@ -491,4 +491,23 @@ mod tests {
         // Should handle malformed URL gracefully
         assert!(card.player.is_some());
     }
+
+    // ========== SCANNER / DOM PARITY ==========
+
+    #[test]
+    fn test_scanner_fallback_matches_dom() {
+        use crate::extractors::social::twitter::extract_with_fallback_from_document;
+
+        // Tables make the scanner defer to the full parser
+        let html = r#"
+            <meta name="twitter:card" content="summary">
+            <meta property="og:title" content="OG Title">
+            <table><tr><td><meta name="twitter:description" content="In a table"></td></tr></table>
+        "#;
+        let document = crate::extractors::common::html_utils::parse_html(html);
+        let card = extract_with_fallback(html, None).unwrap();
+        assert_eq!(card, extract_with_fallback_from_document(&document, None).unwrap());
+        assert_eq!(card.title, Some("OG Title".to_string()));
+        assert_eq!(card.description, Some("In a table".to_string()));
+    }
 }
@@ -1,12 +1,22 @@
 // PyO3 macro expansions can trigger false positive clippy warnings
 #![allow(clippy::useless_conversion)]
 
+#[cfg(feature = "python")]
+use pyo3::buffer::PyBuffer;
+#[cfg(feature = "python")]
+use pyo3::intern;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
-use pyo3::types::{PyDict, PyList};
+use pyo3::pybacked::PyBackedStr;
+#[cfg(feature = "python")]
+use pyo3::types::{PyBytes, PyDict, PyList};
+#[cfg(feature = "python")]
+use std::borrow::Cow;
 #[cfg(feature = "python")]
 use std::collections::HashMap;
+#[cfg(feature = "python")]
+use std::sync::{Arc, Mutex};
 
 mod errors;
 mod extractors;
@@ -29,24 +39,23 @@ pub use extractors::common::{html_utils, url_utils};
 #[pyfunction]
 #[pyo3(signature = (html, base_url=None))]
 fn extract_microformats(
+    py: Python,
     html: &str,
     base_url: Option<&str>,
 ) -> PyResult<HashMap<String, Vec<PyObject>>> {
-    Python::with_gil(|py| {
-        let result = parser::parse_html(html, base_url)
-            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+    let result = py
+        .allow_threads(|| parser::parse_html(html, base_url))
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
 
-        let mut py_result = HashMap::new();
+    let mut py_result = HashMap::with_capacity(result.len());
 
-        // Convert Rust data structures to Python objects
-        for (format_type, items) in result.iter() {
-            let py_items: Vec<PyObject> =
-                items.iter().map(|item| item.to_py_dict(py).into()).collect();
-            py_result.insert(format_type.clone(), py_items);
-        }
+    // Convert Rust data structures to Python objects
+    for (format_type, items) in result {
+        let py_items: Vec<PyObject> = items.iter().map(|item| item.to_py_dict(py).into()).collect();
+        py_result.insert(format_type, py_items);
+    }
 
-        Ok(py_result)
-    })
+    Ok(py_result)
 }
 
 #[cfg(feature = "python")]
@@ -60,7 +69,7 @@ py_extractor_binding!(extract_hevent, hevent, HEvent);
 #[cfg(feature = "python")]
 py_extractor_binding!(extract_hreview, hreview, HReview);
 #[cfg(feature = "python")]
-py_extractor_binding!(extract_hrecipe, hrecipe, HRecipe);
+py_extractor_binding!(extract_hrecipe, hrecipe, HRecipe, extract_streaming);
 
 #[cfg(feature = "python")]
 py_extractor_binding!(extract_hproduct, hproduct, HProduct);
@@ -74,6 +83,34 @@ py_extractor_binding!(extract_hadr, hadr, HAdr);
 #[cfg(feature = "python")]
 py_extractor_binding!(extract_hgeo, hgeo, HGeo);
 
+/// Run `extract` over every document in `htmls` with the GIL released
+///
+/// Documents are extracted in parallel on the rayon thread pool. Results are
+/// returned in input order; the first extraction error aborts the batch.
+///
+/// The bindings pass `PyBackedStr`s, which borrow each Python string's UTF-8
+/// buffer instead of copying the page into a new `String`.
+#[cfg(feature = "python")]
+fn run_batch<S, T, F>(py: Python, htmls: &[S], extract: F) -> Result<Vec<T>>
+where
+    S: AsRef<str> + Sync,
+    T: Send,
+    F: Fn(&str) -> Result<T> + Send + Sync,
+{
+    use rayon::prelude::*;
+
+    py.allow_threads(|| htmls.par_iter().map(|html| extract(html.as_ref())).collect())
+}
+
+#[cfg(feature = "python")]
+py_batch_binding!(extract_hcard_batch, hcard);
+
+#[cfg(feature = "python")]
+py_batch_binding!(extract_hadr_batch, hadr);
+
+#[cfg(feature = "python")]
+py_batch_binding!(extract_hproduct_batch, hproduct);
+
 #[cfg(feature = "python")]
 /// Extract standard HTML meta tags
 ///
@@ -104,7 +141,8 @@ py_extractor_binding!(extract_hgeo, hgeo, HGeo);
 #[pyfunction]
 #[pyo3(signature = (html, base_url=None))]
 fn extract_meta(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py<PyDict>> {
-    let meta = extractors::meta::extract(html, base_url)
+    let meta = py
+        .allow_threads(|| extractors::meta::extract(html, base_url))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
     Ok(meta.to_py_dict(py))
 }
@@ -127,7 +165,8 @@ fn extract_meta(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py<P
 #[pyfunction]
 #[pyo3(signature = (html, base_url=None))]
 fn extract_opengraph(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py<PyDict>> {
-    let og = extractors::social::extract_opengraph(html, base_url)
+    let og = py
+        .allow_threads(|| extractors::social::extract_opengraph(html, base_url))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
     Ok(og.to_py_dict(py))
 }
@@ -150,7 +189,8 @@ fn extract_opengraph(py: Python, html: &str, base_url: Option<&str>) -> PyResult
 #[pyfunction]
 #[pyo3(signature = (html, base_url=None))]
 fn extract_twitter(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py<PyDict>> {
-    let card = extractors::social::extract_twitter(html, base_url)
+    let card = py
+        .allow_threads(|| extractors::social::extract_twitter(html, base_url))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
     Ok(card.to_py_dict(py))
 }
@@ -176,7 +216,8 @@ fn extract_twitter_with_fallback(
     html: &str,
     base_url: Option<&str>,
 ) -> PyResult<Py<PyDict>> {
-    let card = extractors::social::extract_twitter_with_fallback(html, base_url)
+    let card = py
+        .allow_threads(|| extractors::social::extract_twitter_with_fallback(html, base_url))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
     Ok(card.to_py_dict(py))
 }
@@ -200,14 +241,37 @@ fn extract_twitter_with_fallback(
 #[pyfunction]
 #[pyo3(signature = (html, base_url=None))]
 fn extract_jsonld(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py<PyList>> {
-    let objects = extractors::jsonld::extract(html, base_url)
+    let objects = py
+        .allow_threads(|| extractors::jsonld::extract(html, base_url))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
-    let list = PyList::empty_bound(py);
-    for obj in objects {
-        list.append(obj.to_py_dict(py)).unwrap();
-    }
-    Ok(list.unbind())
+    Ok(PyList::new_bound(py, types::jsonld::JsonLdObject::to_py_dicts(py, &objects)).unbind())
+}
+
+/// Extract JSON-LD structured data from raw HTML bytes
+///
+/// Same as `extract_jsonld`, but takes the undecoded response body, read as
+/// UTF-8 like `extract_all_bytes` does.
+///
+/// Args:
+///     html (bytes | bytearray | memoryview): UTF-8 encoded HTML content to extract from
+///     base_url (str, optional): Base URL (not used for JSON-LD but included for consistency)
+///
+/// Returns:
+///     list: The same list `extract_jsonld` returns
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> jsonld = meta_oxide.extract_jsonld_bytes(requests.get(url).content)
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(signature = (html, base_url=None))]
+fn extract_jsonld_bytes(
+    py: Python,
+    html: &Bound<'_, PyAny>,
+    base_url: Option<&str>,
+) -> PyResult<Py<PyList>> {
+    extract_jsonld(py, &decode_html_bytes(html)?, base_url)
 }
 
 /// Extract HTML5 Microdata (Phase 4)
@@ -231,7 +295,8 @@ fn extract_jsonld(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py
 #[pyfunction]
 #[pyo3(signature = (html, base_url=None))]
 fn extract_microdata(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py<PyList>> {
-    let items = extractors::microdata::extract(html, base_url)
+    let items = py
+        .allow_threads(|| extractors::microdata::extract(html, base_url))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
     let list = PyList::empty_bound(py);
@@ -260,7 +325,8 @@ fn extract_microdata(py: Python, html: &str, base_url: Option<&str>) -> PyResult
 #[pyfunction]
 #[pyo3(signature = (html))]
 fn extract_dublin_core(py: Python, html: &str) -> PyResult<Py<PyDict>> {
-    let dc = extractors::dublin_core::extract(html)
+    let dc = py
+        .allow_threads(|| extractors::dublin_core::extract(html))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
     Ok(dc.to_py_dict(py))
 }
@@ -285,8 +351,13 @@ fn extract_dublin_core(py: Python, html: &str) -> PyResult<Py<PyDict>> {
 #[cfg(feature = "python")]
 #[pyfunction]
 #[pyo3(signature = (html, base_url=None))]
-fn extract_rel_links(html: &str, base_url: Option<&str>) -> PyResult<HashMap<String, Vec<String>>> {
-    let links = extractors::rel_links::extract(html, base_url)
+fn extract_rel_links(
+    py: Python,
+    html: &str,
+    base_url: Option<&str>,
+) -> PyResult<HashMap<String, Vec<String>>> {
+    let links = py
+        .allow_threads(|| extractors::rel_links::extract(html, base_url))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
     Ok(links)
 }
@@ -314,7 +385,8 @@ fn extract_rel_links(html: &str, base_url: Option<&str>) -> PyResult<HashMap<Str
 #[pyfunction]
 #[pyo3(signature = (html, base_url=None))]
 fn extract_oembed(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py<PyDict>> {
-    let oembed = extractors::oembed::extract(html, base_url)
+    let oembed = py
+        .allow_threads(|| extractors::oembed::extract(html, base_url))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
     Ok(oembed.to_py_dict(py))
 }
@@ -341,7 +413,8 @@ fn extract_oembed(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py
 #[pyfunction]
 #[pyo3(signature = (html, base_url=None))]
 fn extract_rdfa(py: Python, html: &str, base_url: Option<&str>) -> PyResult<PyObject> {
-    let items = extractors::rdfa::extract(html, base_url)
+    let items = py
+        .allow_threads(|| extractors::rdfa::extract(html, base_url))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
     let list = PyList::empty_bound(py);
@@ -371,7 +444,8 @@ fn extract_rdfa(py: Python, html: &str, base_url: Option<&str>) -> PyResult<PyOb
 #[pyfunction]
 #[pyo3(signature = (html, base_url=None))]
 fn extract_manifest(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py<PyDict>> {
-    let discovery = extractors::manifest::extract(html, base_url)
+    let discovery = py
+        .allow_threads(|| extractors::manifest::extract(html, base_url))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
     Ok(discovery.to_py_dict(py))
 }
@@ -397,7 +471,8 @@ fn extract_manifest(py: Python, html: &str, base_url: Option<&str>) -> PyResult<
 #[pyfunction]
 #[pyo3(signature = (json, base_url=None))]
 fn parse_manifest(py: Python, json: &str, base_url: Option<&str>) -> PyResult<Py<PyDict>> {
-    let manifest = extractors::manifest::parse_manifest(json, base_url)
+    let manifest = py
+        .allow_threads(|| extractors::manifest::parse_manifest(json, base_url))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
     Ok(manifest.to_py_dict(py))
 }
@@ -437,225 +512,830 @@ fn parse_manifest(py: Python, json: &str, base_url: Option<&str>) -> PyResult<Py
 #[pyfunction]
 #[pyo3(signature = (html, base_url=None))]
 fn extract_all(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Py<PyDict>> {
-    let dict = PyDict::new_bound(py);
-
-    // Extract Phase 1: Standard Meta Tags
-    match extractors::meta::extract(html, base_url) {
-        Ok(meta_tags) => {
-            dict.set_item("meta", meta_tags.to_py_dict(py))?;
+    let cached = lock_extract_all_cache().as_mut().and_then(|cache| cache.get(html, base_url));
+    let data = match cached {
+        Some(data) => data,
+        None => {
+            // Parsing and extraction never touch Python objects, so let other
+            // threads run meanwhile
+            let data = py.allow_threads(|| Arc::new(AllData::from_html(html, base_url)));
+            if let Some(cache) = lock_extract_all_cache().as_mut() {
+                cache.insert(html, base_url, Arc::clone(&data));
+            }
+            data
         }
-        Err(e) => {
-            // Log error but continue with other extractors
-            eprintln!("Meta extraction warning: {}", e);
+    };
+    // The lock is released before converting, which can run arbitrary Python code
+    data.to_py_dict(py)
+}
+
+/// Extract ALL supported structured data from raw HTML bytes
+///
+/// Same as `extract_all`, but takes the undecoded response body (e.g.
+/// `requests.get(url).content`), so there is no need to decode it in Python
+/// first. `bytes` are read as UTF-8 in place when valid; `bytearray` and
+/// `memoryview` input is copied once. Invalid sequences are replaced with
+/// U+FFFD, like `bytes.decode("utf-8", "replace")`.
+///
+/// Args:
+///     html (bytes | bytearray | memoryview): UTF-8 encoded HTML content to extract from
+///     base_url (str, optional): Base URL for resolving relative URLs
+///
+/// Returns:
+///     dict: The same dictionary `extract_all` returns
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> response = requests.get("https://example.com")
+///     >>> data = meta_oxide.extract_all_bytes(response.content, response.url)
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(signature = (html, base_url=None))]
+fn extract_all_bytes(
+    py: Python,
+    html: &Bound<'_, PyAny>,
+    base_url: Option<&str>,
+) -> PyResult<Py<PyDict>> {
+    extract_all(py, &decode_html_bytes(html)?, base_url)
+}
+
+/// Read an HTML body passed as `bytes`, `bytearray` or `memoryview` as UTF-8
+///
+/// `bytes` are immutable and borrowed in place. Other buffers are copied,
+/// since another thread could resize them while extraction runs without the
+/// GIL. Invalid sequences are replaced with U+FFFD.
+#[cfg(feature = "python")]
+fn decode_html_bytes<'a>(html: &'a Bound<'_, PyAny>) -> PyResult<Cow<'a, str>> {
+    if let Ok(bytes) = html.downcast::<PyBytes>() {
+        return Ok(String::from_utf8_lossy(bytes.as_bytes()));
+    }
+    let bytes = PyBuffer::<u8>::get_bound(html)?.to_vec(html.py())?;
+    Ok(Cow::Owned(
+        String::from_utf8(bytes)
+            .unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned()),
+    ))
+}
+
+/// Cache of `extract_all` results, installed by `enable_cache`
+#[cfg(feature = "python")]
+static EXTRACT_ALL_CACHE: Mutex<Option<ExtractAllCache>> = Mutex::new(None);
+
+#[cfg(feature = "python")]
+fn lock_extract_all_cache() -> std::sync::MutexGuard<'static, Option<ExtractAllCache>> {
+    EXTRACT_ALL_CACHE.lock().unwrap_or_else(std::sync::PoisonError::into_inner)
+}
+
+/// Least recently used cache of `extract_all` results keyed by the exact input
+///
+/// Entries are found by a randomly seeded hash of the HTML and base URL and
+/// then compared in full, so different documents never share a result.
+#[cfg(feature = "python")]
+struct ExtractAllCache {
+    capacity: usize,
+    hasher: std::collections::hash_map::RandomState,
+    /// Incremented on every access, so an entry's stamp orders it by last use
+    clock: u64,
+    entries: HashMap<u64, CachedExtraction>,
+}
+
+#[cfg(feature = "python")]
+struct CachedExtraction {
+    html: String,
+    base_url: Option<String>,
+    last_used: u64,
+    data: Arc<AllData>,
+}
+
+#[cfg(feature = "python")]
+impl ExtractAllCache {
+    fn new(capacity: usize) -> Self {
+        ExtractAllCache { capacity, hasher: Default::default(), clock: 0, entries: HashMap::new() }
+    }
+
+    fn key(&self, html: &str, base_url: Option<&str>) -> u64 {
+        use std::hash::BuildHasher;
+        self.hasher.hash_one((html, base_url))
+    }
+
+    fn get(&mut self, html: &str, base_url: Option<&str>) -> Option<Arc<AllData>> {
+        let key = self.key(html, base_url);
+        self.clock += 1;
+        let entry = self.entries.get_mut(&key)?;
+        if entry.html != html || entry.base_url.as_deref() != base_url {
+            return None;
         }
+        entry.last_used = self.clock;
+        Some(Arc::clone(&entry.data))
     }
 
-    // Extract Phase 2: Open Graph
-    match extractors::social::extract_opengraph(html, base_url) {
-        Ok(og) => {
-            dict.set_item("opengraph", og.to_py_dict(py))?;
+    fn insert(&mut self, html: &str, base_url: Option<&str>, data: Arc<AllData>) {
+        let key = self.key(html, base_url);
+        if self.entries.len() >= self.capacity && !self.entries.contains_key(&key) {
+            // Linear scan for the oldest entry; caches are small next to the cost
+            // of the parse every hit saves
+            let oldest =
+                self.entries.iter().min_by_key(|(_, entry)| entry.last_used).map(|(&key, _)| key);
+            if let Some(oldest) = oldest {
+                self.entries.remove(&oldest);
+            }
         }
-        Err(e) => {
-            eprintln!("OpenGraph extraction warning: {}", e);
+        self.clock += 1;
+        let entry = CachedExtraction {
+            html: html.to_string(),
+            base_url: base_url.map(str::to_string),
+            last_used: self.clock,
+            data,
+        };
+        self.entries.insert(key, entry);
+    }
+}
+
+/// Cache `extract_all` results for repeated identical inputs
+///
+/// Crawlers often fetch the same page again (sitemap re-checks, feed
+/// refreshes). With the cache enabled, `extract_all` remembers the results for
+/// the last `size` distinct `(html, base_url)` pairs and skips parsing and
+/// extraction when it sees one again. Every call still returns a new
+/// dictionary, so modifying a result never affects later calls.
+///
+/// Calling this again replaces the cache with an empty one of the new size;
+/// a size of 0 disables caching (the default).
+///
+/// Args:
+///     size (int): Maximum number of documents to remember
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> meta_oxide.enable_cache(1024)
+///     >>> data = meta_oxide.extract_all(html, "https://example.com")
+#[cfg(feature = "python")]
+#[pyfunction]
+fn enable_cache(size: usize) {
+    *lock_extract_all_cache() = (size > 0).then(|| ExtractAllCache::new(size));
+}
+
+/// Everything `extract_all` finds in one document, before conversion to Python
+///
+/// Extraction needs no Python objects, so `extract_all_batch` can collect
+/// this for many documents with the GIL released and convert afterwards.
+#[cfg(feature = "python")]
+#[derive(Default)]
+struct AllData {
+    meta: Option<types::meta::MetaTags>,
+    opengraph: Option<types::social::OpenGraph>,
+    twitter: Option<types::social::TwitterCard>,
+    jsonld: Vec<types::jsonld::JsonLdObject>,
+    microdata: Vec<types::microdata::MicrodataItem>,
+    hcard: Vec<HCard>,
+    hentry: Vec<HEntry>,
+    hevent: Vec<HEvent>,
+    hreview: Vec<HReview>,
+    hrecipe: Vec<HRecipe>,
+    hproduct: Vec<HProduct>,
+    hfeed: Vec<HFeed>,
+    hadr: Vec<HAdr>,
+    hgeo: Vec<HGeo>,
+    oembed: Option<types::oembed::OEmbedDiscovery>,
+    dublin_core: Option<types::dublin_core::DublinCore>,
+    rel_links: HashMap<String, Vec<String>>,
+    rdfa: Vec<types::rdfa::RdfaItem>,
+    manifest: Option<types::manifest::ManifestDiscovery>,
+}
+
+#[cfg(feature = "python")]
+impl AllData {
+    /// Parse `html` and run every extractor over it
+    ///
+    /// Input without any markup parses to empty `<html>`, `<head>` and
+    /// `<body>` elements, so its result is known without building a DOM: the
+    /// head-metadata sections, all empty.
+    fn from_html(html: &str, base_url: Option<&str>) -> Self {
+        if !html_utils::has_markup(html) {
+            return AllData {
+                meta: Some(Default::default()),
+                opengraph: Some(Default::default()),
+                twitter: Some(Default::default()),
+                dublin_core: Some(Default::default()),
+                ..Default::default()
+            };
         }
+        Self::extract(&html_utils::parse_html(html), base_url)
     }
 
-    // Extract Phase 2: Twitter Cards (with fallback to OG)
-    match extractors::social::extract_twitter_with_fallback(html, base_url) {
-        Ok(twitter) => {
-            dict.set_item("twitter", twitter.to_py_dict(py))?;
+    /// Run every extractor over an already parsed document
+    ///
+    /// A failing extractor is reported on stderr and left out; the others
+    /// still run.
+    fn extract(document: &html_utils::Html, base_url: Option<&str>) -> Self {
+        let mut data = AllData::default();
+
+        // Extract Phases 1, 2 and 9: the meta, Open Graph, Twitter Card (with
+        // fallback to OG) and Dublin Core extractors all read the same head
+        // tags, so collect them in one walk
+        let head = extractors::scanner::DocumentHead::new(document);
+        data.meta = Some(extractors::meta::extract_from_tags(head.title, &head.tags, base_url));
+        let opengraph = extractors::social::opengraph::extract_from_tags(&head.tags, base_url);
+        // The Twitter Card falls back to the Open Graph result just extracted
+        let mut twitter = extractors::social::twitter::extract_from_tags(&head.tags, base_url);
+        extractors::social::twitter::fill_from_opengraph(&mut twitter, &opengraph);
+        data.opengraph = Some(opengraph);
+        data.twitter = Some(twitter);
+        data.dublin_core = Some(extractors::dublin_core::extract_from_tags(&head.tags));
+
+        // Extract Phase 3: JSON-LD (41% adoption, HIGHEST IMPACT)
+        match extractors::jsonld::extract_from_document(document, base_url) {
+            Ok(objects) => data.jsonld = objects,
+            Err(e) => eprintln!("JSON-LD extraction warning: {}", e),
         }
-        Err(e) => {
-            eprintln!("Twitter extraction warning: {}", e);
+
+        // Extract Phase 4: Microdata (26% adoption)
+        match extractors::microdata::extract_from_document(document, base_url) {
+            Ok(items) => data.microdata = items,
+            Err(e) => eprintln!("Microdata extraction warning: {}", e),
         }
-    }
 
-    // Extract Phase 3: JSON-LD (41% adoption, HIGHEST IMPACT)
-    match extractors::jsonld::extract(html, base_url) {
-        Ok(objects) => {
-            if !objects.is_empty() {
-                let list = PyList::empty_bound(py);
-                for obj in objects {
-                    list.append(obj.to_py_dict(py)).unwrap();
-                }
-                dict.set_item("jsonld", list)?;
-            }
+        // Extract Phase 7: Microformats, locating the roots of every type in one traversal
+        let roots = extractors::microformats::find_roots(document);
+        data.hcard = extractors::microformats::hcard::extract_from_roots(&roots.hcard, base_url);
+        data.hentry = extractors::microformats::hentry::extract_from_roots(&roots.hentry, base_url);
+        data.hevent = extractors::microformats::hevent::extract_from_roots(&roots.hevent, base_url);
+        data.hreview =
+            extractors::microformats::hreview::extract_from_roots(&roots.hreview, base_url);
+        data.hrecipe =
+            extractors::microformats::hrecipe::extract_from_roots(&roots.hrecipe, base_url);
+        data.hproduct =
+            extractors::microformats::hproduct::extract_from_roots(&roots.hproduct, base_url);
+        data.hfeed = extractors::microformats::hfeed::extract_from_roots(&roots.hfeed, base_url);
+        data.hadr = extractors::microformats::hadr::extract_from_roots(&roots.hadr, base_url);
+        data.hgeo = extractors::microformats::hgeo::extract_from_roots(&roots.hgeo, base_url);
+
+        // Extract Phase 5: oEmbed endpoint discovery
+        match extractors::oembed::extract_from_document(document, base_url) {
+            Ok(oembed) => data.oembed = Some(oembed).filter(|oembed| oembed.has_endpoints()),
+            Err(e) => eprintln!("oEmbed extraction warning: {}", e),
         }
-        Err(e) => {
-            eprintln!("JSON-LD extraction warning: {}", e);
+
+        // Extract rel-* link relationships
+        match extractors::rel_links::extract_from_document(document, base_url) {
+            Ok(rel_links) => data.rel_links = rel_links,
+            Err(e) => eprintln!("rel_links extraction warning: {}", e),
         }
-    }
 
-    // Extract Phase 4: Microdata (26% adoption)
-    match extractors::microdata::extract(html, base_url) {
-        Ok(items) => {
-            if !items.is_empty() {
-                let list = PyList::empty_bound(py);
-                for item in items {
-                    list.append(item.to_py_dict(py)).unwrap();
-                }
-                dict.set_item("microdata", list)?;
-            }
+        // Extract RDFa (W3C standard with 62% adoption)
+        match extractors::rdfa::extract_from_document(document, base_url) {
+            Ok(rdfa_items) => data.rdfa = rdfa_items,
+            Err(e) => eprintln!("RDFa extraction warning: {}", e),
         }
-        Err(e) => {
-            eprintln!("Microdata extraction warning: {}", e);
+
+        // Extract Web App Manifest link
+        match extractors::manifest::extract_from_document(document, base_url) {
+            Ok(discovery) => {
+                data.manifest = Some(discovery).filter(|discovery| discovery.href.is_some())
+            }
+            Err(e) => eprintln!("Manifest extraction warning: {}", e),
         }
+
+        data
     }
 
-    // Extract Phase 7: Microformats (already implemented)
-    let mf_dict = PyDict::new_bound(py);
-    let mut has_microformats = false;
+    /// Whether any microformat root was found
+    fn has_microformats(&self) -> bool {
+        !(self.hcard.is_empty()
+            && self.hentry.is_empty()
+            && self.hevent.is_empty()
+            && self.hreview.is_empty()
+            && self.hrecipe.is_empty()
+            && self.hproduct.is_empty()
+            && self.hfeed.is_empty()
+            && self.hadr.is_empty()
+            && self.hgeo.is_empty())
+    }
 
-    // Extract h-card
-    if let Ok(hcards) = extractors::microformats::hcard::extract(html, base_url) {
-        if !hcards.is_empty() {
-            let cards: Vec<_> = hcards.iter().map(|card| card.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-card", cards)?;
-            has_microformats = true;
+    /// Convert to the dictionary returned by `extract_all`, omitting formats with no data
+    fn to_py_dict(&self, py: Python) -> PyResult<Py<PyDict>> {
+        let present = [
+            self.meta.is_some(),
+            self.opengraph.is_some(),
+            self.twitter.is_some(),
+            !self.jsonld.is_empty(),
+            !self.microdata.is_empty(),
+            self.has_microformats(),
+            self.oembed.is_some(),
+            self.dublin_core.is_some(),
+            !self.rel_links.is_empty(),
+            !self.rdfa.is_empty(),
+            self.manifest.is_some(),
+        ];
+        let dict = types::presized_dict(py, present.iter().filter(|&&present| present).count());
+
+        if let Some(meta) = &self.meta {
+            dict.set_item(intern!(py, "meta"), meta.to_py_dict(py))?;
+        }
+        if let Some(og) = &self.opengraph {
+            dict.set_item(intern!(py, "opengraph"), og.to_py_dict(py))?;
+        }
+        if let Some(twitter) = &self.twitter {
+            dict.set_item(intern!(py, "twitter"), twitter.to_py_dict(py))?;
+        }
+        if !self.jsonld.is_empty() {
+            let list =
+                PyList::new_bound(py, types::jsonld::JsonLdObject::to_py_dicts(py, &self.jsonld));
+            dict.set_item(intern!(py, "jsonld"), list)?;
+        }
+        if !self.microdata.is_empty() {
+            let list = PyList::new_bound(py, self.microdata.iter().map(|item| item.to_py_dict(py)));
+            dict.set_item(intern!(py, "microdata"), list)?;
         }
-    }
 
-    // Extract h-entry
-    if let Ok(entries) = extractors::microformats::hentry::extract(html, base_url) {
-        if !entries.is_empty() {
-            let entries_py: Vec<_> = entries.iter().map(|e| e.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-entry", entries_py)?;
-            has_microformats = true;
+        let mf_dict = PyDict::new_bound(py);
+        if !self.hcard.is_empty() {
+            mf_dict.set_item(intern!(py, "h-card"), HCard::to_py_dicts(py, &self.hcard))?;
+        }
+        if !self.hentry.is_empty() {
+            mf_dict.set_item(intern!(py, "h-entry"), HEntry::to_py_dicts(py, &self.hentry))?;
+        }
+        if !self.hevent.is_empty() {
+            mf_dict.set_item(intern!(py, "h-event"), HEvent::to_py_dicts(py, &self.hevent))?;
+        }
+        if !self.hreview.is_empty() {
+            mf_dict.set_item(intern!(py, "h-review"), HReview::to_py_dicts(py, &self.hreview))?;
+        }
+        if !self.hrecipe.is_empty() {
+            mf_dict.set_item(intern!(py, "h-recipe"), HRecipe::to_py_dicts(py, &self.hrecipe))?;
+        }
+        if !self.hproduct.is_empty() {
+            let products = HProduct::to_py_dicts(py, &self.hproduct);
+            mf_dict.set_item(intern!(py, "h-product"), products)?;
+        }
+        if !self.hfeed.is_empty() {
+            mf_dict.set_item(intern!(py, "h-feed"), HFeed::to_py_dicts(py, &self.hfeed))?;
+        }
+        if !self.hadr.is_empty() {
+            mf_dict.set_item(intern!(py, "h-adr"), HAdr::to_py_dicts(py, &self.hadr))?;
+        }
+        if !self.hgeo.is_empty() {
+            mf_dict.set_item(intern!(py, "h-geo"), HGeo::to_py_dicts(py, &self.hgeo))?;
+        }
+        if !mf_dict.is_empty() {
+            dict.set_item(intern!(py, "microformats"), mf_dict)?;
         }
-    }
 
-    // Extract h-event
-    if let Ok(events) = extractors::microformats::hevent::extract(html, base_url) {
-        if !events.is_empty() {
-            let events_py: Vec<_> = events.iter().map(|e| e.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-event", events_py)?;
-            has_microformats = true;
+        if let Some(oembed) = &self.oembed {
+            dict.set_item(intern!(py, "oembed"), oembed.to_py_dict(py))?;
+        }
+        if let Some(dc) = &self.dublin_core {
+            dict.set_item(intern!(py, "dublin_core"), dc.to_py_dict(py))?;
         }
+        if !self.rel_links.is_empty() {
+            dict.set_item(intern!(py, "rel_links"), &self.rel_links)?;
+        }
+        if !self.rdfa.is_empty() {
+            let list = PyList::new_bound(py, self.rdfa.iter().map(|item| item.to_py_dict(py)));
+            dict.set_item(intern!(py, "rdfa"), list)?;
+        }
+        if let Some(discovery) = &self.manifest {
+            dict.set_item(intern!(py, "manifest"), discovery.to_py_dict(py))?;
+        }
+
+        Ok(dict.unbind())
     }
+}
+
+/// A parsed HTML document that can be queried for any metadata format
+///
+/// Parsing is usually the most expensive part of extraction. A `Document`
+/// parses its HTML once, and every `extract_*` method reuses that tree, so
+/// pulling several formats out of the same page costs a single parse.
+/// `extract_all` also runs the extractors only once per document; later calls
+/// just build fresh dictionaries from the stored results, and so do
+/// `extract_meta`, `extract_opengraph`, `extract_twitter_with_fallback` and
+/// `extract_dublin_core` once `extract_all` has been called.
+///
+/// Args:
+///     html (str): HTML content to parse
+///     base_url (str, optional): Base URL for resolving relative URLs
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> doc = meta_oxide.Document(html, "https://example.com")
+///     >>> meta = doc.extract_meta()
+///     >>> recipes = doc.extract_hrecipe()
+///     >>> data = doc.extract_all()
+#[cfg(feature = "python")]
+#[pyclass(unsendable, module = "meta_oxide")]
+struct Document {
+    document: html_utils::Html,
+    base_url: Option<String>,
+    /// Results of `extract_all`, filled on its first call
+    all: std::cell::OnceCell<AllData>,
+}
+
+/// Convert microformat extraction results the same way the `extract_h*` functions do
+#[cfg(feature = "python")]
+fn microformat_objects<T>(
+    items: Result<Vec<T>>,
+    to_py: impl FnOnce(&[T]) -> Vec<PyObject>,
+) -> PyResult<Vec<PyObject>> {
+    let items =
+        items.map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+    Ok(to_py(&items))
+}
 
-    // Extract h-review
-    if let Ok(reviews) = extractors::microformats::hreview::extract(html, base_url) {
-        if !reviews.is_empty() {
-            let reviews_py: Vec<_> = reviews.iter().map(|r| r.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-review", reviews_py)?;
-            has_microformats = true;
+#[cfg(feature = "python")]
+#[pymethods]
+impl Document {
+    #[new]
+    #[pyo3(signature = (html, base_url=None))]
+    fn new(html: &str, base_url: Option<String>) -> Self {
+        Document {
+            document: html_utils::parse_html(html),
+            base_url,
+            all: std::cell::OnceCell::new(),
         }
     }
 
-    // Extract h-recipe
-    if let Ok(recipes) = extractors::microformats::hrecipe::extract(html, base_url) {
-        if !recipes.is_empty() {
-            let recipes_py: Vec<_> = recipes.iter().map(|r| r.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-recipe", recipes_py)?;
-            has_microformats = true;
-        }
+    /// Base URL used for resolving relative URLs
+    #[getter]
+    fn base_url(&self) -> Option<&str> {
+        self.base_url.as_deref()
     }
 
-    // Extract h-product
-    if let Ok(products) = extractors::microformats::hproduct::extract(html, base_url) {
-        if !products.is_empty() {
-            let products_py: Vec<_> =
-                products.iter().map(|p| p.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-product", products_py)?;
-            has_microformats = true;
-        }
+    /// Extract all supported formats, like `extract_all`
+    fn extract_all(&self, py: Python) -> PyResult<Py<PyDict>> {
+        self.all.get_or_init(|| AllData::extract(&self.document, self.base_url())).to_py_dict(py)
     }
 
-    // Extract h-feed
-    if let Ok(feeds) = extractors::microformats::hfeed::extract(html, base_url) {
-        if !feeds.is_empty() {
-            let feeds_py: Vec<_> = feeds.iter().map(|f| f.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-feed", feeds_py)?;
-            has_microformats = true;
+    /// Extract standard HTML meta tags, like `extract_meta`
+    fn extract_meta(&self, py: Python) -> PyResult<Py<PyDict>> {
+        if let Some(meta) = self.all.get().and_then(|all| all.meta.as_ref()) {
+            return Ok(meta.to_py_dict(py));
         }
+        let meta = extractors::meta::extract_from_document(&self.document, self.base_url())
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        Ok(meta.to_py_dict(py))
     }
 
-    // Extract h-adr
-    if let Ok(addresses) = extractors::microformats::hadr::extract(html, base_url) {
-        if !addresses.is_empty() {
-            let addresses_py: Vec<_> =
-                addresses.iter().map(|a| a.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-adr", addresses_py)?;
-            has_microformats = true;
+    /// Extract Open Graph metadata, like `extract_opengraph`
+    fn extract_opengraph(&self, py: Python) -> PyResult<Py<PyDict>> {
+        if let Some(opengraph) = self.all.get().and_then(|all| all.opengraph.as_ref()) {
+            return Ok(opengraph.to_py_dict(py));
         }
+        let og =
+            extractors::social::opengraph::extract_from_document(&self.document, self.base_url())
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        Ok(og.to_py_dict(py))
+    }
+
+    /// Extract Twitter Card metadata, like `extract_twitter`
+    fn extract_twitter(&self, py: Python) -> PyResult<Py<PyDict>> {
+        let card =
+            extractors::social::twitter::extract_from_document(&self.document, self.base_url())
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        Ok(card.to_py_dict(py))
     }
 
-    // Extract h-geo
-    if let Ok(geos) = extractors::microformats::hgeo::extract(html, base_url) {
-        if !geos.is_empty() {
-            let geos_py: Vec<_> = geos.iter().map(|g| g.to_py_dict(py).into_py(py)).collect();
-            mf_dict.set_item("h-geo", geos_py)?;
-            has_microformats = true;
+    /// Extract Twitter Card metadata with Open Graph fallback, like `extract_twitter_with_fallback`
+    fn extract_twitter_with_fallback(&self, py: Python) -> PyResult<Py<PyDict>> {
+        if let Some(twitter) = self.all.get().and_then(|all| all.twitter.as_ref()) {
+            return Ok(twitter.to_py_dict(py));
         }
+        let card = extractors::social::twitter::extract_with_fallback_from_document(
+            &self.document,
+            self.base_url(),
+        )
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        Ok(card.to_py_dict(py))
     }
 
-    if has_microformats {
-        dict.set_item("microformats", mf_dict)?;
+    /// Extract JSON-LD structured data, like `extract_jsonld`
+    fn extract_jsonld(&self, py: Python) -> PyResult<Py<PyList>> {
+        let objects = extractors::jsonld::extract_from_document(&self.document, self.base_url())
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        Ok(PyList::new_bound(py, types::jsonld::JsonLdObject::to_py_dicts(py, &objects)).unbind())
     }
 
-    // Extract Phase 5: oEmbed endpoint discovery
-    match extractors::oembed::extract(html, base_url) {
-        Ok(oembed) => {
-            if oembed.has_endpoints() {
-                dict.set_item("oembed", oembed.to_py_dict(py))?;
-            }
-        }
-        Err(e) => {
-            eprintln!("oEmbed extraction warning: {}", e);
-        }
+    /// Extract HTML5 microdata, like `extract_microdata`
+    fn extract_microdata(&self, py: Python) -> PyResult<Py<PyList>> {
+        let items =
+            extractors::microdata::extract_from_document(&self.document, self.base_url())
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        Ok(PyList::new_bound(py, items.iter().map(|item| item.to_py_dict(py))).unbind())
     }
 
-    // Extract Phase 9: Dublin Core metadata
-    match extractors::dublin_core::extract(html) {
-        Ok(dc) => {
-            dict.set_item("dublin_core", dc.to_py_dict(py))?;
-        }
-        Err(e) => {
-            eprintln!("Dublin Core extraction warning: {}", e);
+    /// Extract Dublin Core metadata, like `extract_dublin_core`
+    fn extract_dublin_core(&self, py: Python) -> PyResult<Py<PyDict>> {
+        if let Some(dublin_core) = self.all.get().and_then(|all| all.dublin_core.as_ref()) {
+            return Ok(dublin_core.to_py_dict(py));
         }
+        let dc = extractors::dublin_core::extract_from_document(&self.document)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        Ok(dc.to_py_dict(py))
     }
 
-    // Extract rel-* link relationships
-    match extractors::rel_links::extract(html, base_url) {
-        Ok(rel_links) => {
-            if !rel_links.is_empty() {
-                dict.set_item("rel_links", rel_links)?;
-            }
-        }
-        Err(e) => {
-            eprintln!("rel_links extraction warning: {}", e);
-        }
+    /// Extract rel-* link relationships, like `extract_rel_links`
+    fn extract_rel_links(&self) -> PyResult<HashMap<String, Vec<String>>> {
+        extractors::rel_links::extract_from_document(&self.document, self.base_url())
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
     }
 
-    // Extract RDFa (W3C standard with 62% adoption)
-    match extractors::rdfa::extract(html, base_url) {
-        Ok(rdfa_items) => {
-            if !rdfa_items.is_empty() {
-                let list = PyList::empty_bound(py);
-                for item in rdfa_items {
-                    list.append(item.to_py_dict(py)).unwrap();
-                }
-                dict.set_item("rdfa", list)?;
-            }
-        }
-        Err(e) => {
-            eprintln!("RDFa extraction warning: {}", e);
-        }
+    /// Discover oEmbed endpoints, like `extract_oembed`
+    fn extract_oembed(&self, py: Python) -> PyResult<Py<PyDict>> {
+        let oembed = extractors::oembed::extract_from_document(&self.document, self.base_url())
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        Ok(oembed.to_py_dict(py))
     }
 
-    // Extract Web App Manifest link
-    match extractors::manifest::extract(html, base_url) {
-        Ok(discovery) => {
-            if discovery.href.is_some() {
-                dict.set_item("manifest", discovery.to_py_dict(py))?;
-            }
+    /// Extract RDFa structured data, like `extract_rdfa`
+    fn extract_rdfa(&self, py: Python) -> PyResult<Py<PyList>> {
+        let items = extractors::rdfa::extract_from_document(&self.document, self.base_url())
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        Ok(PyList::new_bound(py, items.iter().map(|item| item.to_py_dict(py))).unbind())
+    }
+
+    /// Extract the Web App Manifest link, like `extract_manifest`
+    fn extract_manifest(&self, py: Python) -> PyResult<Py<PyDict>> {
+        let discovery =
+            extractors::manifest::extract_from_document(&self.document, self.base_url())
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+        Ok(discovery.to_py_dict(py))
+    }
+
+    /// Extract h-card microformats, like `extract_hcard`
+    fn extract_hcard(&self, py: Python) -> PyResult<Vec<PyObject>> {
+        microformat_objects(
+            extractors::microformats::hcard::extract_from_document(&self.document, self.base_url()),
+            |items| HCard::to_py_dicts(py, items),
+        )
+    }
+
+    /// Extract h-entry microformats, like `extract_hentry`
+    fn extract_hentry(&self, py: Python) -> PyResult<Vec<PyObject>> {
+        microformat_objects(
+            extractors::microformats::hentry::extract_from_document(
+                &self.document,
+                self.base_url(),
+            ),
+            |items| HEntry::to_py_dicts(py, items),
+        )
+    }
+
+    /// Extract h-event microformats, like `extract_hevent`
+    fn extract_hevent(&self, py: Python) -> PyResult<Vec<PyObject>> {
+        microformat_objects(
+            extractors::microformats::hevent::extract_from_document(
+                &self.document,
+                self.base_url(),
+            ),
+            |items| HEvent::to_py_dicts(py, items),
+        )
+    }
+
+    /// Extract h-review microformats, like `extract_hreview`
+    fn extract_hreview(&self, py: Python) -> PyResult<Vec<PyObject>> {
+        microformat_objects(
+            extractors::microformats::hreview::extract_from_document(
+                &self.document,
+                self.base_url(),
+            ),
+            |items| HReview::to_py_dicts(py, items),
+        )
+    }
+
+    /// Extract h-recipe microformats, like `extract_hrecipe`
+    fn extract_hrecipe(&self, py: Python) -> PyResult<Vec<PyObject>> {
+        microformat_objects(
+            extractors::microformats::hrecipe::extract_from_document(
+                &self.document,
+                self.base_url(),
+            ),
+            |items| HRecipe::to_py_dicts(py, items),
+        )
+    }
+
+    /// Extract h-product microformats, like `extract_hproduct`
+    fn extract_hproduct(&self, py: Python) -> PyResult<Vec<PyObject>> {
+        microformat_objects(
+            extractors::microformats::hproduct::extract_from_document(
+                &self.document,
+                self.base_url(),
+            ),
+            |items| HProduct::to_py_dicts(py, items),
+        )
+    }
+
+    /// Extract h-feed microformats, like `extract_hfeed`
+    fn extract_hfeed(&self, py: Python) -> PyResult<Vec<PyObject>> {
+        microformat_objects(
+            extractors::microformats::hfeed::extract_from_document(&self.document, self.base_url()),
+            |items| HFeed::to_py_dicts(py, items),
+        )
+    }
+
+    /// Extract h-adr microformats, like `extract_hadr`
+    fn extract_hadr(&self, py: Python) -> PyResult<Vec<PyObject>> {
+        microformat_objects(
+            extractors::microformats::hadr::extract_from_document(&self.document, self.base_url()),
+            |items| HAdr::to_py_dicts(py, items),
+        )
+    }
+
+    /// Extract h-geo microformats, like `extract_hgeo`
+    fn extract_hgeo(&self, py: Python) -> PyResult<Vec<PyObject>> {
+        microformat_objects(
+            extractors::microformats::hgeo::extract_from_document(&self.document, self.base_url()),
+            |items| HGeo::to_py_dicts(py, items),
+        )
+    }
+}
+
+/// Extract standard HTML meta tags from a list of documents
+///
+/// Equivalent to calling `extract_meta` on each document, but the whole batch
+/// is processed in a single call with the GIL released, spreading the work
+/// across all CPU cores.
+///
+/// Args:
+///     htmls (list[str]): HTML documents to extract from
+///     base_url (str, optional): Base URL for resolving relative URLs
+///
+/// Returns:
+///     list: One meta tag dictionary per input document, in input order
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> results = meta_oxide.extract_meta_batch([html1, html2])
+///     >>> print(results[0]['title'])
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(signature = (htmls, base_url=None))]
+fn extract_meta_batch(
+    py: Python,
+    htmls: Vec<PyBackedStr>,
+    base_url: Option<&str>,
+) -> PyResult<Py<PyList>> {
+    let results = run_batch(py, &htmls, |html| extractors::meta::extract(html, base_url))
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+    Ok(PyList::new_bound(py, results.iter().map(|meta| meta.to_py_dict(py))).unbind())
+}
+
+/// Extract Open Graph metadata from a list of documents
+///
+/// Args:
+///     htmls (list[str]): HTML documents to extract from
+///     base_url (str, optional): Base URL for resolving relative URLs
+///
+/// Returns:
+///     list: One Open Graph dictionary per input document, in input order
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> results = meta_oxide.extract_opengraph_batch([html1, html2])
+///     >>> print(results[1]['image'])
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(signature = (htmls, base_url=None))]
+fn extract_opengraph_batch(
+    py: Python,
+    htmls: Vec<PyBackedStr>,
+    base_url: Option<&str>,
+) -> PyResult<Py<PyList>> {
+    let results =
+        run_batch(py, &htmls, |html| extractors::social::extract_opengraph(html, base_url))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+    Ok(PyList::new_bound(py, results.iter().map(|og| og.to_py_dict(py))).unbind())
+}
+
+/// Extract Dublin Core metadata from a list of documents
+///
+/// Args:
+///     htmls (list[str]): HTML documents to extract from
+///
+/// Returns:
+///     list: One Dublin Core dictionary per input document, in input order
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> results = meta_oxide.extract_dublin_core_batch([html1, html2])
+///     >>> print(results[0].get('title'))
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(signature = (htmls))]
+fn extract_dublin_core_batch(py: Python, htmls: Vec<PyBackedStr>) -> PyResult<Py<PyList>> {
+    let results = run_batch(py, &htmls, extractors::dublin_core::extract)
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+    Ok(PyList::new_bound(py, results.iter().map(|dc| dc.to_py_dict(py))).unbind())
+}
+
+/// Extract JSON-LD structured data from a list of documents
+///
+/// Args:
+///     htmls (list[str]): HTML documents to extract from
+///     base_url (str, optional): Base URL (not used for JSON-LD but included for consistency)
+///
+/// Returns:
+///     list: One list of JSON-LD objects (dicts) per input document, in input order
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> results = meta_oxide.extract_jsonld_batch([html1, html2])
+///     >>> print([obj.get('@type') for obj in results[0]])
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(signature = (htmls, base_url=None))]
+fn extract_jsonld_batch(
+    py: Python,
+    htmls: Vec<PyBackedStr>,
+    base_url: Option<&str>,
+) -> PyResult<Py<PyList>> {
+    let results = run_batch(py, &htmls, |html| extractors::jsonld::extract(html, base_url))
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+    // One cache for the whole batch: "@context", "@type" and schema.org
+    // property names repeat across documents as much as within one
+    let mut cache = types::PyStringCache::new(py);
+    let lists = results.iter().map(|objects| {
+        PyList::new_bound(py, objects.iter().map(|obj| obj.to_py_dict_cached(&mut cache)))
+    });
+    Ok(PyList::new_bound(py, lists.collect::<Vec<_>>()).unbind())
+}
+
+/// Extract all supported structured data from a list of documents
+///
+/// Equivalent to calling `extract_all` on each document. Every document is
+/// parsed and extracted on the rayon thread pool with the GIL released; the
+/// GIL is only taken again to build the result dictionaries. The pool size
+/// follows `RAYON_NUM_THREADS` and defaults to one thread per core.
+///
+/// Args:
+///     htmls (list[str]): HTML documents to extract from
+///     base_url (str, optional): Base URL for resolving relative URLs
+///     base_urls (list[str | None], optional): One base URL per document, for
+///         batches crawled from different pages; cannot be combined with `base_url`
+///
+/// Returns:
+///     list: One `extract_all` dictionary per input document, in input order
+///
+/// Raises:
+///     ValueError: If `base_urls` does not have one entry per document, or both
+///         `base_url` and `base_urls` are given
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> results = meta_oxide.extract_all_batch([html1, html2])
+///     >>> print(results[0]['meta'].get('title'))
+///     >>> results = meta_oxide.extract_all_batch([html1, html2], base_urls=[url1, url2])
+#[cfg(feature = "python")]
+#[pyfunction]
+#[pyo3(signature = (htmls, base_url=None, *, base_urls=None))]
+fn extract_all_batch(
+    py: Python,
+    htmls: Vec<PyBackedStr>,
+    base_url: Option<&str>,
+    base_urls: Option<Vec<Option<PyBackedStr>>>,
+) -> PyResult<Py<PyList>> {
+    let results = match base_urls {
+        None => run_batch(py, &htmls, |html| Ok(AllData::from_html(html, base_url)))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?,
+        Some(_) if base_url.is_some() => {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "base_url and base_urls are mutually exclusive",
+            ));
         }
-        Err(e) => {
-            eprintln!("Manifest extraction warning: {}", e);
+        Some(base_urls) if base_urls.len() != htmls.len() => {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                "base_urls has {} entries for {} documents",
+                base_urls.len(),
+                htmls.len()
+            )));
         }
-    }
+        Some(base_urls) => {
+            use rayon::prelude::*;
+
+            py.allow_threads(|| {
+                htmls
+                    .par_iter()
+                    .zip(base_urls.par_iter())
+                    .map(|(html, base_url)| AllData::from_html(html, base_url.as_deref()))
+                    .collect::<Vec<_>>()
+            })
+        }
+    };
+    let dicts = results.iter().map(|data| data.to_py_dict(py)).collect::<PyResult<Vec<_>>>()?;
+    Ok(PyList::new_bound(py, dicts).unbind())
+}
 
-    Ok(dict.unbind())
+/// Compile every CSS selector used by the extractors ahead of time
+///
+/// Selectors are compiled lazily on first use and cached for the lifetime of the
+/// process. Calling this once at startup moves that one-time cost out of the first
+/// request, and lets pre-forking servers share the compiled selectors with workers.
+///
+/// Example:
+///     >>> import meta_oxide
+///     >>> meta_oxide.warm_up()
+#[cfg(feature = "python")]
+#[pyfunction]
+fn warm_up(py: Python) {
+    py.allow_threads(extractors::warm_up)
 }
 
 #[cfg(feature = "python")]
@@ -672,6 +1352,7 @@ fn meta_oxide(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // Phase 3: JSON-LD
     m.add_function(wrap_pyfunction!(extract_jsonld, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_jsonld_bytes, m)?)?;
 
     // Phase 4: Microdata
     m.add_function(wrap_pyfunction!(extract_microdata, m)?)?;
@@ -706,6 +1387,26 @@ fn meta_oxide(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // Main convenience function
     m.add_function(wrap_pyfunction!(extract_all, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_all_bytes, m)?)?;
+
+    // Parse once, extract many formats
+    m.add_class::<Document>()?;
+
+    // Batch extraction
+    m.add_function(wrap_pyfunction!(extract_meta_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_opengraph_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_dublin_core_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_jsonld_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_all_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_hcard_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_hadr_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(extract_hproduct_batch, m)?)?;
+
+    // Selector precompilation
+    m.add_function(wrap_pyfunction!(warm_up, m)?)?;
+
+    // Result caching
+    m.add_function(wrap_pyfunction!(enable_cache, m)?)?;
 
     // Add version
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
@@ -858,6 +1559,19 @@ mod integration_tests {
         });
     }
 
+    #[test]
+    #[cfg(feature = "python")]
+    fn test_extract_all_without_markup_skips_parsing() {
+        Python::with_gil(|py| {
+            for html in ["", "   \n", "plain text &amp; an entity"] {
+                let shortcut = AllData::from_html(html, None).to_py_dict(py).unwrap();
+                let parsed =
+                    AllData::extract(&html_utils::parse_html(html), None).to_py_dict(py).unwrap();
+                assert!(shortcut.bind(py).eq(parsed.bind(py)).unwrap(), "{:?}", html);
+            }
+        });
+    }
+
     #[test]
     #[cfg(feature = "python")]
     fn test_extract_all_with_malformed_jsonld() {
@@ -1045,6 +1759,70 @@ mod integration_tests {
         });
     }
 
+    #[test]
+    #[cfg(feature = "python")]
+    fn test_extract_all_cache_evicts_least_recently_used() {
+        let mut cache = ExtractAllCache::new(2);
+        cache.insert("a", None, Arc::new(AllData::default()));
+        cache.insert("b", None, Arc::new(AllData::default()));
+        assert!(cache.get("a", None).is_some());
+        cache.insert("c", None, Arc::new(AllData::default()));
+
+        assert!(cache.get("a", None).is_some());
+        assert!(cache.get("b", None).is_none());
+        assert!(cache.get("c", None).is_some());
+        assert!(cache.get("c", Some("https://example.com")).is_none());
+        assert_eq!(cache.entries.len(), 2);
+    }
+
+    #[test]
+    #[cfg(feature = "python")]
+    fn test_run_batch_preserves_order() {
+        Python::with_gil(|py| {
+            let htmls: Vec<String> = (0..20)
+                .map(|i| format!("<html><head><title>Page {}</title></head></html>", i))
+                .collect();
+            let results = run_batch(py, &htmls, |html| extractors::meta::extract(html, None))
+                .expect("batch extraction should succeed");
+
+            assert_eq!(results.len(), 20);
+            for (i, meta) in results.iter().enumerate() {
+                assert_eq!(meta.title, Some(format!("Page {}", i)));
+            }
+        });
+    }
+
+    #[test]
+    #[cfg(feature = "python")]
+    fn test_document_reuses_extract_all_results() {
+        Python::with_gil(|py| {
+            let html = r#"<title>Page</title>
+                <meta name="description" content="Desc">
+                <meta property="og:title" content="OG Title">
+                <meta property="og:image" content="/image.png">
+                <meta name="DC.creator" content="Author">"#;
+            let doc = Document::new(html, Some("https://example.com".to_string()));
+
+            let before = [
+                doc.extract_meta(py).unwrap(),
+                doc.extract_opengraph(py).unwrap(),
+                doc.extract_twitter_with_fallback(py).unwrap(),
+                doc.extract_dublin_core(py).unwrap(),
+            ];
+            doc.extract_all(py).unwrap();
+            let after = [
+                doc.extract_meta(py).unwrap(),
+                doc.extract_opengraph(py).unwrap(),
+                doc.extract_twitter_with_fallback(py).unwrap(),
+                doc.extract_dublin_core(py).unwrap(),
+            ];
+
+            for (before, after) in before.iter().zip(&after) {
+                assert!(before.bind(py).eq(after.bind(py)).unwrap());
+            }
+        });
+    }
+
     #[test]
     fn test_extract_each_format_separately() {
         let html = r#"
@@ -19,7 +19,9 @@
 //! ```
 //!
 //! This expands to a complete `extract()` function with proper error handling,
-//! HTML parsing, and property extraction.
+//! HTML parsing, and property extraction, plus `extract_from_document()`,
+//! `extract_from_roots()` and `extract_root()` for callers that have already
+//! parsed the page or located the root elements.
 
 /// Generate a microformat extractor function
 ///
@@ -61,19 +63,58 @@ macro_rules! microformat_extractor {
             ),* $(,)?
         }
     ) => {
-        #[allow(unused_variables)]
+        /// Selector that finds this format's root elements
+        #[allow(dead_code)]
+        pub const ROOT_SELECTOR: &str = $root_selector;
+
+        /// Selectors used to extract this format's properties
+        #[allow(dead_code)]
+        pub const PROPERTY_SELECTORS: &[&str] = &[$($selector),*];
+
         pub fn extract(html: &str, base_url: Option<&str>) -> $crate::Result<Vec<$type_name>> {
-            use $crate::html_utils;
+            // Pages without the root class cannot contain an item, so skip parsing them
+            if !$crate::html_utils::has_markup(html)
+                || !$crate::html_utils::may_match_selector(html, $root_selector)
+            {
+                return Ok(Vec::new());
+            }
+            extract_from_document(&$crate::html_utils::parse_html(html), base_url)
+        }
 
-            let document = html_utils::parse_html(html);
-            let mut items = Vec::new();
+        /// Extract from an already parsed document, so several extractors can share one parse
+        pub fn extract_from_document(
+            document: &$crate::html_utils::Html,
+            base_url: Option<&str>,
+        ) -> $crate::Result<Vec<$type_name>> {
+            let root_selector = $crate::static_selector!($root_selector);
+            Ok(document
+                .select(root_selector)
+                .map(|element| extract_root(element, base_url))
+                .collect())
+        }
 
-            let root_selector = html_utils::create_selector($root_selector)?;
+        /// Extract one item per root element found by an earlier traversal
+        #[allow(dead_code)]
+        pub fn extract_from_roots(
+            roots: &[$crate::html_utils::ElementRef],
+            base_url: Option<&str>,
+        ) -> Vec<$type_name> {
+            roots.iter().map(|&element| extract_root(element, base_url)).collect()
+        }
 
-            for element in document.select(&root_selector) {
-                let mut item = <$type_name>::default();
+        /// Extract a single item from its root element
+        #[allow(unused_variables)]
+        pub fn extract_root(
+            element: $crate::html_utils::ElementRef,
+            base_url: Option<&str>,
+        ) -> $type_name {
+            let mut item = <$type_name>::default();
+            // Properties whose class never occurs below the root are skipped
+            // without walking the subtree again
+            let classes = $crate::html_utils::ClassIndex::new(element);
 
-                $(
+            $(
+                if classes.may_match($selector) {
                     microformat_extractor!(@extract_property
                         element,
                         item,
@@ -82,12 +123,10 @@ macro_rules! microformat_extractor {
                         $selector,
                         base_url
                     );
-                )*
-
-                items.push(item);
-            }
+                }
+            )*
 
-            Ok(items)
+            item
         }
     };
 
@@ -103,20 +142,60 @@ macro_rules! microformat_extractor {
             ),* $(,)?
         }
     ) => {
-        #[allow(unused_variables)]
-        pub fn extract(html: &str, base_url: Option<&str>) -> $crate::Result<Vec<$type_name>> {
-            use $crate::html_utils;
+        /// Selector that finds this format's root elements
+        #[allow(dead_code)]
+        pub const ROOT_SELECTOR: &str = $root_selector;
 
-            let document = html_utils::parse_html(html);
-            let mut items = Vec::new();
+        /// Selectors used to extract this format's properties
+        #[allow(dead_code)]
+        pub const PROPERTY_SELECTORS: &[&str] =
+            &[$($($selector,)+)* $($nested_sel, $text_sel,)*];
 
-            let root_selector = html_utils::create_selector($root_selector)?;
+        pub fn extract(html: &str, base_url: Option<&str>) -> $crate::Result<Vec<$type_name>> {
+            // Pages without the root class cannot contain an item, so skip parsing them
+            if !$crate::html_utils::has_markup(html)
+                || !$crate::html_utils::may_match_selector(html, $root_selector)
+            {
+                return Ok(Vec::new());
+            }
+            extract_from_document(&$crate::html_utils::parse_html(html), base_url)
+        }
 
-            for element in document.select(&root_selector) {
-                let mut item = <$type_name>::default();
+        /// Extract from an already parsed document, so several extractors can share one parse
+        pub fn extract_from_document(
+            document: &$crate::html_utils::Html,
+            base_url: Option<&str>,
+        ) -> $crate::Result<Vec<$type_name>> {
+            let root_selector = $crate::static_selector!($root_selector);
+            Ok(document
+                .select(root_selector)
+                .map(|element| extract_root(element, base_url))
+                .collect())
+        }
 
-                // Extract regular properties
-                $(
+        /// Extract one item per root element found by an earlier traversal
+        #[allow(dead_code)]
+        pub fn extract_from_roots(
+            roots: &[$crate::html_utils::ElementRef],
+            base_url: Option<&str>,
+        ) -> Vec<$type_name> {
+            roots.iter().map(|&element| extract_root(element, base_url)).collect()
+        }
+
+        /// Extract a single item from its root element
+        #[allow(unused_variables)]
+        pub fn extract_root(
+            element: $crate::html_utils::ElementRef,
+            base_url: Option<&str>,
+        ) -> $type_name {
+            let mut item = <$type_name>::default();
+            // Properties whose class never occurs below the root are skipped
+            // without walking the subtree again
+            let classes = $crate::html_utils::ClassIndex::new(element);
+
+            // Extract regular properties
+            $(
+                if $(classes.may_match($selector))||+ {
                     microformat_extractor!(@extract_property
                         element,
                         item,
@@ -125,10 +204,12 @@ macro_rules! microformat_extractor {
                         $($selector),+,
                         base_url
                     );
-                )*
+                }
+            )*
 
-                // Extract dual-field properties
-                $(
+            // Extract dual-field properties
+            $(
+                if classes.may_match($nested_sel) || classes.may_match($text_sel) {
                     microformat_extractor!(@extract_dual_property
                         element,
                         item,
@@ -139,44 +220,39 @@ macro_rules! microformat_extractor {
                         $text_sel,
                         base_url
                     );
-                )*
-
-                items.push(item);
-            }
+                }
+            )*
 
-            Ok(items)
+            item
         }
     };
 
     // Extract a single text property
     (@extract_property $element:ident, $item:ident, $field:ident, text, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
-            if let Some(elem) = $element.select(&sel).next() {
-                $item.$field = $crate::html_utils::extract_text(&elem);
-            }
+        let sel = $crate::static_selector!($selector);
+        if let Some(elem) = $element.select(sel).next() {
+            $item.$field = $crate::html_utils::extract_text(&elem);
         }
     };
 
     // Extract a URL property (from href or src attribute)
     (@extract_property $element:ident, $item:ident, $field:ident, url, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
-            if let Some(elem) = $element.select(&sel).next() {
-                let url = $crate::html_utils::get_attr(&elem, "href")
-                    .or_else(|| $crate::html_utils::get_attr(&elem, "src"));
-
-                // Resolve relative URLs if base_url is provided
-                if let Some(url_str) = url {
-                    if let Some(base) = $base_url {
-                        // Try to resolve relative URL
-                        if let Ok(resolved) = $crate::url_utils::resolve_url(Some(base), &url_str) {
-                            $item.$field = Some(resolved);
-                        } else {
-                            // If resolution fails, use original URL
-                            $item.$field = Some(url_str);
-                        }
+        let sel = $crate::static_selector!($selector);
+        if let Some(elem) = $element.select(sel).next() {
+            let url = elem.value().attr("href").or_else(|| elem.value().attr("src"));
+
+            // Resolve relative URLs if base_url is provided
+            if let Some(url_str) = url {
+                if let Some(base) = $base_url {
+                    // Try to resolve relative URL
+                    if let Ok(resolved) = $crate::url_utils::resolve_url(Some(base), url_str) {
+                        $item.$field = Some(resolved);
                     } else {
-                        $item.$field = Some(url_str);
+                        // If resolution fails, use original URL
+                        $item.$field = Some(url_str.to_string());
                     }
+                } else {
+                    $item.$field = Some(url_str.to_string());
                 }
             }
         }
@@ -184,54 +260,48 @@ macro_rules! microformat_extractor {
 
     // Extract HTML content (inner HTML)
     (@extract_property $element:ident, $item:ident, $field:ident, html, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
-            if let Some(elem) = $element.select(&sel).next() {
-                let html_content = elem.inner_html().trim().to_string();
-                if !html_content.is_empty() {
-                    $item.$field = Some(html_content);
-                }
+        let sel = $crate::static_selector!($selector);
+        if let Some(elem) = $element.select(sel).next() {
+            let html_content = $crate::html_utils::trim_string(elem.inner_html());
+            if !html_content.is_empty() {
+                $item.$field = Some(html_content);
             }
         }
     };
 
     // Extract datetime (from datetime attribute or text)
     (@extract_property $element:ident, $item:ident, $field:ident, date, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
-            if let Some(elem) = $element.select(&sel).next() {
-                $item.$field = $crate::html_utils::get_attr(&elem, "datetime")
-                    .or_else(|| $crate::html_utils::extract_text(&elem));
-            }
+        let sel = $crate::static_selector!($selector);
+        if let Some(elem) = $element.select(sel).next() {
+            $item.$field = $crate::html_utils::get_attr(&elem, "datetime")
+                .or_else(|| $crate::html_utils::extract_text(&elem));
         }
     };
 
     // Extract multiple text values (Vec<String>)
     (@extract_property $element:ident, $item:ident, $field:ident, multi_text, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
-            for elem in $element.select(&sel) {
-                if let Some(text) = $crate::html_utils::extract_text(&elem) {
-                    $item.$field.push(text);
-                }
+        let sel = $crate::static_selector!($selector);
+        for elem in $element.select(sel) {
+            if let Some(text) = $crate::html_utils::extract_text(&elem) {
+                $item.$field.push(text);
             }
         }
     };
 
     // Extract multiple URLs (Vec<String>)
     (@extract_property $element:ident, $item:ident, $field:ident, multi_url, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
-            for elem in $element.select(&sel) {
-                if let Some(url) = $crate::html_utils::get_attr(&elem, "href")
-                    .or_else(|| $crate::html_utils::get_attr(&elem, "src")) {
-
-                    // Resolve relative URLs if base_url is provided
-                    if let Some(base) = $base_url {
-                        if let Ok(resolved) = $crate::url_utils::resolve_url(Some(base), &url) {
-                            $item.$field.push(resolved);
-                        } else {
-                            $item.$field.push(url);
-                        }
+        let sel = $crate::static_selector!($selector);
+        for elem in $element.select(sel) {
+            if let Some(url) = elem.value().attr("href").or_else(|| elem.value().attr("src")) {
+                // Resolve relative URLs if base_url is provided
+                if let Some(base) = $base_url {
+                    if let Ok(resolved) = $crate::url_utils::resolve_url(Some(base), url) {
+                        $item.$field.push(resolved);
                     } else {
-                        $item.$field.push(url);
+                        $item.$field.push(url.to_string());
                     }
+                } else {
+                    $item.$field.push(url.to_string());
                 }
             }
         }
@@ -239,68 +309,47 @@ macro_rules! microformat_extractor {
 
     // Extract numeric value (f32)
     (@extract_property $element:ident, $item:ident, $field:ident, number, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
-            if let Some(elem) = $element.select(&sel).next() {
-                if let Some(text) = $crate::html_utils::extract_text(&elem) {
-                    // Try to parse as f32
-                    if let Ok(num) = text.parse::<f32>() {
-                        $item.$field = Some(num);
-                    }
-                }
+        let sel = $crate::static_selector!($selector);
+        if let Some(elem) = $element.select(sel).next() {
+            if let Some(num) = $crate::html_utils::parse_text::<f32>(&elem) {
+                $item.$field = Some(num);
             }
         }
     };
 
     // Extract numeric value (f64)
     (@extract_property $element:ident, $item:ident, $field:ident, f64_number, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
-            if let Some(elem) = $element.select(&sel).next() {
-                if let Some(text) = $crate::html_utils::extract_text(&elem) {
-                    // Try to parse as f64
-                    if let Ok(num) = text.parse::<f64>() {
-                        $item.$field = Some(num);
-                    }
-                }
+        let sel = $crate::static_selector!($selector);
+        if let Some(elem) = $element.select(sel).next() {
+            if let Some(num) = $crate::html_utils::parse_text::<f64>(&elem) {
+                $item.$field = Some(num);
             }
         }
     };
 
     // Extract email (special handling for mailto: links)
     (@extract_property $element:ident, $item:ident, $field:ident, email, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
-            if let Some(elem) = $element.select(&sel).next() {
-                $item.$field = $crate::html_utils::get_attr(&elem, "href")
-                    .map(|s| s.trim_start_matches("mailto:").to_string())
-                    .or_else(|| $crate::html_utils::extract_text(&elem));
-            }
+        let sel = $crate::static_selector!($selector);
+        if let Some(elem) = $element.select(sel).next() {
+            $item.$field = elem.value().attr("href")
+                .map(|s| s.trim_start_matches("mailto:").to_string())
+                .or_else(|| $crate::html_utils::extract_text(&elem));
         }
     };
 
     // Extract nested h-card microformat (Option<Box<HCard>>)
     (@extract_property $element:ident, $item:ident, $field:ident, nested_hcard, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
-            if let Some(elem) = $element.select(&sel).next() {
-                let nested_html = elem.html();
-                if let Ok(items) = $crate::extractors::microformats::hcard::extract(&nested_html, $base_url) {
-                    if let Some(item) = items.first() {
-                        $item.$field = Some(Box::new(item.clone()));
-                    }
-                }
-            }
+        let sel = $crate::static_selector!($selector);
+        if let Some(elem) = $element.select(sel).next() {
+            $item.$field = Some(Box::new($crate::extractors::microformats::hcard::extract_root(elem, $base_url)));
         }
     };
 
     // Extract nested h-product microformat (Option<Box<HProduct>>)
     (@extract_property $element:ident, $item:ident, $field:ident, nested_hproduct, $selector:expr, $base_url:ident) => {
-        if let Ok(sel) = $crate::html_utils::create_selector($selector) {
-            if let Some(elem) = $element.select(&sel).next() {
-                let nested_html = elem.html();
-                if let Ok(items) = $crate::extractors::microformats::hproduct::extract(&nested_html, $base_url) {
-                    if let Some(item) = items.first() {
-                        $item.$field = Some(Box::new(item.clone()));
-                    }
-                }
-            }
+        let sel = $crate::static_selector!($selector);
+        if let Some(elem) = $element.select(sel).next() {
+            $item.$field = Some(Box::new($crate::extractors::microformats::hproduct::extract_root(elem, $base_url)));
         }
     };
 
@@ -308,24 +357,16 @@ macro_rules! microformat_extractor {
     // Tries nested h-card first, if not found falls back to text extraction
     (@extract_dual_property $element:ident, $item:ident, $text_field:ident, $nested_field:ident,
      nested_hcard_or_text, $nested_sel:expr, $text_sel:expr, $base_url:ident) => {
-        let mut found_nested = false;
-        if let Ok(sel) = $crate::html_utils::create_selector($nested_sel) {
-            if let Some(elem) = $element.select(&sel).next() {
-                let nested_html = elem.html();
-                if let Ok(items) = $crate::extractors::microformats::hcard::extract(&nested_html, $base_url) {
-                    if let Some(item) = items.first() {
-                        $item.$nested_field = Some(Box::new(item.clone()));
-                        found_nested = true;
-                    }
-                }
-            }
-        }
-        if !found_nested {
-            if let Ok(sel) = $crate::html_utils::create_selector($text_sel) {
-                if let Some(elem) = $element.select(&sel).next() {
-                    $item.$text_field = $crate::html_utils::extract_text(&elem);
-                }
-            }
+        // `$nested_sel` is `$text_sel` plus the h-card class, so one walk over the
+        // text selector's matches finds both the nested item and the fallback
+        let sel = $crate::static_selector!($text_sel);
+        let (first, nested) = $crate::html_utils::select_first_with_class(&$element, sel, "h-card");
+        if let Some(elem) = nested {
+            // The matched element is the nested root itself, so extract from it in
+            // place rather than serializing it and parsing the fragment again
+            $item.$nested_field = Some(Box::new($crate::extractors::microformats::hcard::extract_root(elem, $base_url)));
+        } else if let Some(elem) = first {
+            $item.$text_field = $crate::html_utils::extract_text(&elem);
         }
     };
 
@@ -333,24 +374,16 @@ macro_rules! microformat_extractor {
     // Tries nested h-product first, if not found falls back to text extraction
     (@extract_dual_property $element:ident, $item:ident, $text_field:ident, $nested_field:ident,
      nested_hproduct_or_text, $nested_sel:expr, $text_sel:expr, $base_url:ident) => {
-        let mut found_nested = false;
-        if let Ok(sel) = $crate::html_utils::create_selector($nested_sel) {
-            if let Some(elem) = $element.select(&sel).next() {
-                let nested_html = elem.html();
-                if let Ok(items) = $crate::extractors::microformats::hproduct::extract(&nested_html, $base_url) {
-                    if let Some(item) = items.first() {
-                        $item.$nested_field = Some(Box::new(item.clone()));
-                        found_nested = true;
-                    }
-                }
-            }
-        }
-        if !found_nested {
-            if let Ok(sel) = $crate::html_utils::create_selector($text_sel) {
-                if let Some(elem) = $element.select(&sel).next() {
-                    $item.$text_field = $crate::html_utils::extract_text(&elem);
-                }
-            }
+        // `$nested_sel` is `$text_sel` plus the h-product class, so one walk over the
+        // text selector's matches finds both the nested item and the fallback
+        let sel = $crate::static_selector!($text_sel);
+        let (first, nested) = $crate::html_utils::select_first_with_class(&$element, sel, "h-product");
+        if let Some(elem) = nested {
+            // The matched element is the nested root itself, so extract from it in
+            // place rather than serializing it and parsing the fragment again
+            $item.$nested_field = Some(Box::new($crate::extractors::microformats::hproduct::extract_root(elem, $base_url)));
+        } else if let Some(elem) = first {
+            $item.$text_field = $crate::html_utils::extract_text(&elem);
         }
     };
 }
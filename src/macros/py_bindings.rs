@@ -15,7 +15,7 @@
 //! For each invocation, the macro generates a complete PyO3 function with:
 //! - Proper `#[pyfunction]` annotation
 //! - `#[pyo3(signature = (html, base_url=None))]` for optional parameters
-//! - GIL acquisition via `Python::with_gil`
+//! - The GIL released via `py.allow_threads` while the document is extracted
 //! - Error conversion to PyValueError
 //! - Automatic conversion to Python objects via `.to_py_dict()`
 //!
@@ -31,13 +31,12 @@
 //! /// Extract h-card microformat data
 //! #[pyfunction]
 //! #[pyo3(signature = (html, base_url=None))]
-//! fn extract_hcard(html: &str, base_url: Option<&str>) -> PyResult<Vec<PyObject>> {
-//!     Python::with_gil(|py| {
-//!         let items = extractors::microformats::hcard::extract(html, base_url)
-//!             .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+//! fn extract_hcard(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Vec<PyObject>> {
+//!     let items = py
+//!         .allow_threads(|| extractors::microformats::hcard::extract(html, base_url))
+//!         .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
 //!
-//!         Ok(items.iter().map(|item| item.to_py_dict(py).into()).collect())
-//!     })
+//!     Ok(items.iter().map(|item| item.to_py_dict(py).into()).collect())
 //! }
 //! ```
 
@@ -47,7 +46,8 @@
 ///
 /// - `$func_name`: The name of the Python function (e.g., `extract_hcard`)
 /// - `$module`: The extractor module name (e.g., `hcard`)
-/// - `$type_name`: The Rust type name (e.g., `HCard`) - currently unused but reserved for future enhancements
+/// - `$type_name`: The Rust type name (e.g., `HCard`), whose `to_py_dicts` converts the results
+/// - `$extract` (optional): The module function to call instead of `extract`
 ///
 /// # Examples
 ///
@@ -60,20 +60,67 @@
 ///
 /// // Generate binding for h-event extractor
 /// py_extractor_binding!(extract_hevent, hevent, HEvent);
+///
+/// // Generate binding for h-recipe backed by its streaming extractor
+/// py_extractor_binding!(extract_hrecipe, hrecipe, HRecipe, extract_streaming);
 /// ```
 #[macro_export]
 macro_rules! py_extractor_binding {
     ($func_name:ident, $module:ident, $type_name:ident) => {
+        py_extractor_binding!($func_name, $module, $type_name, extract);
+    };
+    ($func_name:ident, $module:ident, $type_name:ident, $extract:ident) => {
         /// Extract microformat data
         #[pyfunction]
         #[pyo3(signature = (html, base_url=None))]
-        fn $func_name(html: &str, base_url: Option<&str>) -> PyResult<Vec<PyObject>> {
-            Python::with_gil(|py| {
-                let items = extractors::microformats::$module::extract(html, base_url)
-                    .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        fn $func_name(py: Python, html: &str, base_url: Option<&str>) -> PyResult<Vec<PyObject>> {
+            // Parsing and matching never touch Python objects, so let other
+            // threads run while the document is extracted
+            let items = py
+                .allow_threads(|| extractors::microformats::$module::$extract(html, base_url))
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+
+            Ok(<$type_name>::to_py_dicts(py, &items))
+        }
+    };
+}
 
-                Ok(items.iter().map(|item| item.to_py_dict(py).into()).collect())
+/// Generate a batched Python binding function for a microformat extractor
+///
+/// The generated function accepts a list of HTML documents, extracts them in
+/// parallel with the GIL released (see `run_batch` in `lib.rs`), and returns
+/// one list of items per input document, in input order.
+///
+/// # Parameters
+///
+/// - `$func_name`: The name of the Python function (e.g., `extract_hcard_batch`)
+/// - `$module`: The extractor module name (e.g., `hcard`)
+///
+/// # Examples
+///
+/// ```rust
+/// py_batch_binding!(extract_hcard_batch, hcard);
+/// ```
+#[macro_export]
+macro_rules! py_batch_binding {
+    ($func_name:ident, $module:ident) => {
+        /// Extract microformat data from a list of HTML documents
+        #[pyfunction]
+        #[pyo3(signature = (htmls, base_url=None))]
+        fn $func_name(
+            py: Python,
+            htmls: Vec<PyBackedStr>,
+            base_url: Option<&str>,
+        ) -> PyResult<Py<PyList>> {
+            let results = run_batch(py, &htmls, |html| {
+                extractors::microformats::$module::extract(html, base_url)
             })
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+
+            let lists = results
+                .iter()
+                .map(|items| PyList::new_bound(py, items.iter().map(|item| item.to_py_dict(py))));
+            Ok(PyList::new_bound(py, lists).unbind())
         }
     };
 }
@@ -0,0 +1,68 @@
+//! Declarative macro for process-wide cached CSS selectors
+//!
+//! Compiling a `scraper::Selector` is far more expensive than matching it
+//! against a small document, so extractors should never recompile the same
+//! selector string on every call.
+//!
+//! # Usage
+//!
+//! ```ignore
+//! let selector = static_selector!("meta[name][content]");
+//! for element in document.select(selector) {
+//!     // ...
+//! }
+//! ```
+
+/// Compile a CSS selector once and return a `&'static Selector`
+///
+/// Each call site gets its own `OnceLock`, so the selector is parsed the
+/// first time that line runs and reused by every later call, from any thread.
+///
+/// Only pass string literals: an invalid selector is a programming error and
+/// panics the first time the call site runs.
+#[macro_export]
+macro_rules! static_selector {
+    ($selector:expr) => {{
+        static SELECTOR: ::std::sync::OnceLock<$crate::html_utils::Selector> =
+            ::std::sync::OnceLock::new();
+        SELECTOR.get_or_init(|| {
+            $crate::html_utils::create_selector($selector).expect("invalid static selector")
+        })
+    }};
+}
+
+#[cfg(test)]
+mod tests {
+    use crate::html_utils;
+
+    fn cached() -> &'static html_utils::Selector {
+        static_selector!(".h-card")
+    }
+
+    #[test]
+    fn test_static_selector_is_reused() {
+        let first = cached();
+        let second = cached();
+        assert!(std::ptr::eq(first, second));
+    }
+
+    #[test]
+    fn test_static_selector_matches() {
+        let document = html_utils::parse_html(r#"<div class="h-card">A</div><p>B</p>"#);
+        let selector = static_selector!("div.h-card");
+        assert_eq!(document.select(selector).count(), 1);
+    }
+
+    #[test]
+    fn test_static_selector_distinct_call_sites() {
+        let a = static_selector!(".p-name");
+        let b = static_selector!(".u-url");
+        assert!(!std::ptr::eq(a, b));
+    }
+
+    #[test]
+    #[should_panic(expected = "invalid static selector")]
+    fn test_static_selector_invalid_panics() {
+        let _ = static_selector!("div[[[invalid");
+    }
+}
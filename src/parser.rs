@@ -1,7 +1,8 @@
-use crate::errors::{MicroformatError, Result};
-use crate::extractors::common::url_utils;
+use crate::errors::Result;
+use crate::extractors::common::{html_utils, url_utils};
+use crate::static_selector;
 use crate::types::{MicroformatItem, PropertyValue};
-use scraper::{Html, Selector};
+use scraper::Html;
 use std::collections::HashMap;
 
 /// Parse HTML and extract all microformats
@@ -9,14 +10,18 @@ pub fn parse_html(
     html: &str,
     base_url: Option<&str>,
 ) -> Result<HashMap<String, Vec<MicroformatItem>>> {
-    let document = Html::parse_document(html);
     let mut results: HashMap<String, Vec<MicroformatItem>> = HashMap::new();
+    // Every root class starts with "h-", so pages without it have no items
+    if !html_utils::has_markup(html) || !html_utils::may_contain(html, "h-") {
+        return Ok(results);
+    }
+
+    let document = Html::parse_document(html);
 
     // Find all elements with microformat classes (h-*, p-*, u-*, dt-*, e-*)
-    let mf_selector = Selector::parse("[class*='h-']")
-        .map_err(|e| MicroformatError::ParseError(e.to_string()))?;
+    let mf_selector = static_selector!("[class*='h-']");
 
-    for element in document.select(&mf_selector) {
+    for element in document.select(mf_selector) {
         if let Some(classes) = element.value().attr("class") {
             // Check for root microformat classes (h-*)
             let h_classes: Vec<&str> =
@@ -55,6 +60,51 @@ fn parse_microformat_item(
     Ok(MicroformatItem { type_: type_classes, properties, children: None })
 }
 
+/// Kind of a microformat property class (`p-*`, `u-*`, `dt-*`, `e-*`)
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum PropertyKind {
+    /// `p-*`: plain text
+    Plain,
+    /// `u-*`: URL
+    Url,
+    /// `dt-*`: date/time
+    DateTime,
+    /// `e-*`: embedded HTML
+    Embedded,
+}
+
+impl PropertyKind {
+    /// Split a class token into its property kind and name in a single byte match
+    fn classify(class: &str) -> Option<(Self, &str)> {
+        let (kind, prefix_len) = match class.as_bytes() {
+            [b'p', b'-', ..] => (PropertyKind::Plain, 2),
+            [b'u', b'-', ..] => (PropertyKind::Url, 2),
+            [b'd', b't', b'-', ..] => (PropertyKind::DateTime, 3),
+            [b'e', b'-', ..] => (PropertyKind::Embedded, 2),
+            _ => return None,
+        };
+        Some((kind, &class[prefix_len..]))
+    }
+}
+
+/// Whether a class attribute may contain a `p-*`, `u-*`, `dt-*` or `e-*` token
+///
+/// Finds each `-` with memchr's vectorised search and only inspects the bytes
+/// just before it, so typical class lists without property tokens are
+/// rejected without being tokenised. May return false positives, never false
+/// negatives: any byte outside printable ASCII is treated as a token boundary.
+fn may_have_property_class(classes: &str) -> bool {
+    let bytes = classes.as_bytes();
+    let starts_token = |pos: usize| pos == 0 || !bytes[pos - 1].is_ascii_graphic();
+    memchr::memchr_iter(b'-', bytes).any(|dash| match dash {
+        0 => false,
+        _ => {
+            (matches!(bytes[dash - 1], b'p' | b'u' | b'e') && starts_token(dash - 1))
+                || (dash >= 2 && &bytes[dash - 2..dash] == b"dt" && starts_token(dash - 2))
+        }
+    })
+}
+
 /// Extract properties from a microformat element
 fn extract_properties(
     element: &scraper::ElementRef,
@@ -65,21 +115,22 @@ fn extract_properties(
     for child in element.descendants() {
         if let Some(child_element) = scraper::ElementRef::wrap(child) {
             if let Some(classes) = child_element.value().attr("class") {
+                if !may_have_property_class(classes) {
+                    continue;
+                }
                 for class in classes.split_whitespace() {
-                    let (prefix, name) = if let Some(name) = class.strip_prefix("p-") {
-                        ("p", name)
-                    } else if let Some(name) = class.strip_prefix("u-") {
-                        ("u", name)
-                    } else if let Some(name) = class.strip_prefix("dt-") {
-                        ("dt", name)
-                    } else if let Some(name) = class.strip_prefix("e-") {
-                        ("e", name)
-                    } else {
+                    let Some((kind, name)) = PropertyKind::classify(class) else {
                         continue;
                     };
 
-                    let value = extract_property_value(&child_element, prefix, base_url)?;
-                    properties.entry(name.to_string()).or_default().push(value);
+                    let value = extract_property_value(&child_element, kind, base_url)?;
+                    // Only allocate the key the first time a property name is seen
+                    match properties.get_mut(name) {
+                        Some(values) => values.push(value),
+                        None => {
+                            properties.insert(name.to_string(), vec![value]);
+                        }
+                    }
                 }
             }
         }
@@ -91,46 +142,50 @@ fn extract_properties(
 /// Extract a property value based on its type
 fn extract_property_value(
     element: &scraper::ElementRef,
-    prefix: &str,
+    kind: PropertyKind,
     base_url: Option<&str>,
 ) -> Result<PropertyValue> {
-    match prefix {
-        "p" => {
+    match kind {
+        PropertyKind::Plain => {
             // Plain text
-            let text = element.text().collect::<String>().trim().to_string();
+            let text = html_utils::trim_string(element.text().collect());
             Ok(PropertyValue::Text(text))
         }
-        "u" => {
+        PropertyKind::Url => {
             // URL
-            let url = element
-                .value()
-                .attr("href")
-                .or_else(|| element.value().attr("src"))
-                .map(String::from)
-                .unwrap_or_else(|| element.text().collect::<String>().trim().to_string());
-
             let absolute_url =
-                if let Some(base) = base_url { resolve_url(base, &url)? } else { url };
+                match element.value().attr("href").or_else(|| element.value().attr("src")) {
+                    Some(url) => match base_url {
+                        Some(base) => resolve_url(base, url)?,
+                        None => url.to_string(),
+                    },
+                    None => {
+                        let text = html_utils::trim_string(element.text().collect());
+                        match base_url {
+                            Some(base) => resolve_url(base, &text)?,
+                            None => text,
+                        }
+                    }
+                };
 
             Ok(PropertyValue::Url(absolute_url))
         }
-        "dt" => {
+        PropertyKind::DateTime => {
             // DateTime
             let datetime = element
                 .value()
                 .attr("datetime")
                 .or_else(|| element.value().attr("value"))
                 .map(String::from)
-                .unwrap_or_else(|| element.text().collect::<String>().trim().to_string());
+                .unwrap_or_else(|| html_utils::trim_string(element.text().collect()));
 
             Ok(PropertyValue::Text(datetime))
         }
-        "e" => {
+        PropertyKind::Embedded => {
             // Embedded HTML
             let html = element.inner_html();
             Ok(PropertyValue::Text(html))
         }
-        _ => Ok(PropertyValue::Text(String::new())),
     }
 }
 
@@ -142,6 +197,7 @@ fn resolve_url(base: &str, relative: &str) -> Result<String> {
 #[cfg(test)]
 mod tests {
     use super::*;
+    use scraper::Selector;
 
     #[test]
     fn test_parse_html_basic() {
@@ -150,6 +206,31 @@ mod tests {
         assert!(doc.root_element().html().contains("test"));
     }
 
+    #[test]
+    fn test_property_kind_classify() {
+        assert_eq!(PropertyKind::classify("p-name"), Some((PropertyKind::Plain, "name")));
+        assert_eq!(PropertyKind::classify("u-photo"), Some((PropertyKind::Url, "photo")));
+        assert_eq!(
+            PropertyKind::classify("dt-published"),
+            Some((PropertyKind::DateTime, "published"))
+        );
+        assert_eq!(PropertyKind::classify("e-content"), Some((PropertyKind::Embedded, "content")));
+        assert_eq!(PropertyKind::classify("h-card"), None);
+        assert_eq!(PropertyKind::classify("d-name"), None);
+        assert_eq!(PropertyKind::classify("p"), None);
+        assert_eq!(PropertyKind::classify("P-name"), None);
+    }
+
+    #[test]
+    fn test_may_have_property_class() {
+        for classes in ["p-name", "btn u-url", "x\tdt-start", "e-content", "a\u{a0}p-name"] {
+            assert!(may_have_property_class(classes), "{classes:?}");
+        }
+        for classes in ["", "container", "btn btn-primary", "h-card", "top-nav", "-p-x", "xdt-y"] {
+            assert!(!may_have_property_class(classes), "{classes:?}");
+        }
+    }
+
     #[test]
     fn test_extract_property_value_p_prefix() {
         // Test plain text extraction (p- prefix)
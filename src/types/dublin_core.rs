@@ -3,6 +3,8 @@
 //! Dublin Core is a metadata standard with 15 core elements
 //! commonly used in digital libraries and archives.
 
+#[cfg(feature = "python")]
+use pyo3::intern;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
@@ -68,49 +70,49 @@ impl DublinCore {
         let dict = PyDict::new_bound(py);
 
         if let Some(ref v) = self.title {
-            dict.set_item("title", v).unwrap();
+            dict.set_item(intern!(py, "title"), v).unwrap();
         }
         if let Some(ref v) = self.creator {
-            dict.set_item("creator", v).unwrap();
+            dict.set_item(intern!(py, "creator"), v).unwrap();
         }
         if let Some(ref v) = self.subject {
-            dict.set_item("subject", v.clone()).unwrap();
+            dict.set_item(intern!(py, "subject"), v).unwrap();
         }
         if let Some(ref v) = self.description {
-            dict.set_item("description", v).unwrap();
+            dict.set_item(intern!(py, "description"), v).unwrap();
         }
         if let Some(ref v) = self.publisher {
-            dict.set_item("publisher", v).unwrap();
+            dict.set_item(intern!(py, "publisher"), v).unwrap();
         }
         if let Some(ref v) = self.contributor {
-            dict.set_item("contributor", v.clone()).unwrap();
+            dict.set_item(intern!(py, "contributor"), v).unwrap();
         }
         if let Some(ref v) = self.date {
-            dict.set_item("date", v).unwrap();
+            dict.set_item(intern!(py, "date"), v).unwrap();
         }
         if let Some(ref v) = self.type_ {
-            dict.set_item("type", v).unwrap();
+            dict.set_item(intern!(py, "type"), v).unwrap();
         }
         if let Some(ref v) = self.format {
-            dict.set_item("format", v).unwrap();
+            dict.set_item(intern!(py, "format"), v).unwrap();
         }
         if let Some(ref v) = self.identifier {
-            dict.set_item("identifier", v).unwrap();
+            dict.set_item(intern!(py, "identifier"), v).unwrap();
         }
         if let Some(ref v) = self.source {
-            dict.set_item("source", v).unwrap();
+            dict.set_item(intern!(py, "source"), v).unwrap();
         }
         if let Some(ref v) = self.language {
-            dict.set_item("language", v).unwrap();
+            dict.set_item(intern!(py, "language"), v).unwrap();
         }
         if let Some(ref v) = self.relation {
-            dict.set_item("relation", v).unwrap();
+            dict.set_item(intern!(py, "relation"), v).unwrap();
         }
         if let Some(ref v) = self.coverage {
-            dict.set_item("coverage", v).unwrap();
+            dict.set_item(intern!(py, "coverage"), v).unwrap();
         }
         if let Some(ref v) = self.rights {
-            dict.set_item("rights", v).unwrap();
+            dict.set_item(intern!(py, "rights"), v).unwrap();
         }
 
         dict.unbind()
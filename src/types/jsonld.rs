@@ -3,13 +3,19 @@
 //! JSON-LD is the fastest-growing format (41% adoption) that enables
 //! Google Rich Results, AI/LLM training, and rich metadata extraction.
 
+#[cfg(feature = "python")]
+use super::{presized_dict, PyStringCache};
+#[cfg(feature = "python")]
+use pyo3::intern;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyList};
+use serde::de::{self, Deserializer, MapAccess, Visitor};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use std::collections::HashMap;
+use std::fmt;
 
 /// Helper module for deserializing numeric values that might be strings or numbers
 mod string_or_number {
@@ -65,7 +71,7 @@ mod string_or_int {
 ///
 /// JSON-LD objects can be of any Schema.org type (Article, Product, Person, etc.)
 /// and may contain nested objects and arrays.
-#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
+#[derive(Debug, Clone, PartialEq, Serialize)]
 pub struct JsonLdObject {
     /// @context - usually "https://schema.org" or similar
     #[serde(rename = "@context")]
@@ -88,6 +94,71 @@ pub struct JsonLdObject {
     pub properties: HashMap<String, Value>,
 }
 
+/// Deserialized by hand rather than with `#[serde(flatten)]`
+///
+/// A flattened map makes serde buffer the whole object (and every nested value)
+/// into an intermediate tree before building `properties` from it. Reading the
+/// map directly parses each value once, straight into its final `Value`.
+impl<'de> Deserialize<'de> for JsonLdObject {
+    fn deserialize<D>(deserializer: D) -> Result<Self, D::Error>
+    where
+        D: Deserializer<'de>,
+    {
+        struct ObjectVisitor;
+
+        impl<'de> Visitor<'de> for ObjectVisitor {
+            type Value = JsonLdObject;
+
+            fn expecting(&self, formatter: &mut fmt::Formatter) -> fmt::Result {
+                formatter.write_str("a JSON-LD object")
+            }
+
+            fn visit_map<A>(self, mut map: A) -> Result<JsonLdObject, A::Error>
+            where
+                A: MapAccess<'de>,
+            {
+                let mut context: Option<Option<Value>> = None;
+                let mut type_: Option<Option<Value>> = None;
+                let mut id: Option<Option<String>> = None;
+                let mut graph: Option<Option<Vec<JsonLdObject>>> = None;
+                let mut properties = HashMap::with_capacity(map.size_hint().unwrap_or(0));
+
+                while let Some(key) = map.next_key::<String>()? {
+                    match key.as_str() {
+                        "@context" if context.is_some() => {
+                            return Err(de::Error::duplicate_field("@context"))
+                        }
+                        "@context" => context = Some(map.next_value()?),
+                        "@type" if type_.is_some() => {
+                            return Err(de::Error::duplicate_field("@type"))
+                        }
+                        "@type" => type_ = Some(map.next_value()?),
+                        "@id" if id.is_some() => return Err(de::Error::duplicate_field("@id")),
+                        "@id" => id = Some(map.next_value()?),
+                        "@graph" if graph.is_some() => {
+                            return Err(de::Error::duplicate_field("@graph"))
+                        }
+                        "@graph" => graph = Some(map.next_value()?),
+                        _ => {
+                            properties.insert(key, map.next_value()?);
+                        }
+                    }
+                }
+
+                Ok(JsonLdObject {
+                    context: context.flatten(),
+                    type_: type_.flatten(),
+                    id: id.flatten(),
+                    graph: graph.flatten(),
+                    properties,
+                })
+            }
+        }
+
+        deserializer.deserialize_map(ObjectVisitor)
+    }
+}
+
 /// Article type (most common JSON-LD type)
 #[derive(Debug, Clone, PartialEq, Serialize, Deserialize, Default)]
 pub struct Article {
@@ -823,10 +894,15 @@ pub struct AggregateRating {
 }
 
 /// Helper function to convert serde_json::Value to Python objects recursively
+///
+/// Object keys and short string values come from `cache`, so the property
+/// names and `@type` values repeated across nested and `@graph` objects
+/// become one Python `str` each.
 #[cfg(feature = "python")]
-fn json_value_to_py(py: Python, value: &Value) -> PyObject {
+fn json_value_to_py<'a>(cache: &mut PyStringCache<'_, 'a>, value: &'a Value) -> PyObject {
+    let py = cache.py();
     match value {
-        Value::String(s) => s.to_object(py),
+        Value::String(s) => cache.get(s).into_any().unbind(),
         Value::Number(n) => {
             if let Some(i) = n.as_i64() {
                 i.to_object(py)
@@ -839,18 +915,15 @@ fn json_value_to_py(py: Python, value: &Value) -> PyObject {
         Value::Bool(b) => b.to_object(py),
         Value::Null => py.None(),
         Value::Array(arr) => {
-            let py_list = pyo3::types::PyList::empty_bound(py);
-            for item in arr {
-                py_list.append(json_value_to_py(py, item)).unwrap();
-            }
-            py_list.to_object(py)
+            let items: Vec<_> = arr.iter().map(|item| json_value_to_py(cache, item)).collect();
+            PyList::new_bound(py, items).into_any().unbind()
         }
         Value::Object(map) => {
-            let py_dict = PyDict::new_bound(py);
+            let py_dict = presized_dict(py, map.len());
             for (key, val) in map {
-                py_dict.set_item(key, json_value_to_py(py, val)).unwrap();
+                py_dict.set_item(cache.get(key), json_value_to_py(cache, val)).unwrap();
             }
-            py_dict.to_object(py)
+            py_dict.into_any().unbind()
         }
     }
 }
@@ -864,28 +937,43 @@ impl JsonLdObject {
     /// preserving all JSON-LD special properties (@context, @type, @id, @graph)
     /// and all other Schema.org properties.
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
-        let dict = PyDict::new_bound(py);
+        self.to_py_dict_cached(&mut PyStringCache::new(py))
+    }
+
+    /// Convert a list of objects, sharing keys and values repeated across them
+    pub fn to_py_dicts(py: Python, objects: &[Self]) -> Vec<PyObject> {
+        let mut cache = PyStringCache::new(py);
+        objects.iter().map(|obj| obj.to_py_dict_cached(&mut cache).into()).collect()
+    }
+
+    /// Convert to a dict, taking keys and string values from `cache`
+    pub fn to_py_dict_cached<'a>(&'a self, cache: &mut PyStringCache<'_, 'a>) -> Py<PyDict> {
+        let py = cache.py();
+        let present =
+            [self.context.is_some(), self.type_.is_some(), self.id.is_some(), self.graph.is_some()];
+        let dict =
+            presized_dict(py, present.iter().filter(|&&p| p).count() + self.properties.len());
 
         if let Some(ref context) = self.context {
-            dict.set_item("@context", json_value_to_py(py, context)).unwrap();
+            dict.set_item(intern!(py, "@context"), json_value_to_py(cache, context)).unwrap();
         }
 
         if let Some(ref type_) = self.type_ {
-            dict.set_item("@type", json_value_to_py(py, type_)).unwrap();
+            dict.set_item(intern!(py, "@type"), json_value_to_py(cache, type_)).unwrap();
         }
 
         if let Some(ref id) = self.id {
-            dict.set_item("@id", id).unwrap();
+            dict.set_item(intern!(py, "@id"), id).unwrap();
         }
 
         if let Some(ref graph) = self.graph {
-            let graph_list: Vec<_> = graph.iter().map(|obj| obj.to_py_dict(py)).collect();
-            dict.set_item("@graph", graph_list).unwrap();
+            let graph_list: Vec<_> = graph.iter().map(|obj| obj.to_py_dict_cached(cache)).collect();
+            dict.set_item(intern!(py, "@graph"), graph_list).unwrap();
         }
 
         // Convert all other properties using deep conversion
         for (key, value) in &self.properties {
-            dict.set_item(key, json_value_to_py(py, value)).unwrap();
+            dict.set_item(cache.get(key), json_value_to_py(cache, value)).unwrap();
         }
 
         dict.unbind()
@@ -1064,6 +1152,26 @@ mod tests {
         assert!(obj.properties.is_empty());
     }
 
+    #[test]
+    fn test_jsonld_object_rejects_malformed_keywords() {
+        // Matches the derived deserializer: keywords are validated and may not repeat
+        for json in [
+            r#"{"@id": "a", "@id": "b"}"#,
+            r#"{"@type": "A", "@type": "B"}"#,
+            r#"{"@id": 5}"#,
+            r#"{"@graph": {}}"#,
+            r#"[{"@type": "Article"}]"#,
+        ] {
+            assert!(serde_json::from_str::<JsonLdObject>(json).is_err(), "{json}");
+        }
+
+        let obj: JsonLdObject =
+            serde_json::from_str(r#"{"@id": null, "name": "a", "name": "b"}"#).unwrap();
+        assert!(obj.id.is_none());
+        assert_eq!(obj.properties.get("name").unwrap().as_str(), Some("b"));
+        assert!(!obj.properties.contains_key("@id"));
+    }
+
     #[test]
     fn test_article_empty() {
         let json = r#"{}"#;
@@ -1118,6 +1226,31 @@ mod tests {
         });
     }
 
+    #[test]
+    #[cfg(feature = "python")]
+    fn test_jsonld_objects_share_repeated_strings() {
+        Python::with_gil(|py| {
+            let json = r#"{
+                "@graph": [
+                    {"@type": "Person", "name": "Jane", "knows": {"@type": "Person", "name": "Joe"}},
+                    {"@type": "Person", "name": "Jim"}
+                ]
+            }"#;
+
+            let obj: JsonLdObject = serde_json::from_str(json).unwrap();
+            let graph = obj.graph.unwrap();
+            let dicts = JsonLdObject::to_py_dicts(py, &graph);
+            let (first, second) = (dicts[0].bind(py), dicts[1].bind(py));
+            let nested = first.get_item("knows").unwrap();
+            let second_type = second.get_item("@type").unwrap();
+
+            // Keys and short values repeated across objects are one Python string
+            assert!(first.get_item("@type").unwrap().is(&second_type));
+            assert!(nested.get_item("@type").unwrap().is(&second_type));
+            assert_eq!(second.get_item("name").unwrap().extract::<String>().unwrap(), "Jim");
+        });
+    }
+
     #[test]
     fn test_jsonld_object_numeric_properties() {
         let json = r#"{
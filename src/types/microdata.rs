@@ -3,6 +3,10 @@
 //! Microdata is an HTML specification for embedding structured data using
 //! itemscope, itemtype, and itemprop attributes with Schema.org vocabulary.
 
+#[cfg(feature = "python")]
+use super::presized_dict;
+#[cfg(feature = "python")]
+use pyo3::intern;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
@@ -78,16 +82,18 @@ impl MicrodataItem {
 impl MicrodataItem {
     /// Convert to Python dictionary
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
-        let dict = PyDict::new_bound(py);
+        let present = [self.item_type.is_some(), self.id.is_some()];
+        let dict =
+            presized_dict(py, present.iter().filter(|&&p| p).count() + self.properties.len());
 
         // Add type(s) - always as a list for consistency
         if let Some(ref types) = self.item_type {
-            dict.set_item("type", types.clone()).unwrap();
+            dict.set_item(intern!(py, "type"), types).unwrap();
         }
 
         // Add id
         if let Some(ref id) = self.id {
-            dict.set_item("id", id).unwrap();
+            dict.set_item(intern!(py, "id"), id).unwrap();
         }
 
         // Add properties
@@ -104,17 +110,13 @@ impl MicrodataItem {
                 }
             } else {
                 // Multiple values - add as list
-                let list = PyList::empty_bound(py);
-                for value in values {
-                    match value {
-                        PropertyValue::Text(s) => {
-                            list.append(s).unwrap();
-                        }
-                        PropertyValue::Item(item) => {
-                            list.append(item.to_py_dict(py)).unwrap();
-                        }
-                    }
-                }
+                let list = PyList::new_bound(
+                    py,
+                    values.iter().map(|value| match value {
+                        PropertyValue::Text(s) => s.to_object(py),
+                        PropertyValue::Item(item) => item.to_py_dict(py).into(),
+                    }),
+                );
                 dict.set_item(key, list).unwrap();
             }
         }
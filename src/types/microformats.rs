@@ -1,4 +1,8 @@
 #[cfg(feature = "python")]
+use super::{presized_dict, PyStringCache};
+#[cfg(feature = "python")]
+use pyo3::intern;
+#[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
 use pyo3::types::PyDict;
@@ -17,21 +21,21 @@ pub struct MicroformatItem {
 impl MicroformatItem {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
-        dict.set_item("type", self.type_.clone()).unwrap();
+        dict.set_item(intern!(py, "type"), &self.type_).unwrap();
 
         // Convert properties
-        let props = PyDict::new_bound(py);
+        let props = presized_dict(py, self.properties.len());
         for (key, values) in &self.properties {
             let py_values: Vec<PyObject> = values.iter().map(|v| v.to_python(py)).collect();
             props.set_item(key, py_values).unwrap();
         }
-        dict.set_item("properties", props).unwrap();
+        dict.set_item(intern!(py, "properties"), props).unwrap();
 
         // Convert children if present
         if let Some(children) = &self.children {
             let py_children: Vec<PyObject> =
                 children.iter().map(|child| child.to_py_dict(py).into()).collect();
-            dict.set_item("children", py_children).unwrap();
+            dict.set_item(intern!(py, "children"), py_children).unwrap();
         }
 
         dict.into()
@@ -76,29 +80,29 @@ impl HCard {
         let dict = PyDict::new_bound(py);
 
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), name).unwrap();
         }
         if let Some(url) = &self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), url).unwrap();
         }
         if let Some(photo) = &self.photo {
-            dict.set_item("photo", photo).unwrap();
+            dict.set_item(intern!(py, "photo"), photo).unwrap();
         }
         if let Some(email) = &self.email {
-            dict.set_item("email", email).unwrap();
+            dict.set_item(intern!(py, "email"), email).unwrap();
         }
         if let Some(tel) = &self.tel {
-            dict.set_item("tel", tel).unwrap();
+            dict.set_item(intern!(py, "tel"), tel).unwrap();
         }
         if let Some(note) = &self.note {
-            dict.set_item("note", note).unwrap();
+            dict.set_item(intern!(py, "note"), note).unwrap();
         }
         if let Some(org) = &self.org {
-            dict.set_item("org", org).unwrap();
+            dict.set_item(intern!(py, "org"), org).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
-            dict.set_item(key, values.clone()).unwrap();
+            dict.set_item(key, values).unwrap();
         }
 
         dict.into()
@@ -125,32 +129,32 @@ impl HEntry {
         let dict = PyDict::new_bound(py);
 
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), name).unwrap();
         }
         if let Some(summary) = &self.summary {
-            dict.set_item("summary", summary).unwrap();
+            dict.set_item(intern!(py, "summary"), summary).unwrap();
         }
         if let Some(content) = &self.content {
-            dict.set_item("content", content).unwrap();
+            dict.set_item(intern!(py, "content"), content).unwrap();
         }
         if let Some(published) = &self.published {
-            dict.set_item("published", published).unwrap();
+            dict.set_item(intern!(py, "published"), published).unwrap();
         }
         if let Some(updated) = &self.updated {
-            dict.set_item("updated", updated).unwrap();
+            dict.set_item(intern!(py, "updated"), updated).unwrap();
         }
         if let Some(author) = &self.author {
-            dict.set_item("author", author.to_py_dict(py)).unwrap();
+            dict.set_item(intern!(py, "author"), author.to_py_dict(py)).unwrap();
         }
         if let Some(url) = &self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), url).unwrap();
         }
         if !self.category.is_empty() {
-            dict.set_item("category", self.category.clone()).unwrap();
+            dict.set_item(intern!(py, "category"), &self.category).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
-            dict.set_item(key, values.clone()).unwrap();
+            dict.set_item(key, values).unwrap();
         }
 
         dict.into()
@@ -176,29 +180,29 @@ impl HEvent {
         let dict = PyDict::new_bound(py);
 
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), name).unwrap();
         }
         if let Some(summary) = &self.summary {
-            dict.set_item("summary", summary).unwrap();
+            dict.set_item(intern!(py, "summary"), summary).unwrap();
         }
         if let Some(start) = &self.start {
-            dict.set_item("start", start).unwrap();
+            dict.set_item(intern!(py, "start"), start).unwrap();
         }
         if let Some(end) = &self.end {
-            dict.set_item("end", end).unwrap();
+            dict.set_item(intern!(py, "end"), end).unwrap();
         }
         if let Some(location) = &self.location {
-            dict.set_item("location", location).unwrap();
+            dict.set_item(intern!(py, "location"), location).unwrap();
         }
         if let Some(url) = &self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), url).unwrap();
         }
         if let Some(description) = &self.description {
-            dict.set_item("description", description).unwrap();
+            dict.set_item(intern!(py, "description"), description).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
-            dict.set_item(key, values.clone()).unwrap();
+            dict.set_item(key, values).unwrap();
         }
 
         dict.into()
@@ -238,63 +242,93 @@ pub struct HReview {
 #[cfg(feature = "python")]
 impl HReview {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
-        let dict = PyDict::new_bound(py);
+        self.to_py_dict_cached(&mut PyStringCache::new(py))
+    }
+
+    /// Convert a list of reviews, sharing strings repeated across them
+    pub fn to_py_dicts(py: Python, items: &[Self]) -> Vec<PyObject> {
+        let mut cache = PyStringCache::new(py);
+        items.iter().map(|item| item.to_py_dict_cached(&mut cache).into()).collect()
+    }
+
+    /// Convert to a dict, taking string values from `cache`
+    pub fn to_py_dict_cached<'a>(&'a self, cache: &mut PyStringCache<'_, 'a>) -> Py<PyDict> {
+        let py = cache.py();
+        let present = [
+            self.name.is_some(),
+            self.content.is_some(),
+            self.published.is_some(),
+            self.summary.is_some(),
+            self.dtreviewed.is_some(),
+            self.description.is_some(),
+            self.rating.is_some(),
+            self.best.is_some(),
+            self.worst.is_some(),
+            self.item.is_some(),
+            self.item_product.is_some(),
+            self.reviewer.is_some(),
+            self.reviewer_card.is_some(),
+            self.url.is_some(),
+        ];
+        let len = present.iter().filter(|&&present| present).count();
+        let dict = presized_dict(py, len + self.additional_properties.len());
 
         // Modern properties
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), cache.get(name)).unwrap();
         }
         if let Some(content) = &self.content {
-            dict.set_item("content", content).unwrap();
+            dict.set_item(intern!(py, "content"), cache.get(content)).unwrap();
         }
         if let Some(published) = &self.published {
-            dict.set_item("published", published).unwrap();
+            dict.set_item(intern!(py, "published"), cache.get(published)).unwrap();
         }
 
         // Legacy properties (backward compatibility)
         if let Some(summary) = &self.summary {
-            dict.set_item("summary", summary).unwrap();
+            dict.set_item(intern!(py, "summary"), cache.get(summary)).unwrap();
         }
         if let Some(dtreviewed) = &self.dtreviewed {
-            dict.set_item("dtreviewed", dtreviewed).unwrap();
+            dict.set_item(intern!(py, "dtreviewed"), cache.get(dtreviewed)).unwrap();
         }
         if let Some(description) = &self.description {
-            dict.set_item("description", description).unwrap();
+            dict.set_item(intern!(py, "description"), cache.get(description)).unwrap();
         }
 
         // Rating properties
         if let Some(rating) = self.rating {
-            dict.set_item("rating", rating).unwrap();
+            dict.set_item(intern!(py, "rating"), rating).unwrap();
         }
         if let Some(best) = self.best {
-            dict.set_item("best", best).unwrap();
+            dict.set_item(intern!(py, "best"), best).unwrap();
         }
         if let Some(worst) = self.worst {
-            dict.set_item("worst", worst).unwrap();
+            dict.set_item(intern!(py, "worst"), worst).unwrap();
         }
 
         // Item properties
         if let Some(item) = &self.item {
-            dict.set_item("item", item).unwrap();
+            dict.set_item(intern!(py, "item"), cache.get(item)).unwrap();
         }
         if let Some(item_product) = &self.item_product {
-            dict.set_item("item_product", item_product.to_py_dict(py)).unwrap();
+            dict.set_item(intern!(py, "item_product"), item_product.to_py_dict_cached(cache))
+                .unwrap();
         }
 
         // Reviewer properties
         if let Some(reviewer) = &self.reviewer {
-            dict.set_item("reviewer", reviewer).unwrap();
+            dict.set_item(intern!(py, "reviewer"), cache.get(reviewer)).unwrap();
         }
         if let Some(reviewer_card) = &self.reviewer_card {
-            dict.set_item("reviewer_card", reviewer_card.to_py_dict(py)).unwrap();
+            dict.set_item(intern!(py, "reviewer_card"), reviewer_card.to_py_dict(py)).unwrap();
         }
 
         if let Some(url) = &self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), cache.get(url)).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
-            dict.set_item(key, values.clone()).unwrap();
+            dict.set_item(key, values).unwrap();
         }
 
         dict.into()
@@ -321,44 +355,70 @@ pub struct HRecipe {
 #[cfg(feature = "python")]
 impl HRecipe {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
-        let dict = PyDict::new_bound(py);
+        self.to_py_dict_cached(&mut PyStringCache::new(py))
+    }
+
+    /// Convert a list of recipes, sharing strings repeated across them
+    pub fn to_py_dicts(py: Python, items: &[Self]) -> Vec<PyObject> {
+        let mut cache = PyStringCache::new(py);
+        items.iter().map(|item| item.to_py_dict_cached(&mut cache).into()).collect()
+    }
+
+    /// Convert to a dict, taking string values from `cache`
+    pub fn to_py_dict_cached<'a>(&'a self, cache: &mut PyStringCache<'_, 'a>) -> Py<PyDict> {
+        let py = cache.py();
+        let present = [
+            self.name.is_some(),
+            self.summary.is_some(),
+            !self.ingredient.is_empty(),
+            self.instructions.is_some(),
+            self.duration.is_some(),
+            self.yield_.is_some(),
+            self.nutrition.is_some(),
+            self.photo.is_some(),
+            self.author.is_some(),
+            self.published.is_some(),
+            !self.category.is_empty(),
+        ];
+        let len = present.iter().filter(|&&present| present).count();
+        let dict = presized_dict(py, len + self.additional_properties.len());
 
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), cache.get(name)).unwrap();
         }
         if let Some(summary) = &self.summary {
-            dict.set_item("summary", summary).unwrap();
+            dict.set_item(intern!(py, "summary"), cache.get(summary)).unwrap();
         }
         if !self.ingredient.is_empty() {
-            dict.set_item("ingredient", self.ingredient.clone()).unwrap();
+            dict.set_item(intern!(py, "ingredient"), cache.list(&self.ingredient)).unwrap();
         }
         if let Some(instructions) = &self.instructions {
-            dict.set_item("instructions", instructions).unwrap();
+            dict.set_item(intern!(py, "instructions"), cache.get(instructions)).unwrap();
         }
         if let Some(duration) = &self.duration {
-            dict.set_item("duration", duration).unwrap();
+            dict.set_item(intern!(py, "duration"), cache.get(duration)).unwrap();
         }
         if let Some(yield_) = &self.yield_ {
-            dict.set_item("yield", yield_).unwrap();
+            dict.set_item(intern!(py, "yield"), cache.get(yield_)).unwrap();
         }
         if let Some(nutrition) = &self.nutrition {
-            dict.set_item("nutrition", nutrition).unwrap();
+            dict.set_item(intern!(py, "nutrition"), cache.get(nutrition)).unwrap();
         }
         if let Some(photo) = &self.photo {
-            dict.set_item("photo", photo).unwrap();
+            dict.set_item(intern!(py, "photo"), cache.get(photo)).unwrap();
         }
         if let Some(author) = &self.author {
-            dict.set_item("author", author).unwrap();
+            dict.set_item(intern!(py, "author"), cache.get(author)).unwrap();
         }
         if let Some(published) = &self.published {
-            dict.set_item("published", published).unwrap();
+            dict.set_item(intern!(py, "published"), cache.get(published)).unwrap();
         }
         if !self.category.is_empty() {
-            dict.set_item("category", self.category.clone()).unwrap();
+            dict.set_item(intern!(py, "category"), cache.list(&self.category)).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
-            dict.set_item(key, values.clone()).unwrap();
+            dict.set_item(key, values).unwrap();
         }
 
         dict.into()
@@ -383,38 +443,50 @@ pub struct HProduct {
 #[cfg(feature = "python")]
 impl HProduct {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
+        self.to_py_dict_cached(&mut PyStringCache::new(py))
+    }
+
+    /// Convert a list of products, sharing strings repeated across them
+    pub fn to_py_dicts(py: Python, items: &[Self]) -> Vec<PyObject> {
+        let mut cache = PyStringCache::new(py);
+        items.iter().map(|item| item.to_py_dict_cached(&mut cache).into()).collect()
+    }
+
+    /// Convert to a dict, taking string values from `cache`
+    pub fn to_py_dict_cached<'a>(&'a self, cache: &mut PyStringCache<'_, 'a>) -> Py<PyDict> {
+        let py = cache.py();
         let dict = PyDict::new_bound(py);
 
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), cache.get(name)).unwrap();
         }
         if let Some(description) = &self.description {
-            dict.set_item("description", description).unwrap();
+            dict.set_item(intern!(py, "description"), cache.get(description)).unwrap();
         }
         if let Some(photo) = &self.photo {
-            dict.set_item("photo", photo).unwrap();
+            dict.set_item(intern!(py, "photo"), cache.get(photo)).unwrap();
         }
         if let Some(price) = &self.price {
-            dict.set_item("price", price).unwrap();
+            dict.set_item(intern!(py, "price"), cache.get(price)).unwrap();
         }
         if let Some(brand) = &self.brand {
-            dict.set_item("brand", brand).unwrap();
+            dict.set_item(intern!(py, "brand"), cache.get(brand)).unwrap();
         }
         if !self.category.is_empty() {
-            dict.set_item("category", self.category.clone()).unwrap();
+            dict.set_item(intern!(py, "category"), cache.list(&self.category)).unwrap();
         }
         if let Some(rating) = self.rating {
-            dict.set_item("rating", rating).unwrap();
+            dict.set_item(intern!(py, "rating"), rating).unwrap();
         }
         if let Some(url) = &self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), cache.get(url)).unwrap();
         }
         if let Some(identifier) = &self.identifier {
-            dict.set_item("identifier", identifier).unwrap();
+            dict.set_item(intern!(py, "identifier"), cache.get(identifier)).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
-            dict.set_item(key, values.clone()).unwrap();
+            dict.set_item(key, values).unwrap();
         }
 
         dict.into()
@@ -437,20 +509,20 @@ impl HFeed {
         let dict = PyDict::new_bound(py);
 
         if let Some(name) = &self.name {
-            dict.set_item("name", name).unwrap();
+            dict.set_item(intern!(py, "name"), name).unwrap();
         }
         if let Some(author) = &self.author {
-            dict.set_item("author", author).unwrap();
+            dict.set_item(intern!(py, "author"), author).unwrap();
         }
         if let Some(url) = &self.url {
-            dict.set_item("url", url).unwrap();
+            dict.set_item(intern!(py, "url"), url).unwrap();
         }
         if let Some(photo) = &self.photo {
-            dict.set_item("photo", photo).unwrap();
+            dict.set_item(intern!(py, "photo"), photo).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
-            dict.set_item(key, values.clone()).unwrap();
+            dict.set_item(key, values).unwrap();
         }
 
         dict.into()
@@ -476,29 +548,29 @@ impl HAdr {
         let dict = PyDict::new_bound(py);
 
         if let Some(street_address) = &self.street_address {
-            dict.set_item("street_address", street_address).unwrap();
+            dict.set_item(intern!(py, "street_address"), street_address).unwrap();
         }
         if let Some(extended_address) = &self.extended_address {
-            dict.set_item("extended_address", extended_address).unwrap();
+            dict.set_item(intern!(py, "extended_address"), extended_address).unwrap();
         }
         if let Some(post_office_box) = &self.post_office_box {
-            dict.set_item("post_office_box", post_office_box).unwrap();
+            dict.set_item(intern!(py, "post_office_box"), post_office_box).unwrap();
         }
         if let Some(locality) = &self.locality {
-            dict.set_item("locality", locality).unwrap();
+            dict.set_item(intern!(py, "locality"), locality).unwrap();
         }
         if let Some(region) = &self.region {
-            dict.set_item("region", region).unwrap();
+            dict.set_item(intern!(py, "region"), region).unwrap();
         }
         if let Some(postal_code) = &self.postal_code {
-            dict.set_item("postal_code", postal_code).unwrap();
+            dict.set_item(intern!(py, "postal_code"), postal_code).unwrap();
         }
         if let Some(country_name) = &self.country_name {
-            dict.set_item("country_name", country_name).unwrap();
+            dict.set_item(intern!(py, "country_name"), country_name).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
-            dict.set_item(key, values.clone()).unwrap();
+            dict.set_item(key, values).unwrap();
         }
 
         dict.into()
@@ -520,19 +592,36 @@ impl HGeo {
         let dict = PyDict::new_bound(py);
 
         if let Some(latitude) = self.latitude {
-            dict.set_item("latitude", latitude).unwrap();
+            dict.set_item(intern!(py, "latitude"), latitude).unwrap();
         }
         if let Some(longitude) = self.longitude {
-            dict.set_item("longitude", longitude).unwrap();
+            dict.set_item(intern!(py, "longitude"), longitude).unwrap();
         }
         if let Some(altitude) = self.altitude {
-            dict.set_item("altitude", altitude).unwrap();
+            dict.set_item(intern!(py, "altitude"), altitude).unwrap();
         }
 
         for (key, values) in &self.additional_properties {
-            dict.set_item(key, values.clone()).unwrap();
+            dict.set_item(key, values).unwrap();
         }
 
         dict.into()
     }
 }
+
+/// `to_py_dicts` for formats whose values are rarely repeated across items
+macro_rules! impl_to_py_dicts {
+    ($($type_name:ty),*) => {
+        $(
+            #[cfg(feature = "python")]
+            impl $type_name {
+                /// Convert a list of items to Python dicts
+                pub fn to_py_dicts(py: Python, items: &[Self]) -> Vec<PyObject> {
+                    items.iter().map(|item| item.to_py_dict(py).into()).collect()
+                }
+            }
+        )*
+    };
+}
+
+impl_to_py_dicts!(HCard, HEntry, HEvent, HFeed, HAdr, HGeo);
@@ -12,3 +12,76 @@ pub mod social;
 
 // Re-export microformat types for backward compatibility
 pub use microformats::*;
+
+#[cfg(feature = "python")]
+use pyo3::prelude::*;
+#[cfg(feature = "python")]
+use pyo3::types::{PyDict, PyList, PyString};
+#[cfg(feature = "python")]
+use std::collections::HashMap;
+
+/// Empty dict with room for `len` items, so inserting them never resizes it
+///
+/// `PyDict_New` starts with space for five items and grows by rehashing, so
+/// items with many properties (recipes, reviews, full meta/Open Graph sets)
+/// are built in one allocation.
+///
+/// `_PyDict_NewPresized` is a private CPython symbol: it is not part of the
+/// limited API and PyPy does not provide it. This ties the extension to
+/// version-specific CPython wheels, which is what the crate builds (pyo3
+/// without the `abi3` feature). An abi3 or PyPy build must replace the body
+/// with `PyDict::new_bound(py)`; every dict built through this helper,
+/// including the h-recipe and h-review ones, then falls back with it.
+#[cfg(feature = "python")]
+pub(crate) fn presized_dict(py: Python<'_>, len: usize) -> Bound<'_, PyDict> {
+    let len = pyo3::ffi::Py_ssize_t::try_from(len).unwrap_or(0);
+    // SAFETY: `_PyDict_NewPresized` returns a new reference to a dict, or null
+    // with an exception set
+    unsafe {
+        match Bound::from_owned_ptr_or_err(py, pyo3::ffi::_PyDict_NewPresized(len)) {
+            Ok(dict) => dict.downcast_into_unchecked(),
+            Err(_) => PyDict::new_bound(py),
+        }
+    }
+}
+
+/// Per-call cache of Python strings for short repeated values
+///
+/// Pages often repeat the same ingredient, category or brand across items,
+/// and JSON-LD objects repeat the same property names. Converting a list of
+/// items through one cache creates a single `str` object per distinct value
+/// instead of one per occurrence.
+#[cfg(feature = "python")]
+pub struct PyStringCache<'py, 'a> {
+    py: Python<'py>,
+    strings: HashMap<&'a str, Bound<'py, PyString>>,
+}
+
+#[cfg(feature = "python")]
+impl<'py, 'a> PyStringCache<'py, 'a> {
+    /// Longer values (descriptions, instructions) are rarely repeated
+    const MAX_CACHED_LEN: usize = 64;
+
+    pub fn new(py: Python<'py>) -> Self {
+        PyStringCache { py, strings: HashMap::new() }
+    }
+
+    pub fn py(&self) -> Python<'py> {
+        self.py
+    }
+
+    /// Python string for `value`, shared with earlier identical values
+    pub fn get(&mut self, value: &'a str) -> Bound<'py, PyString> {
+        if value.len() >= Self::MAX_CACHED_LEN {
+            return PyString::new_bound(self.py, value);
+        }
+        let py = self.py;
+        self.strings.entry(value).or_insert_with(|| PyString::new_bound(py, value)).clone()
+    }
+
+    /// Python list of `values`, sharing repeated strings
+    pub fn list(&mut self, values: &'a [String]) -> Bound<'py, PyList> {
+        let py = self.py;
+        PyList::new_bound(py, values.iter().map(|value| self.get(value)))
+    }
+}
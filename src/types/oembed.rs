@@ -4,6 +4,8 @@
 //! on third party sites. Many platforms (YouTube, Vimeo, Twitter, etc.)
 //! support oEmbed for easy content embedding.
 
+#[cfg(feature = "python")]
+use pyo3::intern;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
@@ -65,9 +67,9 @@ impl OEmbedEndpoint {
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
         let dict = PyDict::new_bound(py);
 
-        dict.set_item("href", &self.href).unwrap();
+        dict.set_item(intern!(py, "href"), &self.href).unwrap();
         dict.set_item(
-            "format",
+            intern!(py, "format"),
             match self.format {
                 OEmbedFormat::Json => "json",
                 OEmbedFormat::Xml => "xml",
@@ -76,7 +78,7 @@ impl OEmbedEndpoint {
         .unwrap();
 
         if let Some(ref title) = self.title {
-            dict.set_item("title", title).unwrap();
+            dict.set_item(intern!(py, "title"), title).unwrap();
         }
 
         dict.unbind()
@@ -90,12 +92,12 @@ impl OEmbedDiscovery {
 
         if !self.json_endpoints.is_empty() {
             let json_eps: Vec<_> = self.json_endpoints.iter().map(|ep| ep.to_py_dict(py)).collect();
-            dict.set_item("json_endpoints", json_eps).unwrap();
+            dict.set_item(intern!(py, "json_endpoints"), json_eps).unwrap();
         }
 
         if !self.xml_endpoints.is_empty() {
             let xml_eps: Vec<_> = self.xml_endpoints.iter().map(|ep| ep.to_py_dict(py)).collect();
-            dict.set_item("xml_endpoints", xml_eps).unwrap();
+            dict.set_item(intern!(py, "xml_endpoints"), xml_eps).unwrap();
         }
 
         dict.unbind()
@@ -3,6 +3,10 @@
 //! RDFa is a W3C standard for embedding structured data in HTML using attributes.
 //! It provides semantic markup for web content with 62% desktop adoption.
 
+#[cfg(feature = "python")]
+use super::presized_dict;
+#[cfg(feature = "python")]
+use pyo3::intern;
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
@@ -88,21 +92,23 @@ impl RdfaItem {
 impl RdfaItem {
     /// Convert to Python dictionary
     pub fn to_py_dict(&self, py: Python) -> Py<PyDict> {
-        let dict = PyDict::new_bound(py);
+        let present = [self.type_of.is_some(), self.vocab.is_some(), self.about.is_some()];
+        let dict =
+            presized_dict(py, present.iter().filter(|&&p| p).count() + self.properties.len());
 
         // Add type(s) - always as a list for consistency
         if let Some(ref types) = self.type_of {
-            dict.set_item("type", types.clone()).unwrap();
+            dict.set_item(intern!(py, "type"), types).unwrap();
         }
 
         // Add vocab
         if let Some(ref vocab) = self.vocab {
-            dict.set_item("vocab", vocab).unwrap();
+            dict.set_item(intern!(py, "vocab"), vocab).unwrap();
         }
 
         // Add about
         if let Some(ref about) = self.about {
-            dict.set_item("about", about).unwrap();
+            dict.set_item(intern!(py, "about"), about).unwrap();
         }
 
         // Add properties
@@ -112,10 +118,7 @@ impl RdfaItem {
                 dict.set_item(key, values[0].to_py_value(py)).unwrap();
             } else {
                 // Multiple values - add as list
-                let list = PyList::empty_bound(py);
-                for value in values {
-                    list.append(value.to_py_value(py)).unwrap();
-                }
+                let list = PyList::new_bound(py, values.iter().map(|value| value.to_py_value(py)));
                 dict.set_item(key, list).unwrap();
             }
         }
@@ -134,8 +137,8 @@ impl RdfaValue {
             RdfaValue::Item(item) => item.to_py_dict(py).to_object(py),
             RdfaValue::TypedLiteral { value, datatype } => {
                 let dict = PyDict::new_bound(py);
-                dict.set_item("value", value).unwrap();
-                dict.set_item("datatype", datatype).unwrap();
+                dict.set_item(intern!(py, "value"), value).unwrap();
+                dict.set_item(intern!(py, "datatype"), datatype).unwrap();
                 dict.to_object(py)
             }
         }